@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Arena AST benchmark.
+Builds the ASTs of --programs generated programs and measures, with
+tracemalloc, the memory they take as node objects and as one ASTArena,
+in bytes per node, plus the time to convert them to the arena and back
+and to walk them with a BaseVisitor as objects and as NodeViews.
+
+Usage:
+    python benchmarks/bench_arena.py [--programs N] [--functions F] [--repeat R]
+"""
+
+import argparse
+import tracemalloc
+
+from common import best_of, generate_program
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.utils.arena import ASTArena
+from src.utils.visitor import BaseVisitor
+
+
+def traced(fn):
+    """(bytes allocated by fn and still alive, its result)."""
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--programs", type=int, default=200)
+    parser.add_argument("--functions", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sources = [generate_program(args.functions, seed) for seed in range(args.programs)]
+    programs = [antlr_ast(CompactInputStream(s), "fast") for s in sources]
+    kb = sum(map(len, sources)) / 1024
+    print(f"{args.programs} generated programs, {kb:.1f} KB")
+
+    arena_size, arena = traced(lambda: ASTArena.from_programs(programs))
+    # The rebuilt objects take what the parsed ones do, without the parse
+    objects_size, rebuilt = traced(arena.programs)
+    assert [str(p) for p in rebuilt] == [str(p) for p in programs]
+    nodes = len(arena)
+    for name, size in (("objects", objects_size), ("arena", arena_size)):
+        print(f"  {name:<8} {nodes} nodes  {size / 2**20:7.2f} MB  {size / nodes:6.1f} bytes/node")
+    print(f"  Saving: {1 - arena_size / objects_size:.0%}")
+
+    timings = {
+        "to arena": lambda: ASTArena.from_programs(programs),
+        "from arena": arena.programs,
+        "walk objects": lambda: [BaseVisitor().visit(p) for p in programs],
+        "walk views": lambda: [BaseVisitor().visit(arena.view(r)) for r in arena.roots],
+    }
+    for name, fn in timings.items():
+        seconds, _ = best_of(fn, args.repeat)
+        print(f"  {name:<12} {seconds * 1000:8.1f} ms  {seconds * 1e6 / nodes:6.2f} us/node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+AST build benchmark.
+Parses the tests/test_parser.py inputs and large generated programs once,
+then times ASTGeneration over the parse trees alone and reports build time
+per KB of source, against a visitor that dispatches once per level of the
+single-child expr/operandExpr/postfixExpr/primaryExpr chains, as
+ASTGeneration did before it stepped through them in a loop.
+
+Usage:
+    python benchmarks/bench_ast_build.py [--functions N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program, load_parser_test_sources
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import FloatLiteral, Identifier, IntLiteral, StringLiteral
+
+
+class PerLevelASTGeneration(ASTGeneration):
+    """ASTGeneration with a visitor dispatch per expression level."""
+
+    def _expr(self, ctx):
+        return ctx.accept(self)
+
+    def visitExpr(self, ctx):
+        if ctx.lhs():
+            return super()._expr(ctx)
+        return self.visit(ctx.opExpr())
+
+    def visitOperandExpr(self, ctx):
+        return self.visit(ctx.postfixExpr())
+
+    def visitPostfixExpr(self, ctx):
+        return self._postfix(ctx.primaryExpr(), ctx.postfixPart())
+
+    def visitPrimaryExpr(self, ctx):
+        if ctx.expr():
+            return self.visit(ctx.expr())
+        token = ctx.getChild(0).getSymbol()
+        if token.type == TyCParser.ID:
+            return Identifier(token.text)
+        if token.type == TyCParser.INTLIT:
+            return IntLiteral(int(token.text))
+        if token.type == TyCParser.FLOATLIT:
+            return FloatLiteral(float(token.text))
+        return StringLiteral(token.text)
+
+
+def parse_trees(sources):
+    """The parse trees of the sources that parse, and their size in KB."""
+    trees, size = [], 0
+    for source in sources:
+        parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            trees.append(parse_two_stage(parser))
+            size += len(source)
+        except Exception:
+            pass
+    return trees, size / 1024
+
+
+def build_all(trees, builder):
+    return [builder.visit(tree) for tree in trees]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpora = {
+        "parser tests": load_parser_test_sources(),
+        "generated": [generate_program(args.functions, seed) for seed in range(3)],
+    }
+    for name, sources in corpora.items():
+        trees, kb = parse_trees(sources)
+        print(f"{name}: {len(trees)} parse trees, {kb:.1f} KB")
+        expected = list(map(str, build_all(trees, PerLevelASTGeneration())))
+        timings = {}
+        for builder in (PerLevelASTGeneration(), ASTGeneration()):
+            label = type(builder).__name__
+            seconds, results = best_of(lambda: build_all(trees, builder), args.repeat)
+            assert list(map(str, results)) == expected
+            timings[label] = seconds
+            print(f"  {label:<22} {seconds * 1000:8.1f} ms  {seconds * 1000 / kb:6.2f} ms/KB")
+        speedup = timings["PerLevelASTGeneration"] / timings["ASTGeneration"]
+        print(f"  Speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bulk scanning benchmark.
+Tokenizes a generated TyC program padded with long license-style block
+comments and long string literals with TyCLexer and BulkScanLexer and
+reports time per input stream type and speedup.
+
+Usage:
+    python benchmarks/bench_bulk_scan.py [--functions N] [--comment-lines L] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from src.lexer.bulk_scan import BulkScanLexer
+from src.lexer.char_streams import CompactInputStream
+
+LICENSE_LINE = " * Permission is hereby granted, free of charge, to any person obtaining\n"
+
+
+def padded_program(functions: int, comment_lines: int) -> str:
+    header = "/*\n" + LICENSE_LINE * comment_lines + " */\n"
+    data = 'string blob = "' + "0123456789abcdef\\n" * (comment_lines * 4) + '";\n'
+    body = generate_program(functions).replace("\n}\n", "\n}\n" + header + data)
+    return header + body
+
+
+def count_tokens(lexer_class, stream) -> int:
+    lexer = lexer_class(stream)
+    n = 0
+    while lexer.nextToken().type != Token.EOF:
+        n += 1
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=100)
+    parser.add_argument("--comment-lines", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source = padded_program(args.functions, args.comment_lines)
+    kb = len(source) / 1024
+    print(f"Source: {kb:.1f} KB, {args.functions} functions, "
+          f"{args.comment_lines}-line comments")
+
+    for stream_class in (InputStream, CompactInputStream):
+        timings = {}
+        for lexer_class in (TyCLexer, BulkScanLexer):
+            seconds, tokens = best_of(
+                lambda: count_tokens(lexer_class, stream_class(source)), args.repeat
+            )
+            timings[lexer_class] = seconds
+            print(
+                f"  {stream_class.__name__:<18} {lexer_class.__name__:<13} "
+                f"{seconds * 1000:9.1f} ms  {tokens} tokens  {kb / seconds:9.1f} KB/s"
+            )
+        print(f"  Speedup: {timings[TyCLexer] / timings[BulkScanLexer]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
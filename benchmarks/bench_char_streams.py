@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Character stream memory benchmark.
+Compares the memory held by antlr4.InputStream, CompactInputStream and
+MappedFileStream for a generated TyC program, and the TyCLexer time on each.
+
+Usage:
+    python benchmarks/bench_char_streams.py [--functions N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from common import generate_program
+
+from antlr4 import InputStream, Token
+from build.TyCLexer import TyCLexer
+from src.lexer.char_streams import CompactInputStream, MappedFileStream
+
+
+def measure(make_stream):
+    """Return (stream, bytes allocated while building it)."""
+    tracemalloc.start()
+    stream = make_stream()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return stream, size
+
+
+def lex_seconds(stream) -> float:
+    lexer = TyCLexer(stream)
+    start = time.perf_counter()
+    while lexer.nextToken().type != Token.EOF:
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=2000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    mb = len(source) / (1 << 20)
+    print(f"Source: {mb:.2f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.tyc")
+        with open(path, "w", encoding="ascii") as f:
+            f.write(source)
+
+        streams = [
+            ("InputStream", lambda: InputStream(source)),
+            ("CompactInputStream", lambda: CompactInputStream(source)),
+            ("MappedFileStream", lambda: MappedFileStream(path)),
+        ]
+        for name, make_stream in streams:
+            stream, size = measure(make_stream)
+            seconds = lex_seconds(stream)
+            print(
+                f"  {name:<20} {size / (1 << 20):9.2f} MB  "
+                f"({size / len(source):5.2f} bytes/char)  lex {seconds:6.2f} s"
+            )
+            if isinstance(stream, MappedFileStream):
+                stream.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Declaration-at-a-time AST benchmark.
+Writes a generated source of the given size to a temporary file and walks
+the AST of every top-level declaration, built either from the parse tree of
+the whole program (as ASTGenerator does) or by parse_declarations(), which
+parses and converts one declaration at a time. Reports total time, time to
+the first declaration and (in a separate traced run) peak memory of each.
+
+Usage:
+    python benchmarks/bench_decl_streaming.py [--size-mb N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from common import generate_program
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.streaming import parse_declarations
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+def whole_program(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        lexer = create_lexer(CompactInputStream(f.read()), "fast")
+    parser = TyCParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    yield from ASTGeneration().visit(parse_two_stage(parser)).decls
+
+
+def per_declaration(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        yield from parse_declarations(f)
+
+
+def consume(decls):
+    """Walk the declarations as a pipelined pass would; return (count, first-decl time)."""
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in decls:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    return count, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    chunk = generate_program(200)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.tyc")
+        with open(path, "w", encoding="utf-8") as f:
+            body = chunk[: chunk.index("void main()")]
+            for i in range(max(1, round(args.size_mb * (1 << 20) / len(body)))):
+                f.write(body.replace("func", f"f{i}_"))
+            f.write("void main() { }\n")
+        print(f"Source: {os.path.getsize(path) / (1 << 20):.1f} MB")
+
+        for name, decls in (("program", whole_program), ("per decl", per_declaration)):
+            start = time.perf_counter()
+            count, first = consume(decls(path))
+            seconds = time.perf_counter() - start
+            tracemalloc.start()
+            consume(decls(path))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {name:<9} {seconds:6.2f} s  first decl {first * 1000:8.1f} ms"
+                f"  peak {peak / (1 << 20):8.1f} MB  ({count} decls)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+DFA cache warm-start benchmark.
+Trains the DFA cache on the tests/test_parser.py inputs, then measures in
+fresh processes the latency of the first parse and of one pass over all the
+inputs, with and without the cache preloaded.
+
+Usage:
+    python benchmarks/bench_dfa_cache.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import load_parser_test_sources
+
+from src.parser import dfa_cache
+
+
+def child(cache_path):
+    """Run inside a fresh interpreter and print timings as JSON."""
+    sources = load_parser_test_sources()
+    start = time.perf_counter()
+    loaded = dfa_cache.load_dfa_cache(cache_path) if cache_path else False
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dfa_cache.warm_up(sources[:1])
+    first_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dfa_cache.warm_up(sources)
+    corpus_seconds = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "loaded": loaded,
+                "load": load_seconds,
+                "first": first_seconds,
+                "corpus": corpus_seconds,
+            }
+        )
+    )
+
+
+def run_child(cache_path):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", cache_path or ""]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        child(args.child)
+        return
+
+    sources = load_parser_test_sources()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "TyC.dfa")
+        dfa_cache.warm_up(sources)
+        dfa_cache.save_dfa_cache(cache_path)
+        print(
+            f"Cache: {len(sources)} training inputs, "
+            f"{os.path.getsize(cache_path) / 1024:.0f} KB"
+        )
+
+        for label, path in (("cold", None), ("preloaded", cache_path)):
+            runs = [run_child(path) for _ in range(args.runs)]
+            load = statistics.median(r["load"] for r in runs) * 1000
+            first = statistics.median(r["first"] for r in runs) * 1000
+            corpus = statistics.median(r["corpus"] for r in runs) * 1000
+            print(
+                f"  {label:<10} load {load:7.1f} ms  first parse {first:7.1f} ms  "
+                f"all {len(sources)} inputs {corpus:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Parser backend benchmark.
+Builds the AST of the tests/test_parser.py inputs and of large generated
+programs with the antlr backend (TyCParser + ASTGeneration) and the direct
+backend (DirectParser), both on the fast lexer, and reports throughput and
+speedup.
+
+Usage:
+    python benchmarks/bench_direct_parser.py [--functions N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program, load_parser_test_sources
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import PARSER_BACKENDS, parse_ast
+
+
+def build_all(sources, backend: str):
+    for source in sources:
+        try:
+            parse_ast(CompactInputStream(source), backend, "fast")
+        except Exception:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpora = {
+        "parser tests": load_parser_test_sources(),
+        "generated": [generate_program(args.functions, seed) for seed in range(3)],
+    }
+    for name, sources in corpora.items():
+        kb = sum(map(len, sources)) / 1024
+        print(f"{name}: {len(sources)} inputs, {kb:.1f} KB")
+        timings = {}
+        for backend in PARSER_BACKENDS:
+            # Warm the ANTLR prediction DFA before timing
+            build_all(sources, backend)
+            seconds, _ = best_of(lambda: build_all(sources, backend), args.repeat)
+            timings[backend] = seconds
+            print(f"  {backend:<7} {seconds * 1000:9.1f} ms  {kb / seconds:9.1f} KB/s")
+        print(f"  Speedup (antlr / direct): {timings['antlr'] / timings['direct']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Canonical type and hash-consing benchmark.
+Builds the ASTs of large generated programs with ASTGeneration, without and
+with a LeafTable, and reports how many type and leaf nodes they contain
+against how many distinct objects back them, the memory the ASTs take
+(tracemalloc, parse trees excluded) and the build time of each mode.
+
+Usage:
+    python benchmarks/bench_hash_consing.py [--functions N] [--repeat R]
+"""
+
+import argparse
+import tracemalloc
+
+from common import best_of, generate_program
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.nodes import ASTNode, Identifier, LeafTable, Literal, Type
+
+
+def occurrences(ast):
+    """Yield every node of ast, once per place it occurs."""
+    stack = [ast]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            yield value
+            stack.extend(
+                getattr(value, name)
+                for klass in type(value).__mro__
+                for name in klass.__dict__.get("__slots__", ())
+            )
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+    tree = parse_two_stage(parser)
+    print(f"Generated program: {args.functions} functions, {len(source) / 1024:.1f} KB")
+
+    sizes = {}
+    for name, make_leaves in (("plain", lambda: None), ("hash-consed", LeafTable)):
+        tracemalloc.start()
+        ast = ASTGeneration(make_leaves()).visit(tree)
+        sizes[name] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        nodes = list(occurrences(ast))
+        print(f"{name}: {len(nodes)} nodes, {sizes[name] / 2**20:.1f} MB")
+        for label, cls in (("types", Type), ("leaves", (Identifier, Literal))):
+            group = [n for n in nodes if isinstance(n, cls)]
+            print(f"  {label:<7} {len(group):7d} occurrences  {len({id(n) for n in group}):7d} objects")
+        seconds, _ = best_of(lambda: ASTGeneration(make_leaves()).visit(tree), args.repeat)
+        print(f"  build   {seconds * 1000:8.1f} ms")
+    print(f"Saving: {1 - sizes['hash-consed'] / sizes['plain']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
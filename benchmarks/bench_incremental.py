@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Incremental relexing benchmark.
+Applies random single-character edits (insertions, deletions and
+replacements, including quotes, newlines and comment delimiters) to a
+generated source of about 1 MB and compares IncrementalLexer.edit() with
+lexing the whole edited file again.
+
+Usage:
+    python benchmarks/bench_incremental.py [--size-mb N] [--edits N]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from common import generate_program
+
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.token_buffer import TokenBuffer
+
+# Inserted characters; quotes and comment delimiters can change many tokens
+EDIT_CHARS = "abz19 .;+\n\"/*"
+
+
+def make_source(size_mb: float) -> str:
+    chunk = generate_program(200)
+    return chunk * max(1, round(size_mb * (1 << 20) / len(chunk)))
+
+
+def random_edit(rng, text):
+    start = rng.randrange(len(text))
+    kind = rng.choice(("insert", "delete", "replace"))
+    if kind == "insert":
+        return start, start, rng.choice(EDIT_CHARS)
+    if kind == "delete":
+        return start, start + 1, ""
+    return start, start + 1, rng.choice(EDIT_CHARS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--backend", default="fast")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    source = make_source(args.size_mb)
+    rng = random.Random(args.seed)
+    lexer = IncrementalLexer(source, args.backend, recover=True)
+    print(f"Source: {len(source) / (1 << 20):.2f} MB, {len(lexer.buffer)} tokens")
+
+    start = time.perf_counter()
+    TokenBuffer.from_lexer(
+        create_lexer(CompactInputStream(lexer.text), args.backend, recover=True)
+    )
+    full_seconds = time.perf_counter() - start
+
+    times = []
+    relexed = []
+    for _ in range(args.edits):
+        edit = random_edit(rng, lexer.text)
+        start = time.perf_counter()
+        changed = lexer.edit(*edit)
+        times.append(time.perf_counter() - start)
+        relexed.append(len(changed))
+
+    times.sort()
+    print(f"  full relex        {full_seconds * 1000:9.1f} ms")
+    print(
+        f"  incremental edit  {statistics.median(times) * 1000:9.1f} ms median, "
+        f"{times[int(len(times) * 0.95)] * 1000:.1f} ms p95, {times[-1] * 1000:.1f} ms max"
+    )
+    print(
+        f"  tokens re-lexed   {statistics.median(relexed):9.0f} median, "
+        f"{max(relexed)} max  (speedup {full_seconds / statistics.median(times):.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
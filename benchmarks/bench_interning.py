@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Symbol interning benchmark.
+Lexes a generated TyC program with and without a SymbolTable and compares
+the cost of turning every ID, INTLIT and FLOATLIT token into its value: one
+text slice and conversion per occurrence versus one table lookup.
+
+Usage:
+    python benchmarks/bench_interning.py [--functions N] [--backend NAME] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program
+
+from antlr4 import InputStream, Token
+from src.lexer.fast_lexer import LEXER_BACKENDS, create_lexer
+from src.lexer.interning import CONVERTERS, SymbolTable
+
+
+def lex(source: str, backend: str, symbols=None) -> list:
+    lexer = create_lexer(InputStream(source), backend, symbols=symbols)
+    tokens = []
+    while (t := lexer.nextToken()).type != Token.EOF:
+        tokens.append(t)
+    return tokens
+
+
+def convert_each(tokens) -> list:
+    return [CONVERTERS[t.type](t.text) for t in tokens if t.type in CONVERTERS]
+
+
+def convert_interned(tokens, symbols: SymbolTable) -> list:
+    values = symbols.values
+    return [values[t.symbol] for t in tokens if t.symbol >= 0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--backend", default="fast", choices=sorted(LEXER_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    plain = lex(source, args.backend)
+    symbols = SymbolTable()
+    interned = lex(source, args.backend, symbols)
+    occurrences = sum(t.type in CONVERTERS for t in plain)
+    print(f"Source: {len(source) / 1024:.1f} KB, {len(plain)} tokens, "
+          f"{occurrences} symbol occurrences, {len(symbols)} distinct")
+
+    lex_plain, _ = best_of(lambda: lex(source, args.backend), args.repeat)
+    lex_interned, _ = best_of(lambda: lex(source, args.backend, SymbolTable()), args.repeat)
+    values_plain, _ = best_of(lambda: convert_each(plain), args.repeat)
+    values_interned, _ = best_of(lambda: convert_interned(interned, symbols), args.repeat)
+    assert convert_each(plain) == convert_interned(interned, symbols)
+    print(f"  lex        plain {lex_plain * 1000:8.1f} ms   interned {lex_interned * 1000:8.1f} ms")
+    print(f"  values     plain {values_plain * 1000:8.1f} ms   interned {values_interned * 1000:8.1f} ms")
+    print(f"  per extra pass over the values: {(values_plain - values_interned) * 1000:.1f} ms saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Lexer backend benchmark.
+Tokenizes a generated TyC program with the ANTLR TyCLexer and the
+hand-written FastLexer and reports throughput and speedup.
+
+Usage:
+    python benchmarks/bench_lexer.py [--functions N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program
+
+from antlr4 import InputStream, Token
+from src.lexer.fast_lexer import LEXER_BACKENDS
+
+
+def count_tokens(source: str, backend: str) -> int:
+    lexer = LEXER_BACKENDS[backend](InputStream(source))
+    n = 0
+    while lexer.nextToken().type != Token.EOF:
+        n += 1
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    kb = len(source) / 1024
+    print(f"Source: {kb:.1f} KB, {args.functions} functions")
+
+    timings = {}
+    for backend in LEXER_BACKENDS:
+        seconds, tokens = best_of(lambda: count_tokens(source, backend), args.repeat)
+        timings[backend] = seconds
+        print(
+            f"  {backend:<6} {seconds * 1000:9.1f} ms  {tokens} tokens  "
+            f"{tokens / seconds:12,.0f} tokens/s  {kb / seconds:9.1f} KB/s"
+        )
+    print(f"Speedup (antlr / fast): {timings['antlr'] / timings['fast']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Member chain regression benchmark.
+Parses statements built from deeply chained member accesses and calls
+(assignments, call statements, for headers) with TyCParser and reports parse
+time and the number of full-context (LL) predictions, which should stay at
+zero however long the chains get.
+
+Usage:
+    python benchmarks/bench_member_chains.py [--depths 5,20,80] [--statements N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of
+
+from antlr4 import CommonTokenStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.utils.error_listener import NewErrorListener
+
+
+def chain_program(depth: int, statements: int) -> str:
+    chain = ".".join(f"m{i}" for i in range(depth))
+    calls = ".".join(f"f{i}(x)" for i in range(depth))
+    body = [
+        f"    a.{chain} = b.{chain};\n"
+        f"    g(x).{chain}.h(y);\n"
+        f"    o.{calls}.v = 1;\n"
+        f"    o.{calls};\n"
+        f"    for (a.{chain} = 1; a.{chain} < 2; a.{chain} = a.{chain} + 1) {{}}\n"
+        for _ in range(statements)
+    ]
+    return "void main() {\n" + "".join(body) + "}\n"
+
+
+def parse(source: str):
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser.program()
+
+
+def count_full_context(source: str) -> int:
+    """Number of predictions that fell back to full-context LL while parsing source."""
+    calls = []
+    original = ParserATNSimulator.execATNWithFullContext
+
+    def counting(self, *args):
+        calls.append(1)
+        return original(self, *args)
+
+    ParserATNSimulator.execATNWithFullContext = counting
+    try:
+        parse(source)
+    finally:
+        ParserATNSimulator.execATNWithFullContext = original
+    return len(calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depths", default="5,20,80")
+    parser.add_argument("--statements", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for depth in map(int, args.depths.split(",")):
+        source = chain_program(depth, args.statements)
+        full_context = count_full_context(source)
+        seconds, _ = best_of(lambda: parse(source), args.repeat)
+        print(
+            f"  depth {depth:4}  {len(source) / 1024:7.1f} KB  {seconds * 1000:9.1f} ms  "
+            f"{full_context:5} full-context predictions"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+AST node memory benchmark.
+Builds the AST of a large generated program and copies it twice under
+tracemalloc: into the __slots__ node classes of src/utils/nodes.py, and
+into subclasses of them without __slots__, whose instances carry a
+__dict__ like the node classes used to. Reports the bytes per node of each
+copy, counting the nodes and their child lists but not the strings and
+numbers both copies share.
+
+Usage:
+    python benchmarks/bench_node_memory.py [--functions N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from collections import Counter
+
+from common import generate_program
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.utils.nodes import ASTNode
+
+_dict_classes = {}
+
+
+def dict_class(cls):
+    """A subclass of cls whose instances have a __dict__."""
+    if cls not in _dict_classes:
+        _dict_classes[cls] = type(cls.__name__, (cls,), {})
+    return _dict_classes[cls]
+
+
+def slot_names(cls):
+    return [name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())]
+
+
+def copy_tree(value, make, counts: Counter):
+    if isinstance(value, ASTNode):
+        node = object.__new__(make(type(value)))
+        counts[type(value).__name__] += 1
+        for name in slot_names(type(value)):
+            setattr(node, name, copy_tree(getattr(value, name), make, counts))
+        return node
+    if isinstance(value, list):
+        return [copy_tree(v, make, counts) for v in value]
+    return value
+
+
+def measure(ast, make):
+    counts = Counter()
+    tracemalloc.start()
+    copy = copy_tree(ast, make, counts)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, counts, copy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=2000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    ast = antlr_ast(CompactInputStream(source), "fast")
+    print(f"Generated program: {args.functions} functions, {len(source) / 1024:.1f} KB")
+
+    sizes = {}
+    for name, make in (("__dict__", dict_class), ("__slots__", lambda cls: cls)):
+        size, counts, copy = measure(ast, make)
+        assert str(copy) == str(ast)
+        nodes = sum(counts.values())
+        sizes[name] = size
+        print(f"  {name:<10} {nodes} nodes  {size / 2**20:7.1f} MB  {size / nodes:6.1f} bytes/node")
+    print(f"  Saving: {1 - sizes['__slots__'] / sizes['__dict__']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
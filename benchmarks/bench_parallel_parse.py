@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Parallel parsing benchmark.
+Builds the AST of one large generated program sequentially (TyCParser +
+ASTGeneration) and with parse_parallel() for a range of worker counts,
+reporting throughput and speedup over the sequential parse. The worker
+pools are started before timing, so process start-up is not included.
+
+Usage:
+    python benchmarks/bench_parallel_parse.py [--functions N] [--workers 1,2,4]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common import generate_program
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.parser.parallel import _init_worker, parse_parallel
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=2000)
+    parser.add_argument("--workers", default=",".join(
+        str(n) for n in sorted({1, 2, 4, cpus}) if n <= max(cpus, 2)))
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    kb = len(source) / 1024
+    print(f"Source: {args.functions} functions, {kb:.0f} KB; {cpus} CPUs")
+
+    start = time.perf_counter()
+    expected = str(antlr_ast(CompactInputStream(source), "fast"))
+    sequential = time.perf_counter() - start
+    print(f"  sequential   {sequential:7.2f} s  {kb / sequential:8.1f} KB/s")
+
+    for workers in (int(n) for n in args.workers.split(",")):
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            # Start the processes before timing
+            list(pool.map(abs, range(workers)))
+            start = time.perf_counter()
+            program = parse_parallel(source, executor=pool)
+            seconds = time.perf_counter() - start
+        assert str(program) == expected
+        print(
+            f"  {workers:2d} workers   {seconds:7.2f} s  {kb / seconds:8.1f} KB/s"
+            f"  {sequential / seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Parse tree size benchmark.
+Parses the tests/test_parser.py inputs and large generated programs with
+TyCParser and reports the number of rule contexts, the deepest context
+nesting and the parse time, the figures the expression grammar layout
+drives.
+
+Usage:
+    python benchmarks/bench_parse_tree.py [--functions N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program, load_parser_test_sources
+
+from antlr4 import CommonTokenStream
+from antlr4.tree.Tree import TerminalNode
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.utils.error_listener import NewErrorListener
+
+
+def parse(source: str):
+    """Return the parse tree of source, or None on a syntax error."""
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        return parser.program()
+    except Exception:
+        return None
+
+
+def tree_size(tree):
+    """Return (rule contexts, maximum context depth) of a parse tree."""
+    contexts = 0
+    max_depth = 0
+    stack = [(tree, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, TerminalNode):
+            continue
+        contexts += 1
+        max_depth = max(max_depth, depth)
+        stack.extend((child, depth + 1) for child in node.children or ())
+    return contexts, max_depth
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpora = {
+        "parser tests": load_parser_test_sources(),
+        "generated": [generate_program(args.functions, seed) for seed in range(3)],
+    }
+    for name, sources in corpora.items():
+        sizes = [tree_size(tree) for tree in map(parse, sources) if tree is not None]
+        seconds, _ = best_of(lambda: [parse(s) for s in sources], args.repeat)
+        kb = sum(map(len, sources)) / 1024
+        print(
+            f"{name:<13} {sum(n for n, _ in sizes):9,} contexts  "
+            f"max depth {max(d for _, d in sizes):3}  "
+            f"{seconds * 1000:9.1f} ms  {kb / seconds:7.1f} KB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Parser pool benchmark.
+Parses the tests/test_parser.py inputs (and builds their ASTs) the way the
+tests/utils.py wrappers do, with a new lexer, token stream and parser per
+source, and with parse_many() on one reused ParserPool and on worker
+processes, reporting throughput in sources per second, plus the set-up cost
+per source of a new lexer/stream/parser against resetting a pooled one.
+
+Usage:
+    python benchmarks/bench_parser_pool.py [--repeat R] [--workers N] [--backend NAME]
+"""
+
+import argparse
+import timeit
+
+from common import best_of, load_parser_test_sources
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import LEXER_BACKENDS, create_lexer
+from src.parser.pool import ParserPool, parse_many
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+def parse_fresh(sources, ast: bool, backend: str):
+    results = []
+    for source in sources:
+        parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), backend)))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            tree = parse_two_stage(parser)
+            results.append(ASTGeneration().visit(tree) if ast else None)
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def new_parser(backend: str):
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(""), backend)))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+
+
+def reset_pool(pool: ParserPool):
+    pool.lexer.inputStream = CompactInputStream("")
+    pool.stream.setTokenSource(pool.lexer)
+    pool.parser.setTokenStream(pool.stream)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--backend", default="antlr", choices=sorted(LEXER_BACKENDS))
+    args = parser.parse_args()
+
+    sources = load_parser_test_sources()
+    print(f"Parser tests: {len(sources)} inputs, {sum(map(len, sources)) / 1024:.1f} KB")
+    pool = ParserPool(args.backend)
+    setups = {"new": lambda: new_parser(args.backend), "reset": lambda: reset_pool(pool)}
+    for name, setup in setups.items():
+        seconds = min(timeit.repeat(setup, number=2000, repeat=args.repeat)) / 2000
+        print(f"  set-up ({name:<5}) {seconds * 1e6:6.1f} us per source")
+    for ast in (False, True):
+        print("Parse and build AST:" if ast else "Parse only:")
+        runs = {
+            "fresh": lambda: parse_fresh(sources, ast, args.backend),
+            "pool": lambda: parse_many(sources, ast, pool=pool),
+            f"{args.workers} workers": lambda: parse_many(
+                sources, ast, workers=args.workers, backend=args.backend
+            ),
+        }
+        # Warm the shared DFA before timing
+        expected = [str(r) for r in parse_fresh(sources, ast, args.backend)]
+        timings = {}
+        for name, run in runs.items():
+            seconds, results = best_of(run, args.repeat)
+            assert [str(r) for r in results] == expected
+            timings[name] = seconds
+            print(
+                f"  {name:<10} {seconds * 1000:8.1f} ms  {len(sources) / seconds:8.0f} sources/s"
+            )
+        print(f"  Speedup (fresh / pool): {timings['fresh'] / timings['pool']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
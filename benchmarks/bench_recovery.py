@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Syntax recovery benchmark.
+Times check_syntax() on a generated program as is, with an error injected
+every --every lines, and on the same amount of token garbage, against a
+first-error antlr_ast() of the valid program, showing that recovery costs
+about as much per KB as parsing and that garbage cannot make it super-linear.
+
+Usage:
+    python benchmarks/bench_recovery.py [--functions N] [--every K] [--repeat R]
+"""
+
+import argparse
+import random
+
+from common import best_of, generate_program
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.parser.recovery import check_syntax
+
+# Fragments that break a statement in different ways
+DAMAGE = ["= ;", "( (", "}", "int", "else", "+ +", "auto;"]
+
+
+def inject_errors(source: str, every: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = source.split("\n")
+    for i in range(every, len(lines), every):
+        lines[i] = f"{lines[i]} {rng.choice(DAMAGE)}"
+    return "\n".join(lines)
+
+
+def garbage(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = ["{", "}", "(", ")", ";", "int", "x", "=", "+", "if", "else", "1", ",", "."]
+    parts, length = [], 0
+    while length < size:
+        parts.append(rng.choice(words))
+        length += len(parts[-1]) + 1
+    return " ".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=200)
+    parser.add_argument("--every", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    valid = generate_program(args.functions)
+    inputs = {
+        "valid": valid,
+        "damaged": inject_errors(valid, args.every),
+        "garbage": garbage(len(valid)),
+    }
+    # Warm the ANTLR prediction DFA before timing
+    antlr_ast(CompactInputStream(valid), "antlr")
+    seconds, _ = best_of(lambda: antlr_ast(CompactInputStream(valid), "antlr"), args.repeat)
+    kb = len(valid) / 1024
+    print(f"Generated program: {args.functions} functions, {kb:.1f} KB")
+    print(f"  {'first-error':<16} {seconds * 1000:9.1f} ms  {kb / seconds:8.1f} KB/s")
+    for name, source in inputs.items():
+        kb = len(source) / 1024
+        check_syntax(CompactInputStream(source))
+        for max_errors in (100, 10_000):
+            seconds, (diagnostics, truncated) = best_of(
+                lambda: check_syntax(CompactInputStream(source), max_errors=max_errors),
+                args.repeat,
+            )
+            label = f"{name} /{max_errors}"
+            print(
+                f"  {label:<16} {seconds * 1000:9.1f} ms  {kb / seconds:8.1f} KB/s  "
+                f"{len(diagnostics)} errors{' (truncated)' if truncated else ''}"
+            )
+
+
+if __name__ == "__main__":
+    main()
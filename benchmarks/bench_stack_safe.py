@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Nesting-safe parsing benchmark.
+Builds the AST of the tests/test_parser.py inputs and of large generated
+programs with antlr_ast() and with safe_ast() (depth-limited parser on an
+enlarged thread stack), both on the fast lexer, and reports the overhead of
+the safe mode; then times safe_ast() on sources nested --depth levels deep,
+which it rejects with a NestingDepthError.
+
+Usage:
+    python benchmarks/bench_stack_safe.py [--functions N] [--repeat R] [--depth D]
+"""
+
+import argparse
+import time
+
+from common import best_of, generate_program, load_parser_test_sources
+
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.parser.stack_safe import safe_ast
+
+NESTED = {
+    "parentheses": lambda n: "void main() { x = " + "(" * n + "1" + ")" * n + "; }",
+    "calls": lambda n: "void main() { x = " + "f(" * n + "1" + ")" * n + "; }",
+    "blocks": lambda n: "void main() " + "{" * n + "x = 1;" + "}" * n,
+    "ifs": lambda n: "void main() {" + "if (a) " * n + "x = 1; }",
+    "else ifs": lambda n: "void main() {" + "if (a) x = 1; else " * n + "x = 1; }",
+}
+
+
+def build_all(sources, build):
+    for source in sources:
+        try:
+            build(CompactInputStream(source), "fast")
+        except Exception:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=100_000)
+    args = parser.parse_args()
+
+    corpora = {
+        "parser tests": load_parser_test_sources(),
+        "generated": [generate_program(args.functions, seed) for seed in range(3)],
+    }
+    for name, sources in corpora.items():
+        kb = sum(map(len, sources)) / 1024
+        print(f"{name}: {len(sources)} inputs, {kb:.1f} KB")
+        timings = {}
+        for build in (antlr_ast, safe_ast):
+            # Warm the ANTLR prediction DFA before timing
+            build_all(sources, build)
+            seconds, _ = best_of(lambda: build_all(sources, build), args.repeat)
+            timings[build] = seconds
+            print(f"  {build.__name__:<9} {seconds * 1000:9.1f} ms  {kb / seconds:9.1f} KB/s")
+        print(f"  Overhead (safe / antlr): {timings[safe_ast] / timings[antlr_ast] - 1:+.1%}")
+
+    print(f"Nested {args.depth} levels deep:")
+    for name, make in NESTED.items():
+        source = make(args.depth)
+        start = time.perf_counter()
+        try:
+            safe_ast(CompactInputStream(source), "fast")
+            result = "parsed"
+        except Exception as e:
+            result = str(e)
+        seconds = time.perf_counter() - start
+        print(f"  {name:<12} {seconds * 1000:9.1f} ms  {result}")
+
+
+if __name__ == "__main__":
+    main()
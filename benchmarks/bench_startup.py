@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark.
+Measures in fresh processes the time from the first import of the ANTLR
+runtime to the first token of a TyCLexer, and the part of it spent importing
+the generated recognizers, with and without the ATN cache installed.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import common  # noqa: F401  (sets up sys.path, imports no ANTLR code)
+
+
+def child(cache_path):
+    """Run inside a fresh interpreter and print timings as JSON."""
+    start = time.perf_counter()
+    import antlr4
+
+    if cache_path:
+        from src.parser import atn_cache
+
+        atn_cache.install(cache_path)
+    runtime_seconds = time.perf_counter() - start
+
+    from build.TyCLexer import TyCLexer
+    from build.TyCParser import TyCParser
+
+    import_seconds = time.perf_counter() - start - runtime_seconds
+    token = TyCLexer(antlr4.InputStream("int main() {}")).nextToken()
+    total_seconds = time.perf_counter() - start
+    assert token.type == TyCLexer.INT and TyCParser.atn is not None
+    print(
+        json.dumps(
+            {"runtime": runtime_seconds, "imports": import_seconds, "total": total_seconds}
+        )
+    )
+
+
+def run_child(cache_path):
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", cache_path or ""]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        child(args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "TyC.atn")
+        # The first cached run writes the cache, the timed ones read it
+        run_child(cache_path)
+        print(f"ATN cache: {os.path.getsize(cache_path) / 1024:.0f} KB")
+
+        for label, path in (("uncached", None), ("cached", cache_path)):
+            runs = [run_child(path) for _ in range(args.runs)]
+            runtime = statistics.median(r["runtime"] for r in runs) * 1000
+            imports = statistics.median(r["imports"] for r in runs) * 1000
+            total = statistics.median(r["total"] for r in runs) * 1000
+            print(
+                f"  {label:<9} runtime import {runtime:6.1f} ms  "
+                f"recognizer import {imports:6.1f} ms  first token {total:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
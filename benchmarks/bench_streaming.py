@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Streaming tokenizer benchmark.
+Writes a generated source of the given size to a temporary file and dumps
+its tokens with write_tokens() (chunked) and with the Tokenizer approach
+(whole file in memory, one list of token texts joined at the end),
+reporting time and (in a separate traced run) peak memory of each.
+
+Usage:
+    python benchmarks/bench_streaming.py [--size-mb N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from common import generate_program
+
+from antlr4.Token import Token
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.streaming import write_tokens
+
+
+def dump_in_memory(path, out):
+    with open(path, encoding="utf-8", newline="") as f:
+        lexer = create_lexer(CompactInputStream(f.read()), "fast")
+    tokens = []
+    while True:
+        t = lexer.nextToken()
+        if t.type == Token.EOF:
+            tokens.append("<EOF>")
+            break
+        tokens.append(t.text or "")
+    out.write(",".join(tokens))
+
+
+def dump_streaming(path, out):
+    with open(path, encoding="utf-8", newline="") as f:
+        write_tokens(f, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=8.0)
+    args = parser.parse_args()
+
+    chunk = generate_program(200)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.tyc")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(max(1, round(args.size_mb * (1 << 20) / len(chunk)))):
+                f.write(chunk)
+        print(f"Source: {os.path.getsize(path) / (1 << 20):.1f} MB")
+
+        for name, dump in (("in memory", dump_in_memory), ("streaming", dump_streaming)):
+            with open(os.devnull, "w") as out:
+                start = time.perf_counter()
+                dump(path, out)
+                seconds = time.perf_counter() - start
+                tracemalloc.start()
+                dump(path, out)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            print(f"  {name:<10} {seconds:6.2f} s  peak {peak / (1 << 20):8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Token storage benchmark.
+Compares memory and fill time of CommonTokenStream (one CommonToken per
+token) against the columnar TokenBuffer, and parse time of TyCParser on
+each stream.
+
+Usage:
+    python benchmarks/bench_token_buffer.py [--functions N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from common import generate_program
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import FastLexer
+from src.lexer.token_buffer import ColumnarTokenStream, TokenBuffer
+
+
+def build_common(source):
+    stream = CommonTokenStream(FastLexer(CompactInputStream(source)))
+    stream.fill()
+    return stream, len(stream.tokens)
+
+
+def build_columnar(source):
+    buffer = TokenBuffer.from_lexer(FastLexer(CompactInputStream(source)))
+    return ColumnarTokenStream(buffer), len(buffer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=1000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    print(f"Source: {len(source) / 1024:.1f} KB")
+
+    for name, build in (("CommonTokenStream", build_common), ("TokenBuffer", build_columnar)):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        stream, count = build(source)
+        fill_seconds = time.perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        TyCParser(stream).program()
+        parse_seconds = time.perf_counter() - start
+        print(
+            f"  {name:<18} {count} tokens  {size / (1 << 20):7.2f} MB "
+            f"({size / count:6.1f} bytes/token)  fill {fill_seconds:5.2f} s  "
+            f"parse {parse_seconds:5.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Two-stage parsing benchmark.
+Parses the tests/test_parser.py inputs and large generated programs with
+plain LL prediction and with parse_two_stage() (SLL, falling back to LL),
+and reports throughput, speedup and how many inputs needed the LL pass.
+
+Usage:
+    python benchmarks/bench_two_stage.py [--functions N] [--repeat R]
+"""
+
+import argparse
+
+from common import best_of, generate_program, load_parser_test_sources
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+def make_parser(source: str) -> TyCParser:
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def parse_ll(source: str):
+    try:
+        make_parser(source).program()
+    except Exception:
+        pass
+
+
+def parse_sll_ll(source: str):
+    try:
+        parse_two_stage(make_parser(source))
+    except Exception:
+        pass
+
+
+def needs_ll(source: str) -> bool:
+    """True if parse_two_stage() had to run the LL pass for source."""
+    parser = make_parser(source)
+    passes = []
+    reset = parser.reset
+    parser.reset = lambda: (passes.append(1), reset())
+    try:
+        parse_two_stage(parser)
+    except Exception:
+        pass
+    return bool(passes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--functions", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpora = {
+        "parser tests": load_parser_test_sources(),
+        "generated": [generate_program(args.functions, seed) for seed in range(3)],
+    }
+    for name, sources in corpora.items():
+        kb = sum(map(len, sources)) / 1024
+        fallbacks = sum(map(needs_ll, sources))
+        print(f"{name}: {len(sources)} inputs, {kb:.1f} KB, {fallbacks} needed the LL pass (syntax errors included)")
+        timings = {}
+        for mode, parse in (("LL", parse_ll), ("SLL+LL", parse_sll_ll)):
+            # Warm the shared DFA before timing
+            for source in sources:
+                parse(source)
+            seconds, _ = best_of(lambda: [parse(s) for s in sources], args.repeat)
+            timings[mode] = seconds
+            print(f"  {mode:<7} {seconds * 1000:9.1f} ms  {kb / seconds:9.1f} KB/s")
+        print(f"  Speedup: {timings['LL'] / timings['SLL+LL']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
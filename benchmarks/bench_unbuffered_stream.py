@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unbuffered token stream benchmark.
+Writes a generated source of the given size to a temporary file and checks
+its syntax (parse trees off) with TyCParser on a CommonTokenStream over the
+whole file and with parse_stream() on an UnbufferedTokenStream, reporting
+time, the largest token window of the unbuffered stream and (in a separate
+traced run) peak memory of each.
+
+Usage:
+    python benchmarks/bench_unbuffered_stream.py [--size-mb N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from common import generate_program
+
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.streaming import streaming_parser
+from src.utils.error_listener import NewErrorListener
+
+
+def check_buffered(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        lexer = create_lexer(CompactInputStream(f.read()), "fast")
+    parser = TyCParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    parser.buildParseTrees = False
+    parser.program()
+    return len(parser.getTokenStream().tokens)
+
+
+def check_streaming(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        parser = streaming_parser(f, build_trees=False)
+        parser.program()
+    return parser.getTokenStream().peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    chunk = generate_program(200)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.tyc")
+        with open(path, "w", encoding="utf-8") as f:
+            # One program: repeat the functions, keep a single main
+            body = chunk[: chunk.index("void main()")]
+            for i in range(max(1, round(args.size_mb * (1 << 20) / len(body)))):
+                f.write(body.replace("func", f"f{i}_"))
+            f.write("void main() { }\n")
+        print(f"Source: {os.path.getsize(path) / (1 << 20):.1f} MB")
+
+        for name, check, label in (
+            ("buffered", check_buffered, "tokens held"),
+            ("unbuffered", check_streaming, "peak window"),
+        ):
+            start = time.perf_counter()
+            held = check(path)
+            seconds = time.perf_counter() - start
+            tracemalloc.start()
+            check(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {name:<10} {seconds:6.2f} s  peak {peak / (1 << 20):8.1f} MB"
+                f"  {label} {held}"
+            )
+
+
+if __name__ == "__main__":
+    main()
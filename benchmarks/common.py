@@ -0,0 +1,96 @@
+"""
+Shared helpers for TyC benchmarks.
+Sets up the import path the same way tests/utils.py does and provides the
+benchmark corpora: synthetic generated programs and the parser test inputs.
+"""
+
+import ast
+import os
+import random
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+build_dir = os.path.join(project_root, "build")
+sys.path.insert(0, project_root)
+sys.path.insert(0, build_dir)
+
+
+def generate_program(num_functions: int = 100, seed: int = 0) -> str:
+    """Generate a syntactically valid TyC program with num_functions functions."""
+    rng = random.Random(seed)
+    parts = [
+        "/* Generated TyC benchmark program */\n",
+        "struct Point { int x; int y; };\n",
+        "struct Box { Point lo; Point hi; string label; };\n",
+        "int counter = 0;\n",
+    ]
+    for i in range(num_functions):
+        a, b = rng.randint(0, 99), rng.randint(1, 99)
+        parts.append(
+            f"int func{i}(int a, float b, Point p) {{\n"
+            f"    // body of func{i}\n"
+            f"    int total = a * {a} + {b} - (p.x % {b});\n"
+            f"    auto ratio = b / {b}.5e1;\n"
+            f'    string name = "func{i}\\tvalue\\n";\n'
+            f"    for (int k = 0; k < {a} && total != {b}; ++k) {{\n"
+            f"        total = total + k * (a - {b}) / {b};\n"
+            f"        if (total >= {a * 10} || !(k <= 3)) break; else continue;\n"
+            f"    }}\n"
+            f"    while (total > {b}) {{ total--; p.x = p.y = total; }}\n"
+            f"    switch (total % 3) {{\n"
+            f"        case 0: counter = counter + 1; break;\n"
+            f"        case 1: printInt(total); break;\n"
+            f"        default: printString(name);\n"
+            f"    }}\n"
+            f"    return func{max(i - 1, 0)}(total, ratio, p) + -a;\n"
+            f"}}\n"
+        )
+    parts.append("void main() {\n    Point p;\n    printInt(func0(1, 2.0, p));\n}\n")
+    return "".join(parts)
+
+
+def load_parser_test_sources():
+    """Return the source strings passed to Parser(...) in tests/test_parser.py."""
+    path = os.path.join(project_root, "tests", "test_parser.py")
+    with open(path, encoding="utf-8") as f:
+        module = ast.parse(f.read())
+
+    sources = []
+    for func in module.body:
+        if not isinstance(func, ast.FunctionDef):
+            continue
+        strings = {}
+        for node in ast.walk(func):
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+            ):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        strings[target.id] = node.value.value
+        for node in ast.walk(func):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "Parser"
+                and node.args
+            ):
+                arg = node.args[0]
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    sources.append(arg.value)
+                elif isinstance(arg, ast.Name) and arg.id in strings:
+                    sources.append(strings[arg.id])
+    return sources
+
+
+def best_of(fn, repeat: int = 3):
+    """Run fn repeat times and return (best wall time in seconds, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,301 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,52,403,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,1,0,1,0,1,1,1,1,1,2,1,2,1,3,1,3,1,4,1,4,1,5,1,5,1,6,1,6,
+        1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,12,1,12,
+        1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,
+        1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,
+        1,18,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,
+        1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,
+        1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,25,1,25,1,25,1,26,1,26,
+        1,26,1,27,1,27,1,27,1,28,1,28,1,28,1,29,1,29,1,29,1,30,1,30,1,30,
+        1,31,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,
+        1,37,1,37,1,38,1,38,1,39,1,39,1,40,1,40,1,41,1,41,1,42,4,42,266,
+        8,42,11,42,12,42,267,1,42,1,42,5,42,272,8,42,10,42,12,42,275,9,42,
+        1,42,1,42,3,42,279,8,42,1,42,4,42,282,8,42,11,42,12,42,283,3,42,
+        286,8,42,1,42,1,42,4,42,290,8,42,11,42,12,42,291,1,42,1,42,3,42,
+        296,8,42,1,42,4,42,299,8,42,11,42,12,42,300,3,42,303,8,42,1,42,4,
+        42,306,8,42,11,42,12,42,307,1,42,1,42,3,42,312,8,42,1,42,4,42,315,
+        8,42,11,42,12,42,316,3,42,319,8,42,1,43,4,43,322,8,43,11,43,12,43,
+        323,1,44,1,44,1,44,5,44,329,8,44,10,44,12,44,332,9,44,1,44,1,44,
+        1,44,1,45,1,45,1,45,5,45,340,8,45,10,45,12,45,343,9,45,1,45,1,45,
+        1,45,3,45,348,8,45,1,46,1,46,1,46,5,46,353,8,46,10,46,12,46,356,
+        9,46,1,46,1,46,1,47,1,47,1,47,1,48,1,48,5,48,365,8,48,10,48,12,48,
+        368,9,48,1,49,1,49,1,49,1,49,5,49,374,8,49,10,49,12,49,377,9,49,
+        1,49,1,49,1,50,1,50,1,50,1,50,5,50,385,8,50,10,50,12,50,388,9,50,
+        1,50,1,50,1,50,1,50,1,50,1,51,4,51,396,8,51,11,51,12,51,397,1,51,
+        1,51,1,52,1,52,1,386,0,53,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,
+        9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,
+        20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,
+        31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,
+        42,85,43,87,44,89,45,91,46,93,47,95,0,97,48,99,49,101,50,103,51,
+        105,52,1,0,11,1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,45,4,0,10,
+        10,13,13,34,34,92,92,9,0,10,10,13,13,34,34,92,92,98,98,102,102,110,
+        110,114,114,116,116,2,1,10,10,13,13,7,0,34,34,92,92,98,98,102,102,
+        110,110,114,114,116,116,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,
+        95,97,122,2,0,10,10,13,13,3,0,9,10,12,13,32,32,427,0,1,1,0,0,0,0,
+        3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,
+        1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,
+        1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,
+        1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,
+        1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,
+        1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,
+        1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,
+        1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,
+        1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,
+        1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,
+        105,1,0,0,0,1,107,1,0,0,0,3,109,1,0,0,0,5,111,1,0,0,0,7,113,1,0,
+        0,0,9,115,1,0,0,0,11,117,1,0,0,0,13,119,1,0,0,0,15,121,1,0,0,0,17,
+        125,1,0,0,0,19,131,1,0,0,0,21,138,1,0,0,0,23,143,1,0,0,0,25,148,
+        1,0,0,0,27,153,1,0,0,0,29,159,1,0,0,0,31,164,1,0,0,0,33,173,1,0,
+        0,0,35,181,1,0,0,0,37,186,1,0,0,0,39,190,1,0,0,0,41,193,1,0,0,0,
+        43,200,1,0,0,0,45,207,1,0,0,0,47,214,1,0,0,0,49,220,1,0,0,0,51,223,
+        1,0,0,0,53,226,1,0,0,0,55,229,1,0,0,0,57,232,1,0,0,0,59,235,1,0,
+        0,0,61,238,1,0,0,0,63,241,1,0,0,0,65,244,1,0,0,0,67,246,1,0,0,0,
+        69,248,1,0,0,0,71,250,1,0,0,0,73,252,1,0,0,0,75,254,1,0,0,0,77,256,
+        1,0,0,0,79,258,1,0,0,0,81,260,1,0,0,0,83,262,1,0,0,0,85,318,1,0,
+        0,0,87,321,1,0,0,0,89,325,1,0,0,0,91,336,1,0,0,0,93,349,1,0,0,0,
+        95,359,1,0,0,0,97,362,1,0,0,0,99,369,1,0,0,0,101,380,1,0,0,0,103,
+        395,1,0,0,0,105,401,1,0,0,0,107,108,5,59,0,0,108,2,1,0,0,0,109,110,
+        5,44,0,0,110,4,1,0,0,0,111,112,5,40,0,0,112,6,1,0,0,0,113,114,5,
+        41,0,0,114,8,1,0,0,0,115,116,5,123,0,0,116,10,1,0,0,0,117,118,5,
+        125,0,0,118,12,1,0,0,0,119,120,5,58,0,0,120,14,1,0,0,0,121,122,5,
+        105,0,0,122,123,5,110,0,0,123,124,5,116,0,0,124,16,1,0,0,0,125,126,
+        5,102,0,0,126,127,5,108,0,0,127,128,5,111,0,0,128,129,5,97,0,0,129,
+        130,5,116,0,0,130,18,1,0,0,0,131,132,5,115,0,0,132,133,5,116,0,0,
+        133,134,5,114,0,0,134,135,5,105,0,0,135,136,5,110,0,0,136,137,5,
+        103,0,0,137,20,1,0,0,0,138,139,5,97,0,0,139,140,5,117,0,0,140,141,
+        5,116,0,0,141,142,5,111,0,0,142,22,1,0,0,0,143,144,5,118,0,0,144,
+        145,5,111,0,0,145,146,5,105,0,0,146,147,5,100,0,0,147,24,1,0,0,0,
+        148,149,5,109,0,0,149,150,5,97,0,0,150,151,5,105,0,0,151,152,5,110,
+        0,0,152,26,1,0,0,0,153,154,5,98,0,0,154,155,5,114,0,0,155,156,5,
+        101,0,0,156,157,5,97,0,0,157,158,5,107,0,0,158,28,1,0,0,0,159,160,
+        5,99,0,0,160,161,5,97,0,0,161,162,5,115,0,0,162,163,5,101,0,0,163,
+        30,1,0,0,0,164,165,5,99,0,0,165,166,5,111,0,0,166,167,5,110,0,0,
+        167,168,5,116,0,0,168,169,5,105,0,0,169,170,5,110,0,0,170,171,5,
+        117,0,0,171,172,5,101,0,0,172,32,1,0,0,0,173,174,5,100,0,0,174,175,
+        5,101,0,0,175,176,5,102,0,0,176,177,5,97,0,0,177,178,5,117,0,0,178,
+        179,5,108,0,0,179,180,5,116,0,0,180,34,1,0,0,0,181,182,5,101,0,0,
+        182,183,5,108,0,0,183,184,5,115,0,0,184,185,5,101,0,0,185,36,1,0,
+        0,0,186,187,5,102,0,0,187,188,5,111,0,0,188,189,5,114,0,0,189,38,
+        1,0,0,0,190,191,5,105,0,0,191,192,5,102,0,0,192,40,1,0,0,0,193,194,
+        5,114,0,0,194,195,5,101,0,0,195,196,5,116,0,0,196,197,5,117,0,0,
+        197,198,5,114,0,0,198,199,5,110,0,0,199,42,1,0,0,0,200,201,5,115,
+        0,0,201,202,5,116,0,0,202,203,5,114,0,0,203,204,5,117,0,0,204,205,
+        5,99,0,0,205,206,5,116,0,0,206,44,1,0,0,0,207,208,5,115,0,0,208,
+        209,5,119,0,0,209,210,5,105,0,0,210,211,5,116,0,0,211,212,5,99,0,
+        0,212,213,5,104,0,0,213,46,1,0,0,0,214,215,5,119,0,0,215,216,5,104,
+        0,0,216,217,5,105,0,0,217,218,5,108,0,0,218,219,5,101,0,0,219,48,
+        1,0,0,0,220,221,5,61,0,0,221,222,5,61,0,0,222,50,1,0,0,0,223,224,
+        5,33,0,0,224,225,5,61,0,0,225,52,1,0,0,0,226,227,5,60,0,0,227,228,
+        5,61,0,0,228,54,1,0,0,0,229,230,5,62,0,0,230,231,5,61,0,0,231,56,
+        1,0,0,0,232,233,5,124,0,0,233,234,5,124,0,0,234,58,1,0,0,0,235,236,
+        5,38,0,0,236,237,5,38,0,0,237,60,1,0,0,0,238,239,5,43,0,0,239,240,
+        5,43,0,0,240,62,1,0,0,0,241,242,5,45,0,0,242,243,5,45,0,0,243,64,
+        1,0,0,0,244,245,5,61,0,0,245,66,1,0,0,0,246,247,5,60,0,0,247,68,
+        1,0,0,0,248,249,5,62,0,0,249,70,1,0,0,0,250,251,5,43,0,0,251,72,
+        1,0,0,0,252,253,5,45,0,0,253,74,1,0,0,0,254,255,5,42,0,0,255,76,
+        1,0,0,0,256,257,5,47,0,0,257,78,1,0,0,0,258,259,5,37,0,0,259,80,
+        1,0,0,0,260,261,5,33,0,0,261,82,1,0,0,0,262,263,5,46,0,0,263,84,
+        1,0,0,0,264,266,7,0,0,0,265,264,1,0,0,0,266,267,1,0,0,0,267,265,
+        1,0,0,0,267,268,1,0,0,0,268,269,1,0,0,0,269,273,5,46,0,0,270,272,
+        7,0,0,0,271,270,1,0,0,0,272,275,1,0,0,0,273,271,1,0,0,0,273,274,
+        1,0,0,0,274,285,1,0,0,0,275,273,1,0,0,0,276,278,7,1,0,0,277,279,
+        7,2,0,0,278,277,1,0,0,0,278,279,1,0,0,0,279,281,1,0,0,0,280,282,
+        7,0,0,0,281,280,1,0,0,0,282,283,1,0,0,0,283,281,1,0,0,0,283,284,
+        1,0,0,0,284,286,1,0,0,0,285,276,1,0,0,0,285,286,1,0,0,0,286,319,
+        1,0,0,0,287,289,5,46,0,0,288,290,7,0,0,0,289,288,1,0,0,0,290,291,
+        1,0,0,0,291,289,1,0,0,0,291,292,1,0,0,0,292,302,1,0,0,0,293,295,
+        7,1,0,0,294,296,7,2,0,0,295,294,1,0,0,0,295,296,1,0,0,0,296,298,
+        1,0,0,0,297,299,7,0,0,0,298,297,1,0,0,0,299,300,1,0,0,0,300,298,
+        1,0,0,0,300,301,1,0,0,0,301,303,1,0,0,0,302,293,1,0,0,0,302,303,
+        1,0,0,0,303,319,1,0,0,0,304,306,7,0,0,0,305,304,1,0,0,0,306,307,
+        1,0,0,0,307,305,1,0,0,0,307,308,1,0,0,0,308,309,1,0,0,0,309,311,
+        7,1,0,0,310,312,7,2,0,0,311,310,1,0,0,0,311,312,1,0,0,0,312,314,
+        1,0,0,0,313,315,7,0,0,0,314,313,1,0,0,0,315,316,1,0,0,0,316,314,
+        1,0,0,0,316,317,1,0,0,0,317,319,1,0,0,0,318,265,1,0,0,0,318,287,
+        1,0,0,0,318,305,1,0,0,0,319,86,1,0,0,0,320,322,7,0,0,0,321,320,1,
+        0,0,0,322,323,1,0,0,0,323,321,1,0,0,0,323,324,1,0,0,0,324,88,1,0,
+        0,0,325,330,5,34,0,0,326,329,8,3,0,0,327,329,3,95,47,0,328,326,1,
+        0,0,0,328,327,1,0,0,0,329,332,1,0,0,0,330,328,1,0,0,0,330,331,1,
+        0,0,0,331,333,1,0,0,0,332,330,1,0,0,0,333,334,5,92,0,0,334,335,8,
+        4,0,0,335,90,1,0,0,0,336,341,5,34,0,0,337,340,8,3,0,0,338,340,3,
+        95,47,0,339,337,1,0,0,0,339,338,1,0,0,0,340,343,1,0,0,0,341,339,
+        1,0,0,0,341,342,1,0,0,0,342,347,1,0,0,0,343,341,1,0,0,0,344,345,
+        5,92,0,0,345,348,5,0,0,1,346,348,7,5,0,0,347,344,1,0,0,0,347,346,
+        1,0,0,0,348,92,1,0,0,0,349,354,5,34,0,0,350,353,8,3,0,0,351,353,
+        3,95,47,0,352,350,1,0,0,0,352,351,1,0,0,0,353,356,1,0,0,0,354,352,
+        1,0,0,0,354,355,1,0,0,0,355,357,1,0,0,0,356,354,1,0,0,0,357,358,
+        5,34,0,0,358,94,1,0,0,0,359,360,5,92,0,0,360,361,7,6,0,0,361,96,
+        1,0,0,0,362,366,7,7,0,0,363,365,7,8,0,0,364,363,1,0,0,0,365,368,
+        1,0,0,0,366,364,1,0,0,0,366,367,1,0,0,0,367,98,1,0,0,0,368,366,1,
+        0,0,0,369,370,5,47,0,0,370,371,5,47,0,0,371,375,1,0,0,0,372,374,
+        8,9,0,0,373,372,1,0,0,0,374,377,1,0,0,0,375,373,1,0,0,0,375,376,
+        1,0,0,0,376,378,1,0,0,0,377,375,1,0,0,0,378,379,6,49,0,0,379,100,
+        1,0,0,0,380,381,5,47,0,0,381,382,5,42,0,0,382,386,1,0,0,0,383,385,
+        9,0,0,0,384,383,1,0,0,0,385,388,1,0,0,0,386,387,1,0,0,0,386,384,
+        1,0,0,0,387,389,1,0,0,0,388,386,1,0,0,0,389,390,5,42,0,0,390,391,
+        5,47,0,0,391,392,1,0,0,0,392,393,6,50,0,0,393,102,1,0,0,0,394,396,
+        7,10,0,0,395,394,1,0,0,0,396,397,1,0,0,0,397,395,1,0,0,0,397,398,
+        1,0,0,0,398,399,1,0,0,0,399,400,6,51,0,0,400,104,1,0,0,0,401,402,
+        9,0,0,0,402,106,1,0,0,0,26,0,267,273,278,283,285,291,295,300,302,
+        307,311,316,318,323,328,330,339,341,347,352,354,366,375,386,397,
+        1,6,0,0
+    ]
+
+class TyCLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    SEMI = 1
+    COMMA = 2
+    LPAREN = 3
+    RPAREN = 4
+    LBRACE = 5
+    RBRACE = 6
+    COLON = 7
+    INT = 8
+    FLOAT = 9
+    STRING = 10
+    AUTO = 11
+    VOID = 12
+    MAIN = 13
+    BREAK = 14
+    CASE = 15
+    CONTINUE = 16
+    DEFAULT = 17
+    ELSE = 18
+    FOR = 19
+    IF = 20
+    RETURN = 21
+    STRUCT = 22
+    SWITCH = 23
+    WHILE = 24
+    EQ = 25
+    NEQ = 26
+    LE = 27
+    GE = 28
+    OR = 29
+    AND = 30
+    INC = 31
+    DEC = 32
+    ASSIGN = 33
+    LT = 34
+    GT = 35
+    PLUS = 36
+    MINUS = 37
+    MUL = 38
+    DIV = 39
+    MOD = 40
+    NOT = 41
+    DOT = 42
+    FLOATLIT = 43
+    INTLIT = 44
+    ILLEGAL_ESCAPE = 45
+    UNCLOSE_STRING = 46
+    STRINGLIT = 47
+    ID = 48
+    LINE_COMMENT = 49
+    BLOCK_COMMENT = 50
+    WS = 51
+    ERROR_CHAR = 52
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "';'", "','", "'('", "')'", "'{'", "'}'", "':'", "'int'", "'float'", 
+            "'string'", "'auto'", "'void'", "'main'", "'break'", "'case'", 
+            "'continue'", "'default'", "'else'", "'for'", "'if'", "'return'", 
+            "'struct'", "'switch'", "'while'", "'=='", "'!='", "'<='", "'>='", 
+            "'||'", "'&&'", "'++'", "'--'", "'='", "'<'", "'>'", "'+'", 
+            "'-'", "'*'", "'/'", "'%'", "'!'", "'.'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "SEMI", "COMMA", "LPAREN", "RPAREN", "LBRACE", "RBRACE", "COLON", 
+            "INT", "FLOAT", "STRING", "AUTO", "VOID", "MAIN", "BREAK", "CASE", 
+            "CONTINUE", "DEFAULT", "ELSE", "FOR", "IF", "RETURN", "STRUCT", 
+            "SWITCH", "WHILE", "EQ", "NEQ", "LE", "GE", "OR", "AND", "INC", 
+            "DEC", "ASSIGN", "LT", "GT", "PLUS", "MINUS", "MUL", "DIV", 
+            "MOD", "NOT", "DOT", "FLOATLIT", "INTLIT", "ILLEGAL_ESCAPE", 
+            "UNCLOSE_STRING", "STRINGLIT", "ID", "LINE_COMMENT", "BLOCK_COMMENT", 
+            "WS", "ERROR_CHAR" ]
+
+    ruleNames = [ "SEMI", "COMMA", "LPAREN", "RPAREN", "LBRACE", "RBRACE", 
+                  "COLON", "INT", "FLOAT", "STRING", "AUTO", "VOID", "MAIN", 
+                  "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FOR", 
+                  "IF", "RETURN", "STRUCT", "SWITCH", "WHILE", "EQ", "NEQ", 
+                  "LE", "GE", "OR", "AND", "INC", "DEC", "ASSIGN", "LT", 
+                  "GT", "PLUS", "MINUS", "MUL", "DIV", "MOD", "NOT", "DOT", 
+                  "FLOATLIT", "INTLIT", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", 
+                  "STRINGLIT", "ESC_SEQ", "ID", "LINE_COMMENT", "BLOCK_COMMENT", 
+                  "WS", "ERROR_CHAR" ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    # Set to a list to record lexical errors there instead of raising them
+    diagnostics = None
+
+    def reportError(self, error, token):
+        if self.diagnostics is None:
+            raise error
+        self.diagnostics.append(LexerDiagnostic(error, token))
+        return token
+
+    def emit(self):
+        tk = self.type
+        # Logic to satisfy "String Token Processing" requirements
+        if tk == self.STRINGLIT:
+            # Strip the enclosing double quotes for valid strings
+            self.text = self.text[1:-1]
+            return super().emit()
+        elif tk == self.UNCLOSE_STRING:
+            # Remove opening quote, keep content for error message
+            self.text = self.text[1:]
+            result = super().emit()
+            return self.reportError(UncloseString(result.text), result)
+        elif tk == self.ILLEGAL_ESCAPE:
+            # Remove opening quote, keep content for error message
+            self.text = self.text[1:]
+            result = super().emit()
+            return self.reportError(IllegalEscape(result.text), result)
+        elif tk == self.ERROR_CHAR:
+            result = super().emit()
+            return self.reportError(ErrorToken(result.text), result)
+        else:
+            return super().emit()
+
+
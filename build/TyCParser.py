@@ -0,0 +1,3145 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,52,380,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,1,0,4,0,74,8,0,11,0,12,0,75,1,0,1,0,1,1,
+        1,1,1,1,1,1,3,1,84,8,1,1,2,1,2,1,2,1,2,5,2,90,8,2,10,2,12,2,93,9,
+        2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,3,4,106,8,4,1,4,1,
+        4,1,4,1,4,1,4,1,4,3,4,114,8,4,1,4,3,4,117,8,4,1,5,1,5,1,5,1,5,1,
+        5,1,5,1,6,3,6,126,8,6,1,6,1,6,1,6,3,6,131,8,6,1,6,1,6,1,6,1,7,1,
+        7,3,7,138,8,7,1,8,1,8,1,8,5,8,143,8,8,10,8,12,8,146,9,8,1,9,1,9,
+        1,9,1,10,1,10,1,11,1,11,1,11,5,11,156,8,11,10,11,12,11,159,9,11,
+        1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,172,
+        8,12,1,13,1,13,1,13,5,13,177,8,13,10,13,12,13,180,9,13,1,13,1,13,
+        3,13,184,8,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,193,8,14,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,3,16,204,8,16,1,16,1,
+        16,3,16,208,8,16,1,16,1,16,3,16,212,8,16,1,16,1,16,1,16,1,17,1,17,
+        1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,3,17,230,
+        8,17,1,18,1,18,1,18,1,18,1,18,1,18,3,18,238,8,18,1,19,1,19,1,19,
+        1,19,1,19,1,19,5,19,246,8,19,10,19,12,19,249,9,19,1,19,3,19,252,
+        8,19,1,19,5,19,255,8,19,10,19,12,19,258,9,19,1,19,1,19,1,20,1,20,
+        1,20,1,20,1,20,5,20,267,8,20,10,20,12,20,270,9,20,1,21,1,21,1,21,
+        1,21,5,21,276,8,21,10,21,12,21,279,9,21,1,22,1,22,1,22,1,23,1,23,
+        1,23,1,24,1,24,3,24,289,8,24,1,24,1,24,1,25,1,25,1,25,1,26,1,26,
+        1,26,1,27,1,27,1,27,1,27,1,27,3,27,304,8,27,1,28,1,28,1,28,1,28,
+        3,28,310,8,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,5,28,330,8,28,10,28,12,28,
+        333,9,28,1,29,1,29,1,29,3,29,338,8,29,1,30,1,30,5,30,342,8,30,10,
+        30,12,30,345,9,30,1,31,1,31,1,31,1,31,3,31,351,8,31,1,32,1,32,3,
+        32,355,8,32,1,32,1,32,1,33,1,33,1,33,5,33,362,8,33,10,33,12,33,365,
+        9,33,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,3,35,
+        378,8,35,1,35,0,1,56,36,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,
+        30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,0,
+        6,2,0,8,10,48,48,3,0,31,32,36,37,41,41,1,0,38,40,1,0,36,37,2,0,27,
+        28,34,35,1,0,25,26,402,0,73,1,0,0,0,2,83,1,0,0,0,4,85,1,0,0,0,6,
+        97,1,0,0,0,8,116,1,0,0,0,10,118,1,0,0,0,12,125,1,0,0,0,14,137,1,
+        0,0,0,16,139,1,0,0,0,18,147,1,0,0,0,20,150,1,0,0,0,22,152,1,0,0,
+        0,24,171,1,0,0,0,26,183,1,0,0,0,28,185,1,0,0,0,30,194,1,0,0,0,32,
+        200,1,0,0,0,34,229,1,0,0,0,36,237,1,0,0,0,38,239,1,0,0,0,40,261,
+        1,0,0,0,42,271,1,0,0,0,44,280,1,0,0,0,46,283,1,0,0,0,48,286,1,0,
+        0,0,50,292,1,0,0,0,52,295,1,0,0,0,54,303,1,0,0,0,56,309,1,0,0,0,
+        58,337,1,0,0,0,60,339,1,0,0,0,62,350,1,0,0,0,64,352,1,0,0,0,66,358,
+        1,0,0,0,68,366,1,0,0,0,70,377,1,0,0,0,72,74,3,2,1,0,73,72,1,0,0,
+        0,74,75,1,0,0,0,75,73,1,0,0,0,75,76,1,0,0,0,76,77,1,0,0,0,77,78,
+        5,0,0,1,78,1,1,0,0,0,79,84,3,8,4,0,80,84,3,10,5,0,81,84,3,12,6,0,
+        82,84,3,4,2,0,83,79,1,0,0,0,83,80,1,0,0,0,83,81,1,0,0,0,83,82,1,
+        0,0,0,84,3,1,0,0,0,85,86,5,22,0,0,86,87,5,48,0,0,87,91,5,5,0,0,88,
+        90,3,6,3,0,89,88,1,0,0,0,90,93,1,0,0,0,91,89,1,0,0,0,91,92,1,0,0,
+        0,92,94,1,0,0,0,93,91,1,0,0,0,94,95,5,6,0,0,95,96,5,1,0,0,96,5,1,
+        0,0,0,97,98,3,20,10,0,98,99,5,48,0,0,99,100,5,1,0,0,100,7,1,0,0,
+        0,101,102,3,20,10,0,102,105,5,48,0,0,103,104,5,33,0,0,104,106,3,
+        54,27,0,105,103,1,0,0,0,105,106,1,0,0,0,106,107,1,0,0,0,107,108,
+        5,1,0,0,108,117,1,0,0,0,109,110,5,11,0,0,110,113,5,48,0,0,111,112,
+        5,33,0,0,112,114,3,54,27,0,113,111,1,0,0,0,113,114,1,0,0,0,114,115,
+        1,0,0,0,115,117,5,1,0,0,116,101,1,0,0,0,116,109,1,0,0,0,117,9,1,
+        0,0,0,118,119,5,12,0,0,119,120,5,13,0,0,120,121,5,3,0,0,121,122,
+        5,4,0,0,122,123,3,22,11,0,123,11,1,0,0,0,124,126,3,14,7,0,125,124,
+        1,0,0,0,125,126,1,0,0,0,126,127,1,0,0,0,127,128,5,48,0,0,128,130,
+        5,3,0,0,129,131,3,16,8,0,130,129,1,0,0,0,130,131,1,0,0,0,131,132,
+        1,0,0,0,132,133,5,4,0,0,133,134,3,22,11,0,134,13,1,0,0,0,135,138,
+        3,20,10,0,136,138,5,12,0,0,137,135,1,0,0,0,137,136,1,0,0,0,138,15,
+        1,0,0,0,139,144,3,18,9,0,140,141,5,2,0,0,141,143,3,18,9,0,142,140,
+        1,0,0,0,143,146,1,0,0,0,144,142,1,0,0,0,144,145,1,0,0,0,145,17,1,
+        0,0,0,146,144,1,0,0,0,147,148,3,20,10,0,148,149,5,48,0,0,149,19,
+        1,0,0,0,150,151,7,0,0,0,151,21,1,0,0,0,152,157,5,5,0,0,153,156,3,
+        8,4,0,154,156,3,24,12,0,155,153,1,0,0,0,155,154,1,0,0,0,156,159,
+        1,0,0,0,157,155,1,0,0,0,157,158,1,0,0,0,158,160,1,0,0,0,159,157,
+        1,0,0,0,160,161,5,6,0,0,161,23,1,0,0,0,162,172,3,28,14,0,163,172,
+        3,30,15,0,164,172,3,32,16,0,165,172,3,38,19,0,166,172,3,44,22,0,
+        167,172,3,46,23,0,168,172,3,48,24,0,169,172,3,52,26,0,170,172,3,
+        22,11,0,171,162,1,0,0,0,171,163,1,0,0,0,171,164,1,0,0,0,171,165,
+        1,0,0,0,171,166,1,0,0,0,171,167,1,0,0,0,171,168,1,0,0,0,171,169,
+        1,0,0,0,171,170,1,0,0,0,172,25,1,0,0,0,173,184,5,48,0,0,174,178,
+        3,70,35,0,175,177,3,62,31,0,176,175,1,0,0,0,177,180,1,0,0,0,178,
+        176,1,0,0,0,178,179,1,0,0,0,179,181,1,0,0,0,180,178,1,0,0,0,181,
+        182,3,68,34,0,182,184,1,0,0,0,183,173,1,0,0,0,183,174,1,0,0,0,184,
+        27,1,0,0,0,185,186,5,20,0,0,186,187,5,3,0,0,187,188,3,54,27,0,188,
+        189,5,4,0,0,189,192,3,24,12,0,190,191,5,18,0,0,191,193,3,24,12,0,
+        192,190,1,0,0,0,192,193,1,0,0,0,193,29,1,0,0,0,194,195,5,24,0,0,
+        195,196,5,3,0,0,196,197,3,54,27,0,197,198,5,4,0,0,198,199,3,24,12,
+        0,199,31,1,0,0,0,200,201,5,19,0,0,201,203,5,3,0,0,202,204,3,34,17,
+        0,203,202,1,0,0,0,203,204,1,0,0,0,204,205,1,0,0,0,205,207,5,1,0,
+        0,206,208,3,54,27,0,207,206,1,0,0,0,207,208,1,0,0,0,208,209,1,0,
+        0,0,209,211,5,1,0,0,210,212,3,36,18,0,211,210,1,0,0,0,211,212,1,
+        0,0,0,212,213,1,0,0,0,213,214,5,4,0,0,214,215,3,24,12,0,215,33,1,
+        0,0,0,216,217,3,20,10,0,217,218,5,48,0,0,218,219,5,33,0,0,219,220,
+        3,54,27,0,220,230,1,0,0,0,221,222,5,11,0,0,222,223,5,48,0,0,223,
+        224,5,33,0,0,224,230,3,54,27,0,225,226,3,26,13,0,226,227,5,33,0,
+        0,227,228,3,54,27,0,228,230,1,0,0,0,229,216,1,0,0,0,229,221,1,0,
+        0,0,229,225,1,0,0,0,230,35,1,0,0,0,231,232,3,26,13,0,232,233,5,33,
+        0,0,233,234,3,54,27,0,234,238,1,0,0,0,235,238,3,58,29,0,236,238,
+        3,60,30,0,237,231,1,0,0,0,237,235,1,0,0,0,237,236,1,0,0,0,238,37,
+        1,0,0,0,239,240,5,23,0,0,240,241,5,3,0,0,241,242,3,54,27,0,242,243,
+        5,4,0,0,243,247,5,5,0,0,244,246,3,40,20,0,245,244,1,0,0,0,246,249,
+        1,0,0,0,247,245,1,0,0,0,247,248,1,0,0,0,248,251,1,0,0,0,249,247,
+        1,0,0,0,250,252,3,42,21,0,251,250,1,0,0,0,251,252,1,0,0,0,252,256,
+        1,0,0,0,253,255,3,40,20,0,254,253,1,0,0,0,255,258,1,0,0,0,256,254,
+        1,0,0,0,256,257,1,0,0,0,257,259,1,0,0,0,258,256,1,0,0,0,259,260,
+        5,6,0,0,260,39,1,0,0,0,261,262,5,15,0,0,262,263,3,54,27,0,263,268,
+        5,7,0,0,264,267,3,24,12,0,265,267,3,8,4,0,266,264,1,0,0,0,266,265,
+        1,0,0,0,267,270,1,0,0,0,268,266,1,0,0,0,268,269,1,0,0,0,269,41,1,
+        0,0,0,270,268,1,0,0,0,271,272,5,17,0,0,272,277,5,7,0,0,273,276,3,
+        24,12,0,274,276,3,8,4,0,275,273,1,0,0,0,275,274,1,0,0,0,276,279,
+        1,0,0,0,277,275,1,0,0,0,277,278,1,0,0,0,278,43,1,0,0,0,279,277,1,
+        0,0,0,280,281,5,14,0,0,281,282,5,1,0,0,282,45,1,0,0,0,283,284,5,
+        16,0,0,284,285,5,1,0,0,285,47,1,0,0,0,286,288,5,21,0,0,287,289,3,
+        54,27,0,288,287,1,0,0,0,288,289,1,0,0,0,289,290,1,0,0,0,290,291,
+        5,1,0,0,291,49,1,0,0,0,292,293,5,21,0,0,293,294,5,1,0,0,294,51,1,
+        0,0,0,295,296,3,54,27,0,296,297,5,1,0,0,297,53,1,0,0,0,298,299,3,
+        26,13,0,299,300,5,33,0,0,300,301,3,54,27,0,301,304,1,0,0,0,302,304,
+        3,56,28,0,303,298,1,0,0,0,303,302,1,0,0,0,304,55,1,0,0,0,305,306,
+        6,28,-1,0,306,307,7,1,0,0,307,310,3,56,28,8,308,310,3,60,30,0,309,
+        305,1,0,0,0,309,308,1,0,0,0,310,331,1,0,0,0,311,312,10,7,0,0,312,
+        313,7,2,0,0,313,330,3,56,28,8,314,315,10,6,0,0,315,316,7,3,0,0,316,
+        330,3,56,28,7,317,318,10,5,0,0,318,319,7,4,0,0,319,330,3,56,28,6,
+        320,321,10,4,0,0,321,322,7,5,0,0,322,330,3,56,28,5,323,324,10,3,
+        0,0,324,325,5,30,0,0,325,330,3,56,28,4,326,327,10,2,0,0,327,328,
+        5,29,0,0,328,330,3,56,28,3,329,311,1,0,0,0,329,314,1,0,0,0,329,317,
+        1,0,0,0,329,320,1,0,0,0,329,323,1,0,0,0,329,326,1,0,0,0,330,333,
+        1,0,0,0,331,329,1,0,0,0,331,332,1,0,0,0,332,57,1,0,0,0,333,331,1,
+        0,0,0,334,335,7,1,0,0,335,338,3,58,29,0,336,338,3,60,30,0,337,334,
+        1,0,0,0,337,336,1,0,0,0,338,59,1,0,0,0,339,343,3,70,35,0,340,342,
+        3,62,31,0,341,340,1,0,0,0,342,345,1,0,0,0,343,341,1,0,0,0,343,344,
+        1,0,0,0,344,61,1,0,0,0,345,343,1,0,0,0,346,351,3,68,34,0,347,351,
+        3,64,32,0,348,351,5,31,0,0,349,351,5,32,0,0,350,346,1,0,0,0,350,
+        347,1,0,0,0,350,348,1,0,0,0,350,349,1,0,0,0,351,63,1,0,0,0,352,354,
+        5,3,0,0,353,355,3,66,33,0,354,353,1,0,0,0,354,355,1,0,0,0,355,356,
+        1,0,0,0,356,357,5,4,0,0,357,65,1,0,0,0,358,363,3,54,27,0,359,360,
+        5,2,0,0,360,362,3,54,27,0,361,359,1,0,0,0,362,365,1,0,0,0,363,361,
+        1,0,0,0,363,364,1,0,0,0,364,67,1,0,0,0,365,363,1,0,0,0,366,367,5,
+        42,0,0,367,368,5,48,0,0,368,69,1,0,0,0,369,378,5,48,0,0,370,378,
+        5,44,0,0,371,378,5,43,0,0,372,378,5,47,0,0,373,374,5,3,0,0,374,375,
+        3,54,27,0,375,376,5,4,0,0,376,378,1,0,0,0,377,369,1,0,0,0,377,370,
+        1,0,0,0,377,371,1,0,0,0,377,372,1,0,0,0,377,373,1,0,0,0,378,71,1,
+        0,0,0,39,75,83,91,105,113,116,125,130,137,144,155,157,171,178,183,
+        192,203,207,211,229,237,247,251,256,266,268,275,277,288,303,309,
+        329,331,337,343,350,354,363,377
+    ]
+
+class TyCParser ( Parser ):
+
+    grammarFileName = "TyC.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "';'", "','", "'('", "')'", "'{'", "'}'", 
+                     "':'", "'int'", "'float'", "'string'", "'auto'", "'void'", 
+                     "'main'", "'break'", "'case'", "'continue'", "'default'", 
+                     "'else'", "'for'", "'if'", "'return'", "'struct'", 
+                     "'switch'", "'while'", "'=='", "'!='", "'<='", "'>='", 
+                     "'||'", "'&&'", "'++'", "'--'", "'='", "'<'", "'>'", 
+                     "'+'", "'-'", "'*'", "'/'", "'%'", "'!'", "'.'" ]
+
+    symbolicNames = [ "<INVALID>", "SEMI", "COMMA", "LPAREN", "RPAREN", 
+                      "LBRACE", "RBRACE", "COLON", "INT", "FLOAT", "STRING", 
+                      "AUTO", "VOID", "MAIN", "BREAK", "CASE", "CONTINUE", 
+                      "DEFAULT", "ELSE", "FOR", "IF", "RETURN", "STRUCT", 
+                      "SWITCH", "WHILE", "EQ", "NEQ", "LE", "GE", "OR", 
+                      "AND", "INC", "DEC", "ASSIGN", "LT", "GT", "PLUS", 
+                      "MINUS", "MUL", "DIV", "MOD", "NOT", "DOT", "FLOATLIT", 
+                      "INTLIT", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "STRINGLIT", 
+                      "ID", "LINE_COMMENT", "BLOCK_COMMENT", "WS", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_decl = 1
+    RULE_structDecl = 2
+    RULE_structVar = 3
+    RULE_varDecl = 4
+    RULE_mainDecl = 5
+    RULE_funcDecl = 6
+    RULE_returnType = 7
+    RULE_paramList = 8
+    RULE_param = 9
+    RULE_type = 10
+    RULE_block = 11
+    RULE_stmt = 12
+    RULE_lhs = 13
+    RULE_ifStmt = 14
+    RULE_whileStmt = 15
+    RULE_forStmt = 16
+    RULE_forInit = 17
+    RULE_forUpdate = 18
+    RULE_switchStmt = 19
+    RULE_switchCase = 20
+    RULE_defaultCase = 21
+    RULE_breakStmt = 22
+    RULE_continueStmt = 23
+    RULE_returnStmt = 24
+    RULE_returnVoidStmt = 25
+    RULE_exprStmt = 26
+    RULE_expr = 27
+    RULE_opExpr = 28
+    RULE_unaryExpr = 29
+    RULE_postfixExpr = 30
+    RULE_postfixPart = 31
+    RULE_funcCall = 32
+    RULE_argList = 33
+    RULE_memberAccess = 34
+    RULE_primaryExpr = 35
+
+    ruleNames =  [ "program", "decl", "structDecl", "structVar", "varDecl", 
+                   "mainDecl", "funcDecl", "returnType", "paramList", "param", 
+                   "type", "block", "stmt", "lhs", "ifStmt", "whileStmt", 
+                   "forStmt", "forInit", "forUpdate", "switchStmt", "switchCase", 
+                   "defaultCase", "breakStmt", "continueStmt", "returnStmt", 
+                   "returnVoidStmt", "exprStmt", "expr", "opExpr", "unaryExpr", 
+                   "postfixExpr", "postfixPart", "funcCall", "argList", 
+                   "memberAccess", "primaryExpr" ]
+
+    EOF = Token.EOF
+    SEMI=1
+    COMMA=2
+    LPAREN=3
+    RPAREN=4
+    LBRACE=5
+    RBRACE=6
+    COLON=7
+    INT=8
+    FLOAT=9
+    STRING=10
+    AUTO=11
+    VOID=12
+    MAIN=13
+    BREAK=14
+    CASE=15
+    CONTINUE=16
+    DEFAULT=17
+    ELSE=18
+    FOR=19
+    IF=20
+    RETURN=21
+    STRUCT=22
+    SWITCH=23
+    WHILE=24
+    EQ=25
+    NEQ=26
+    LE=27
+    GE=28
+    OR=29
+    AND=30
+    INC=31
+    DEC=32
+    ASSIGN=33
+    LT=34
+    GT=35
+    PLUS=36
+    MINUS=37
+    MUL=38
+    DIV=39
+    MOD=40
+    NOT=41
+    DOT=42
+    FLOATLIT=43
+    INTLIT=44
+    ILLEGAL_ESCAPE=45
+    UNCLOSE_STRING=46
+    STRINGLIT=47
+    ID=48
+    LINE_COMMENT=49
+    BLOCK_COMMENT=50
+    WS=51
+    ERROR_CHAR=52
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(TyCParser.EOF, 0)
+
+        def decl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.DeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.DeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = TyCParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 73 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 72
+                self.decl()
+                self.state = 75 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not ((((_la) & ~0x3f) == 0 and ((1 << _la) & 281474980912896) != 0)):
+                    break
+
+            self.state = 77
+            self.match(TyCParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def mainDecl(self):
+            return self.getTypedRuleContext(TyCParser.MainDeclContext,0)
+
+
+        def funcDecl(self):
+            return self.getTypedRuleContext(TyCParser.FuncDeclContext,0)
+
+
+        def structDecl(self):
+            return self.getTypedRuleContext(TyCParser.StructDeclContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_decl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDecl" ):
+                return visitor.visitDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def decl(self):
+
+        localctx = TyCParser.DeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_decl)
+        try:
+            self.state = 83
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 79
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 80
+                self.mainDecl()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 81
+                self.funcDecl()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 82
+                self.structDecl()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRUCT(self):
+            return self.getToken(TyCParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def structVar(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StructVarContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StructVarContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructDecl" ):
+                return visitor.visitStructDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structDecl(self):
+
+        localctx = TyCParser.StructDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_structDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 85
+            self.match(TyCParser.STRUCT)
+            self.state = 86
+            self.match(TyCParser.ID)
+            self.state = 87
+            self.match(TyCParser.LBRACE)
+            self.state = 91
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 281474976712448) != 0):
+                self.state = 88
+                self.structVar()
+                self.state = 93
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 94
+            self.match(TyCParser.RBRACE)
+            self.state = 95
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructVarContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structVar
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructVar" ):
+                return visitor.visitStructVar(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structVar(self):
+
+        localctx = TyCParser.StructVarContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_structVar)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 97
+            self.type_()
+            self.state = 98
+            self.match(TyCParser.ID)
+            self.state = 99
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 116
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [8, 9, 10, 48]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 101
+                self.type_()
+                self.state = 102
+                self.match(TyCParser.ID)
+                self.state = 105
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 103
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 104
+                    self.expr()
+
+
+                self.state = 107
+                self.match(TyCParser.SEMI)
+                pass
+            elif token in [11]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 109
+                self.match(TyCParser.AUTO)
+                self.state = 110
+                self.match(TyCParser.ID)
+                self.state = 113
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==33:
+                    self.state = 111
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 112
+                    self.expr()
+
+
+                self.state = 115
+                self.match(TyCParser.SEMI)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MainDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def MAIN(self):
+            return self.getToken(TyCParser.MAIN, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_mainDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMainDecl" ):
+                return visitor.visitMainDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def mainDecl(self):
+
+        localctx = TyCParser.MainDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_mainDecl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 118
+            self.match(TyCParser.VOID)
+            self.state = 119
+            self.match(TyCParser.MAIN)
+            self.state = 120
+            self.match(TyCParser.LPAREN)
+            self.state = 121
+            self.match(TyCParser.RPAREN)
+            self.state = 122
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FuncDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def returnType(self):
+            return self.getTypedRuleContext(TyCParser.ReturnTypeContext,0)
+
+
+        def paramList(self):
+            return self.getTypedRuleContext(TyCParser.ParamListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_funcDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFuncDecl" ):
+                return visitor.visitFuncDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def funcDecl(self):
+
+        localctx = TyCParser.FuncDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_funcDecl)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 125
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
+            if la_ == 1:
+                self.state = 124
+                self.returnType()
+
+
+            self.state = 127
+            self.match(TyCParser.ID)
+            self.state = 128
+            self.match(TyCParser.LPAREN)
+            self.state = 130
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 281474976712448) != 0):
+                self.state = 129
+                self.paramList()
+
+
+            self.state = 132
+            self.match(TyCParser.RPAREN)
+            self.state = 133
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnTypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnType
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnType" ):
+                return visitor.visitReturnType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnType(self):
+
+        localctx = TyCParser.ReturnTypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_returnType)
+        try:
+            self.state = 137
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [8, 9, 10, 48]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 135
+                self.type_()
+                pass
+            elif token in [12]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 136
+                self.match(TyCParser.VOID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def param(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ParamContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ParamContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_paramList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamList" ):
+                return visitor.visitParamList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramList(self):
+
+        localctx = TyCParser.ParamListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_paramList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 139
+            self.param()
+            self.state = 144
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==2:
+                self.state = 140
+                self.match(TyCParser.COMMA)
+                self.state = 141
+                self.param()
+                self.state = 146
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_param
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParam" ):
+                return visitor.visitParam(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def param(self):
+
+        localctx = TyCParser.ParamContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_param)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 147
+            self.type_()
+            self.state = 148
+            self.match(TyCParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(TyCParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCParser.STRING, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType" ):
+                return visitor.visitType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = TyCParser.TypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_type)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 150
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 281474976712448) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def varDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.VarDeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.VarDeclContext,i)
+
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = TyCParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 152
+            self.match(TyCParser.LBRACE)
+            self.state = 157
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012397190952) != 0):
+                self.state = 155
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,10,self._ctx)
+                if la_ == 1:
+                    self.state = 153
+                    self.varDecl()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 154
+                    self.stmt()
+                    pass
+
+
+                self.state = 159
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 160
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ifStmt(self):
+            return self.getTypedRuleContext(TyCParser.IfStmtContext,0)
+
+
+        def whileStmt(self):
+            return self.getTypedRuleContext(TyCParser.WhileStmtContext,0)
+
+
+        def forStmt(self):
+            return self.getTypedRuleContext(TyCParser.ForStmtContext,0)
+
+
+        def switchStmt(self):
+            return self.getTypedRuleContext(TyCParser.SwitchStmtContext,0)
+
+
+        def breakStmt(self):
+            return self.getTypedRuleContext(TyCParser.BreakStmtContext,0)
+
+
+        def continueStmt(self):
+            return self.getTypedRuleContext(TyCParser.ContinueStmtContext,0)
+
+
+        def returnStmt(self):
+            return self.getTypedRuleContext(TyCParser.ReturnStmtContext,0)
+
+
+        def exprStmt(self):
+            return self.getTypedRuleContext(TyCParser.ExprStmtContext,0)
+
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmt" ):
+                return visitor.visitStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmt(self):
+
+        localctx = TyCParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_stmt)
+        try:
+            self.state = 171
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [20]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 162
+                self.ifStmt()
+                pass
+            elif token in [24]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 163
+                self.whileStmt()
+                pass
+            elif token in [19]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 164
+                self.forStmt()
+                pass
+            elif token in [23]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 165
+                self.switchStmt()
+                pass
+            elif token in [14]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 166
+                self.breakStmt()
+                pass
+            elif token in [16]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 167
+                self.continueStmt()
+                pass
+            elif token in [21]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 168
+                self.returnStmt()
+                pass
+            elif token in [3, 31, 32, 36, 37, 41, 43, 44, 47, 48]:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 169
+                self.exprStmt()
+                pass
+            elif token in [5]:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 170
+                self.block()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LhsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def primaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryExprContext,0)
+
+
+        def memberAccess(self):
+            return self.getTypedRuleContext(TyCParser.MemberAccessContext,0)
+
+
+        def postfixPart(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.PostfixPartContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.PostfixPartContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_lhs
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLhs" ):
+                return visitor.visitLhs(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lhs(self):
+
+        localctx = TyCParser.LhsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_lhs)
+        try:
+            self.state = 183
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 173
+                self.match(TyCParser.ID)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 174
+                self.primaryExpr()
+                self.state = 178
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,13,self._ctx)
+                while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                    if _alt==1:
+                        self.state = 175
+                        self.postfixPart() 
+                    self.state = 180
+                    self._errHandler.sync(self)
+                    _alt = self._interp.adaptivePredict(self._input,13,self._ctx)
+
+                self.state = 181
+                self.memberAccess()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(TyCParser.IF, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(TyCParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_ifStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfStmt" ):
+                return visitor.visitIfStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifStmt(self):
+
+        localctx = TyCParser.IfStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_ifStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 185
+            self.match(TyCParser.IF)
+            self.state = 186
+            self.match(TyCParser.LPAREN)
+            self.state = 187
+            self.expr()
+            self.state = 188
+            self.match(TyCParser.RPAREN)
+            self.state = 189
+            self.stmt()
+            self.state = 192
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            if la_ == 1:
+                self.state = 190
+                self.match(TyCParser.ELSE)
+                self.state = 191
+                self.stmt()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WhileStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def WHILE(self):
+            return self.getToken(TyCParser.WHILE, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_whileStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhileStmt" ):
+                return visitor.visitWhileStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def whileStmt(self):
+
+        localctx = TyCParser.WhileStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_whileStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 194
+            self.match(TyCParser.WHILE)
+            self.state = 195
+            self.match(TyCParser.LPAREN)
+            self.state = 196
+            self.expr()
+            self.state = 197
+            self.match(TyCParser.RPAREN)
+            self.state = 198
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(TyCParser.FOR, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.SEMI)
+            else:
+                return self.getToken(TyCParser.SEMI, i)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def forInit(self):
+            return self.getTypedRuleContext(TyCParser.ForInitContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def forUpdate(self):
+            return self.getTypedRuleContext(TyCParser.ForUpdateContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForStmt" ):
+                return visitor.visitForStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forStmt(self):
+
+        localctx = TyCParser.ForStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_forStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 200
+            self.match(TyCParser.FOR)
+            self.state = 201
+            self.match(TyCParser.LPAREN)
+            self.state = 203
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 448600744136456) != 0):
+                self.state = 202
+                self.forInit()
+
+
+            self.state = 205
+            self.match(TyCParser.SEMI)
+            self.state = 207
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012368269320) != 0):
+                self.state = 206
+                self.expr()
+
+
+            self.state = 209
+            self.match(TyCParser.SEMI)
+            self.state = 211
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012368269320) != 0):
+                self.state = 210
+                self.forUpdate()
+
+
+            self.state = 213
+            self.match(TyCParser.RPAREN)
+            self.state = 214
+            self.stmt()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def lhs(self):
+            return self.getTypedRuleContext(TyCParser.LhsContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forInit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInit" ):
+                return visitor.visitForInit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forInit(self):
+
+        localctx = TyCParser.ForInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_forInit)
+        try:
+            self.state = 229
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 216
+                self.type_()
+                self.state = 217
+                self.match(TyCParser.ID)
+                self.state = 218
+                self.match(TyCParser.ASSIGN)
+                self.state = 219
+                self.expr()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 221
+                self.match(TyCParser.AUTO)
+                self.state = 222
+                self.match(TyCParser.ID)
+                self.state = 223
+                self.match(TyCParser.ASSIGN)
+                self.state = 224
+                self.expr()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 225
+                self.lhs()
+                self.state = 226
+                self.match(TyCParser.ASSIGN)
+                self.state = 227
+                self.expr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForUpdateContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lhs(self):
+            return self.getTypedRuleContext(TyCParser.LhsContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def unaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.UnaryExprContext,0)
+
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(TyCParser.PostfixExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forUpdate
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForUpdate" ):
+                return visitor.visitForUpdate(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forUpdate(self):
+
+        localctx = TyCParser.ForUpdateContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_forUpdate)
+        try:
+            self.state = 237
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 231
+                self.lhs()
+                self.state = 232
+                self.match(TyCParser.ASSIGN)
+                self.state = 233
+                self.expr()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 235
+                self.unaryExpr()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 236
+                self.postfixExpr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SWITCH(self):
+            return self.getToken(TyCParser.SWITCH, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def switchCase(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.SwitchCaseContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.SwitchCaseContext,i)
+
+
+        def defaultCase(self):
+            return self.getTypedRuleContext(TyCParser.DefaultCaseContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchStmt" ):
+                return visitor.visitSwitchStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchStmt(self):
+
+        localctx = TyCParser.SwitchStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_switchStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 239
+            self.match(TyCParser.SWITCH)
+            self.state = 240
+            self.match(TyCParser.LPAREN)
+            self.state = 241
+            self.expr()
+            self.state = 242
+            self.match(TyCParser.RPAREN)
+            self.state = 243
+            self.match(TyCParser.LBRACE)
+            self.state = 247
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 244
+                    self.switchCase() 
+                self.state = 249
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+
+            self.state = 251
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==17:
+                self.state = 250
+                self.defaultCase()
+
+
+            self.state = 256
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==15:
+                self.state = 253
+                self.switchCase()
+                self.state = 258
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 259
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchCaseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CASE(self):
+            return self.getToken(TyCParser.CASE, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def varDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.VarDeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.VarDeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchCase
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchCase" ):
+                return visitor.visitSwitchCase(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchCase(self):
+
+        localctx = TyCParser.SwitchCaseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_switchCase)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 261
+            self.match(TyCParser.CASE)
+            self.state = 262
+            self.expr()
+            self.state = 263
+            self.match(TyCParser.COLON)
+            self.state = 268
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012397190952) != 0):
+                self.state = 266
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
+                if la_ == 1:
+                    self.state = 264
+                    self.stmt()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 265
+                    self.varDecl()
+                    pass
+
+
+                self.state = 270
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefaultCaseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DEFAULT(self):
+            return self.getToken(TyCParser.DEFAULT, 0)
+
+        def COLON(self):
+            return self.getToken(TyCParser.COLON, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def varDecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.VarDeclContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.VarDeclContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_defaultCase
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefaultCase" ):
+                return visitor.visitDefaultCase(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def defaultCase(self):
+
+        localctx = TyCParser.DefaultCaseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_defaultCase)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 271
+            self.match(TyCParser.DEFAULT)
+            self.state = 272
+            self.match(TyCParser.COLON)
+            self.state = 277
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012397190952) != 0):
+                self.state = 275
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+                if la_ == 1:
+                    self.state = 273
+                    self.stmt()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 274
+                    self.varDecl()
+                    pass
+
+
+                self.state = 279
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(TyCParser.BREAK, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_breakStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakStmt" ):
+                return visitor.visitBreakStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakStmt(self):
+
+        localctx = TyCParser.BreakStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_breakStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 280
+            self.match(TyCParser.BREAK)
+            self.state = 281
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinueStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CONTINUE(self):
+            return self.getToken(TyCParser.CONTINUE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_continueStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinueStmt" ):
+                return visitor.visitContinueStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continueStmt(self):
+
+        localctx = TyCParser.ContinueStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_continueStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 283
+            self.match(TyCParser.CONTINUE)
+            self.state = 284
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnStmt" ):
+                return visitor.visitReturnStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnStmt(self):
+
+        localctx = TyCParser.ReturnStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_returnStmt)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 286
+            self.match(TyCParser.RETURN)
+            self.state = 288
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012368269320) != 0):
+                self.state = 287
+                self.expr()
+
+
+            self.state = 290
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnVoidStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_returnVoidStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnVoidStmt" ):
+                return visitor.visitReturnVoidStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnVoidStmt(self):
+
+        localctx = TyCParser.ReturnVoidStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_returnVoidStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 292
+            self.match(TyCParser.RETURN)
+            self.state = 293
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_exprStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprStmt" ):
+                return visitor.visitExprStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprStmt(self):
+
+        localctx = TyCParser.ExprStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_exprStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 295
+            self.expr()
+            self.state = 296
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lhs(self):
+            return self.getTypedRuleContext(TyCParser.LhsContext,0)
+
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def opExpr(self):
+            return self.getTypedRuleContext(TyCParser.OpExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = TyCParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_expr)
+        try:
+            self.state = 303
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 298
+                self.lhs()
+                self.state = 299
+                self.match(TyCParser.ASSIGN)
+                self.state = 300
+                self.expr()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 302
+                self.opExpr(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OpExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_opExpr
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class LogicalOrExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def OR(self):
+            return self.getToken(TyCParser.OR, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalOrExpr" ):
+                return visitor.visitLogicalOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class PrefixExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self):
+            return self.getTypedRuleContext(TyCParser.OpExprContext,0)
+
+        def NOT(self):
+            return self.getToken(TyCParser.NOT, 0)
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrefixExpr" ):
+                return visitor.visitPrefixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class LogicalAndExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def AND(self):
+            return self.getToken(TyCParser.AND, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalAndExpr" ):
+                return visitor.visitLogicalAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class OperandExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(TyCParser.PostfixExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperandExpr" ):
+                return visitor.visitOperandExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AdditiveExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdditiveExpr" ):
+                return visitor.visitAdditiveExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class RelationalExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def LT(self):
+            return self.getToken(TyCParser.LT, 0)
+        def GT(self):
+            return self.getToken(TyCParser.GT, 0)
+        def LE(self):
+            return self.getToken(TyCParser.LE, 0)
+        def GE(self):
+            return self.getToken(TyCParser.GE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalExpr" ):
+                return visitor.visitRelationalExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class MultiplicativeExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def MUL(self):
+            return self.getToken(TyCParser.MUL, 0)
+        def DIV(self):
+            return self.getToken(TyCParser.DIV, 0)
+        def MOD(self):
+            return self.getToken(TyCParser.MOD, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMultiplicativeExpr" ):
+                return visitor.visitMultiplicativeExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class EqualityExprContext(OpExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.OpExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def opExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OpExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OpExprContext,i)
+
+        def EQ(self):
+            return self.getToken(TyCParser.EQ, 0)
+        def NEQ(self):
+            return self.getToken(TyCParser.NEQ, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitEqualityExpr" ):
+                return visitor.visitEqualityExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def opExpr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = TyCParser.OpExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 56
+        self.enterRecursionRule(localctx, 56, self.RULE_opExpr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 309
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [31, 32, 36, 37, 41]:
+                localctx = TyCParser.PrefixExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 306
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2411624136704) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 307
+                self.opExpr(8)
+                pass
+            elif token in [3, 43, 44, 47, 48]:
+                localctx = TyCParser.OperandExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 308
+                self.postfixExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 331
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 329
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
+                    if la_ == 1:
+                        localctx = TyCParser.MultiplicativeExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 311
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 312
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1924145348608) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 313
+                        self.opExpr(8)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = TyCParser.AdditiveExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 314
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 315
+                        _la = self._input.LA(1)
+                        if not(_la==36 or _la==37):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 316
+                        self.opExpr(7)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = TyCParser.RelationalExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 317
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 318
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 51942260736) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 319
+                        self.opExpr(6)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = TyCParser.EqualityExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 320
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 321
+                        _la = self._input.LA(1)
+                        if not(_la==25 or _la==26):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 322
+                        self.opExpr(5)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = TyCParser.LogicalAndExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 323
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 324
+                        self.match(TyCParser.AND)
+                        self.state = 325
+                        self.opExpr(4)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = TyCParser.LogicalOrExprContext(self, TyCParser.OpExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_opExpr)
+                        self.state = 326
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 327
+                        self.match(TyCParser.OR)
+                        self.state = 328
+                        self.opExpr(3)
+                        pass
+
+             
+                self.state = 333
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class UnaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.UnaryExprContext,0)
+
+
+        def NOT(self):
+            return self.getToken(TyCParser.NOT, 0)
+
+        def PLUS(self):
+            return self.getToken(TyCParser.PLUS, 0)
+
+        def MINUS(self):
+            return self.getToken(TyCParser.MINUS, 0)
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def postfixExpr(self):
+            return self.getTypedRuleContext(TyCParser.PostfixExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_unaryExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unaryExpr(self):
+
+        localctx = TyCParser.UnaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 58, self.RULE_unaryExpr)
+        self._la = 0 # Token type
+        try:
+            self.state = 337
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [31, 32, 36, 37, 41]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 334
+                _la = self._input.LA(1)
+                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2411624136704) != 0)):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 335
+                self.unaryExpr()
+                pass
+            elif token in [3, 43, 44, 47, 48]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 336
+                self.postfixExpr()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def primaryExpr(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryExprContext,0)
+
+
+        def postfixPart(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.PostfixPartContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.PostfixPartContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixExpr" ):
+                return visitor.visitPostfixExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixExpr(self):
+
+        localctx = TyCParser.PostfixExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_postfixExpr)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 339
+            self.primaryExpr()
+            self.state = 343
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,34,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 340
+                    self.postfixPart() 
+                self.state = 345
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,34,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixPartContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def memberAccess(self):
+            return self.getTypedRuleContext(TyCParser.MemberAccessContext,0)
+
+
+        def funcCall(self):
+            return self.getTypedRuleContext(TyCParser.FuncCallContext,0)
+
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixPart
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixPart" ):
+                return visitor.visitPostfixPart(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixPart(self):
+
+        localctx = TyCParser.PostfixPartContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_postfixPart)
+        try:
+            self.state = 350
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [42]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 346
+                self.memberAccess()
+                pass
+            elif token in [3]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 347
+                self.funcCall()
+                pass
+            elif token in [31]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 348
+                self.match(TyCParser.INC)
+                pass
+            elif token in [32]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 349
+                self.match(TyCParser.DEC)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FuncCallContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def argList(self):
+            return self.getTypedRuleContext(TyCParser.ArgListContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_funcCall
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFuncCall" ):
+                return visitor.visitFuncCall(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def funcCall(self):
+
+        localctx = TyCParser.FuncCallContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 64, self.RULE_funcCall)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 352
+            self.match(TyCParser.LPAREN)
+            self.state = 354
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 451012368269320) != 0):
+                self.state = 353
+                self.argList()
+
+
+            self.state = 356
+            self.match(TyCParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_argList
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgList" ):
+                return visitor.visitArgList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def argList(self):
+
+        localctx = TyCParser.ArgListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 66, self.RULE_argList)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 358
+            self.expr()
+            self.state = 363
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==2:
+                self.state = 359
+                self.match(TyCParser.COMMA)
+                self.state = 360
+                self.expr()
+                self.state = 365
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberAccessContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(TyCParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_memberAccess
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberAccess" ):
+                return visitor.visitMemberAccess(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memberAccess(self):
+
+        localctx = TyCParser.MemberAccessContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_memberAccess)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 366
+            self.match(TyCParser.DOT)
+            self.state = 367
+            self.match(TyCParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def INTLIT(self):
+            return self.getToken(TyCParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(TyCParser.FLOATLIT, 0)
+
+        def STRINGLIT(self):
+            return self.getToken(TyCParser.STRINGLIT, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primaryExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimaryExpr" ):
+                return visitor.visitPrimaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primaryExpr(self):
+
+        localctx = TyCParser.PrimaryExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_primaryExpr)
+        try:
+            self.state = 377
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [48]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 369
+                self.match(TyCParser.ID)
+                pass
+            elif token in [44]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 370
+                self.match(TyCParser.INTLIT)
+                pass
+            elif token in [43]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 371
+                self.match(TyCParser.FLOATLIT)
+                pass
+            elif token in [47]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 372
+                self.match(TyCParser.STRINGLIT)
+                pass
+            elif token in [3]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 373
+                self.match(TyCParser.LPAREN)
+                self.state = 374
+                self.expr()
+                self.state = 375
+                self.match(TyCParser.RPAREN)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[28] = self.opExpr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def opExpr_sempred(self, localctx:OpExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 2)
+         
+
+
+
+
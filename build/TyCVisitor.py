@@ -0,0 +1,228 @@
+# Generated from TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .TyCParser import TyCParser
+else:
+    from TyCParser import TyCParser
+
+# This class defines a complete generic visitor for a parse tree produced by TyCParser.
+
+class TyCVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by TyCParser#program.
+    def visitProgram(self, ctx:TyCParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#decl.
+    def visitDecl(self, ctx:TyCParser.DeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structDecl.
+    def visitStructDecl(self, ctx:TyCParser.StructDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structVar.
+    def visitStructVar(self, ctx:TyCParser.StructVarContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDecl.
+    def visitVarDecl(self, ctx:TyCParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#mainDecl.
+    def visitMainDecl(self, ctx:TyCParser.MainDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#funcDecl.
+    def visitFuncDecl(self, ctx:TyCParser.FuncDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnType.
+    def visitReturnType(self, ctx:TyCParser.ReturnTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#paramList.
+    def visitParamList(self, ctx:TyCParser.ParamListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#param.
+    def visitParam(self, ctx:TyCParser.ParamContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#type.
+    def visitType(self, ctx:TyCParser.TypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#block.
+    def visitBlock(self, ctx:TyCParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stmt.
+    def visitStmt(self, ctx:TyCParser.StmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#lhs.
+    def visitLhs(self, ctx:TyCParser.LhsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#ifStmt.
+    def visitIfStmt(self, ctx:TyCParser.IfStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#whileStmt.
+    def visitWhileStmt(self, ctx:TyCParser.WhileStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forStmt.
+    def visitForStmt(self, ctx:TyCParser.ForStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forInit.
+    def visitForInit(self, ctx:TyCParser.ForInitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forUpdate.
+    def visitForUpdate(self, ctx:TyCParser.ForUpdateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchStmt.
+    def visitSwitchStmt(self, ctx:TyCParser.SwitchStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchCase.
+    def visitSwitchCase(self, ctx:TyCParser.SwitchCaseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#defaultCase.
+    def visitDefaultCase(self, ctx:TyCParser.DefaultCaseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#breakStmt.
+    def visitBreakStmt(self, ctx:TyCParser.BreakStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#continueStmt.
+    def visitContinueStmt(self, ctx:TyCParser.ContinueStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnStmt.
+    def visitReturnStmt(self, ctx:TyCParser.ReturnStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#returnVoidStmt.
+    def visitReturnVoidStmt(self, ctx:TyCParser.ReturnVoidStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#exprStmt.
+    def visitExprStmt(self, ctx:TyCParser.ExprStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#expr.
+    def visitExpr(self, ctx:TyCParser.ExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#logicalOrExpr.
+    def visitLogicalOrExpr(self, ctx:TyCParser.LogicalOrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#prefixExpr.
+    def visitPrefixExpr(self, ctx:TyCParser.PrefixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#logicalAndExpr.
+    def visitLogicalAndExpr(self, ctx:TyCParser.LogicalAndExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#operandExpr.
+    def visitOperandExpr(self, ctx:TyCParser.OperandExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#additiveExpr.
+    def visitAdditiveExpr(self, ctx:TyCParser.AdditiveExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#relationalExpr.
+    def visitRelationalExpr(self, ctx:TyCParser.RelationalExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#multiplicativeExpr.
+    def visitMultiplicativeExpr(self, ctx:TyCParser.MultiplicativeExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#equalityExpr.
+    def visitEqualityExpr(self, ctx:TyCParser.EqualityExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#unaryExpr.
+    def visitUnaryExpr(self, ctx:TyCParser.UnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixExpr.
+    def visitPostfixExpr(self, ctx:TyCParser.PostfixExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixPart.
+    def visitPostfixPart(self, ctx:TyCParser.PostfixPartContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#funcCall.
+    def visitFuncCall(self, ctx:TyCParser.FuncCallContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#argList.
+    def visitArgList(self, ctx:TyCParser.ArgListContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#memberAccess.
+    def visitMemberAccess(self, ctx:TyCParser.MemberAccessContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#primaryExpr.
+    def visitPrimaryExpr(self, ctx:TyCParser.PrimaryExprContext):
+        return self.visitChildren(ctx)
+
+
+
+del TyCParser
\ No newline at end of file
@@ -0,0 +1,40 @@
+class LexerError(Exception):
+    def __str__(self):
+        return self.message
+
+
+class ErrorToken(LexerError):
+    def __init__(self, s):
+        self.message = "Error Token " + s
+
+
+class UncloseString(LexerError):
+    def __init__(self, s):
+        self.message = "Unclosed String: " + s
+
+
+class IllegalEscape(LexerError):
+    def __init__(self, s):
+        self.message = "Illegal Escape In String: " + s
+
+
+class LexerDiagnostic:
+    """A lexical error recorded by a lexer in recovering mode instead of raised."""
+
+    def __init__(self, error, token):
+        self.error = error
+        self.type = token.type
+        self.line = token.line
+        self.column = token.column
+        self.start = token.start
+        self.stop = token.stop
+
+    @property
+    def message(self):
+        return str(self.error)
+
+    def __str__(self):
+        return f"Error on line {self.line} col {self.column}: {self.error}"
+
+    def __repr__(self):
+        return f"LexerDiagnostic({self})"
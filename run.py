@@ -13,6 +13,9 @@ Usage:
     python run.py test-lexer
     python run.py test-parser
     python run.py test-ast
+    python run.py tokens FILE [--output OUT]
+    python run.py profile-parser FILES [--json OUT]
+    python run.py check-syntax FILES [--max-errors N]
     python run.py clean
 
     # On macOS/Linux:
@@ -22,6 +25,9 @@ Usage:
     python3 run.py test-lexer
     python3 run.py test-parser
     python3 run.py test-ast
+    python3 run.py tokens FILE [--output OUT]
+    python3 run.py profile-parser FILES [--json OUT]
+    python3 run.py check-syntax FILES [--max-errors N]
     python3 run.py clean
 """
 
@@ -94,7 +100,7 @@ class TyCBuilder:
             self.venv_python3 = self.venv_dir / "bin" / "python"
             self.venv_pip = self.venv_dir / "bin" / "pip"
 
-    def run_command(self, cmd, cwd=None, check=True, capture_output=False):
+    def run_command(self, cmd, cwd=None, check=True, capture_output=False, env=None):
         """Run a shell command."""
         try:
             if isinstance(cmd, str):
@@ -105,6 +111,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             else:
                 result = subprocess.run(
@@ -113,6 +120,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             return result
         except subprocess.CalledProcessError as e:
@@ -196,6 +204,23 @@ class TyCBuilder:
             )
         )
         print()
+        print(self.colors.green("Tools:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py tokens FILE [--output OUT] - Stream the tokens of a source file"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py profile-parser FILES [--json OUT] - Profile parser decisions"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py check-syntax FILES [--max-errors N] - Report every syntax error"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -348,6 +373,41 @@ class TyCBuilder:
 
         print(self.colors.green("ANTLR grammar files compiled to build/"))
 
+    def run_tool(self, module, args):
+        """Run a src module's command line with the given arguments and exit.
+
+        The module runs from the caller's working directory, with the project
+        root on PYTHONPATH, so relative file paths mean what they did on the
+        run.py command line.
+        """
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        python = self.venv_python3 if self.venv_python3.exists() else Path(sys.executable)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(self.root_dir), env.get("PYTHONPATH")])
+        )
+        result = self.run_command(
+            [str(python), "-m", module] + args, cwd=Path.cwd(), check=False, env=env
+        )
+        sys.exit(result.returncode)
+
+    def stream_tokens(self, args):
+        """Stream the tokens of a TyC source file (see src/lexer/streaming.py)."""
+        self.run_tool("src.lexer.streaming", args)
+
+    def profile_parser(self, args):
+        """Profile parser prediction decisions (see src/parser/profiler.py)."""
+        self.run_tool("src.parser.profiler", args)
+
+    def check_syntax(self, args):
+        """Report every syntax error of source files (see src/parser/recovery.py)."""
+        self.run_tool("src.parser.recovery", args)
+
     def clean_cache(self):
         """Clean Python cache files."""
         print(self.colors.yellow("Cleaning Python cache files..."))
@@ -501,27 +561,32 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
-    parser.add_argument(
-        "command",
-        nargs="?",
-        default="help",
-        choices=[
-            "help",
-            "check",
-            "setup",
-            "build",
-            "clean",
-            "clean-cache",
-            "clean-reports",
-            "clean-venv",
-            "test-lexer",
-            "test-parser",
-            "test-ast",
-        ],
-        help="Command to execute",
+    subparsers = parser.add_subparsers(
+        dest="command", metavar="command", help="Command to execute"
     )
+    for name in [
+        "help",
+        "check",
+        "setup",
+        "build",
+        "clean",
+        "clean-cache",
+        "clean-reports",
+        "clean-venv",
+        "test-lexer",
+        "test-parser",
+        "test-ast",
+    ]:
+        subparsers.add_parser(name)
+    # Commands that hand everything after their name to a src module's own
+    # command line. No prefix characters, so options such as --help reach
+    # the module instead of being parsed here.
+    for name in ["tokens", "profile-parser", "check-syntax"]:
+        tool = subparsers.add_parser(name, add_help=False, prefix_chars="\0")
+        tool.add_argument("args", nargs=argparse.REMAINDER)
 
     args = parser.parse_args()
+    command = args.command or "help"
 
     builder = TyCBuilder()
 
@@ -537,12 +602,15 @@ def main():
         "test-lexer": builder.test_lexer,
         "test-parser": builder.test_parser,
         "test-ast": builder.test_ast,
+        "tokens": lambda: builder.stream_tokens(args.args),
+        "profile-parser": lambda: builder.profile_parser(args.args),
+        "check-syntax": lambda: builder.check_syntax(args.args),
     }
 
-    if args.command in commands:
-        commands[args.command]()
+    if command in commands:
+        commands[command]()
     else:
-        print(f"Unknown command: {args.command}")
+        print(f"Unknown command: {command}")
         builder.show_help()
         sys.exit(1)
 
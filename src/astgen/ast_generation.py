@@ -4,13 +4,257 @@ This module contains the ASTGeneration class that converts parse trees
 into Abstract Syntax Trees using the visitor pattern.
 """
 
-from functools import reduce
 from build.TyCVisitor import TyCVisitor
 from build.TyCParser import TyCParser
 from src.utils.nodes import *
 
+# The opExpr alternatives that _binary builds
+_BINARY_CONTEXTS = (
+    TyCParser.MultiplicativeExprContext,
+    TyCParser.AdditiveExprContext,
+    TyCParser.RelationalExprContext,
+    TyCParser.EqualityExprContext,
+    TyCParser.LogicalAndExprContext,
+    TyCParser.LogicalOrExprContext,
+)
+
 
 class ASTGeneration(TyCVisitor):
-    """AST Generation visitor for TyC language."""
+    """AST Generation visitor for TyC language.
+
+    With a LeafTable, identifiers and literals are hash-consed: every
+    occurrence of a name or value shares one node.
+    """
+
+    def __init__(self, leaves: LeafTable = None):
+        self.leaves = leaves
+
+    # ========================================================================
+    # Program and declarations
+    # ========================================================================
+
+    def visitProgram(self, ctx: TyCParser.ProgramContext):
+        return Program([self.visit(d) for d in ctx.decl()])
+
+    def visitDecl(self, ctx: TyCParser.DeclContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitStructDecl(self, ctx: TyCParser.StructDeclContext):
+        return StructDecl(ctx.ID().getText(), [self.visit(v) for v in ctx.structVar()])
+
+    def visitStructVar(self, ctx: TyCParser.StructVarContext):
+        return MemberDecl(self.visit(ctx.type_()), ctx.ID().getText())
+
+    def visitVarDecl(self, ctx: TyCParser.VarDeclContext):
+        var_type = None if ctx.AUTO() else self.visit(ctx.type_())
+        init_value = self._expr(ctx.expr()) if ctx.expr() else None
+        return VarDecl(var_type, ctx.ID().getText(), init_value)
+
+    def visitMainDecl(self, ctx: TyCParser.MainDeclContext):
+        return FuncDecl(VoidType(), ctx.MAIN().getText(), [], self.visit(ctx.block()))
+
+    def visitFuncDecl(self, ctx: TyCParser.FuncDeclContext):
+        return_type = self.visit(ctx.returnType()) if ctx.returnType() else None
+        params = self.visit(ctx.paramList()) if ctx.paramList() else []
+        return FuncDecl(return_type, ctx.ID().getText(), params, self.visit(ctx.block()))
+
+    def visitReturnType(self, ctx: TyCParser.ReturnTypeContext):
+        return VoidType() if ctx.VOID() else self.visit(ctx.type_())
+
+    def visitParamList(self, ctx: TyCParser.ParamListContext):
+        return [self.visit(p) for p in ctx.param()]
+
+    def visitParam(self, ctx: TyCParser.ParamContext):
+        return Param(self.visit(ctx.type_()), ctx.ID().getText())
+
+    def visitType(self, ctx: TyCParser.TypeContext):
+        if ctx.INT():
+            return IntType()
+        if ctx.FLOAT():
+            return FloatType()
+        if ctx.STRING():
+            return StringType()
+        return StructType(ctx.ID().getText())
+
+    # ========================================================================
+    # Statements
+    # ========================================================================
+
+    def visitBlock(self, ctx: TyCParser.BlockContext):
+        # varDecl and stmt children interleave; keep source order
+        return BlockStmt([self.visit(c) for c in ctx.children[1:-1]])
+
+    def visitStmt(self, ctx: TyCParser.StmtContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitIfStmt(self, ctx: TyCParser.IfStmtContext):
+        else_stmt = self.visit(ctx.stmt(1)) if ctx.ELSE() else None
+        return IfStmt(self._expr(ctx.expr()), self.visit(ctx.stmt(0)), else_stmt)
+
+    def visitWhileStmt(self, ctx: TyCParser.WhileStmtContext):
+        return WhileStmt(self._expr(ctx.expr()), self.visit(ctx.stmt()))
+
+    def visitForStmt(self, ctx: TyCParser.ForStmtContext):
+        init = self.visit(ctx.forInit()) if ctx.forInit() else None
+        condition = self._expr(ctx.expr()) if ctx.expr() else None
+        update = self.visit(ctx.forUpdate()) if ctx.forUpdate() else None
+        return ForStmt(init, condition, update, self.visit(ctx.stmt()))
+
+    def visitForInit(self, ctx: TyCParser.ForInitContext):
+        if ctx.lhs():
+            return ExprStmt(AssignExpr(self.visit(ctx.lhs()), self._expr(ctx.expr())))
+        var_type = None if ctx.AUTO() else self.visit(ctx.type_())
+        return VarDecl(var_type, ctx.ID().getText(), self._expr(ctx.expr()))
+
+    def visitForUpdate(self, ctx: TyCParser.ForUpdateContext):
+        if ctx.lhs():
+            return AssignExpr(self.visit(ctx.lhs()), self._expr(ctx.expr()))
+        return self.visit(ctx.getChild(0))
+
+    def visitSwitchStmt(self, ctx: TyCParser.SwitchStmtContext):
+        cases = [self.visit(c) for c in ctx.switchCase()]
+        default_case = self.visit(ctx.defaultCase()) if ctx.defaultCase() else None
+        return SwitchStmt(self._expr(ctx.expr()), cases, default_case)
+
+    def visitSwitchCase(self, ctx: TyCParser.SwitchCaseContext):
+        return CaseStmt(self._expr(ctx.expr()), [self.visit(c) for c in ctx.children[3:]])
+
+    def visitDefaultCase(self, ctx: TyCParser.DefaultCaseContext):
+        return DefaultStmt([self.visit(c) for c in ctx.children[2:]])
+
+    def visitBreakStmt(self, ctx: TyCParser.BreakStmtContext):
+        return BreakStmt()
+
+    def visitContinueStmt(self, ctx: TyCParser.ContinueStmtContext):
+        return ContinueStmt()
+
+    def visitReturnStmt(self, ctx: TyCParser.ReturnStmtContext):
+        return ReturnStmt(self._expr(ctx.expr()) if ctx.expr() else None)
+
+    def visitExprStmt(self, ctx: TyCParser.ExprStmtContext):
+        return ExprStmt(self._expr(ctx.expr()))
+
+    # ========================================================================
+    # Expressions
+    # ========================================================================
+
+    def _expr(self, ctx):
+        """The AST of an expr, opExpr, postfixExpr or primaryExpr context.
+
+        Most expressions are a bare operand: an identifier or literal under
+        expr, operandExpr, postfixExpr and primaryExpr contexts that each have
+        a single child. Those levels, and parentheses, are stepped through in
+        a loop down to the leaf instead of with a visitor dispatch per level.
+        """
+        while True:
+            cls = type(ctx)
+            if cls is TyCParser.ExprContext:
+                if ctx.getChildCount() == 1:
+                    ctx = ctx.getChild(0)
+                    continue
+                return AssignExpr(self.visit(ctx.getChild(0)), self._expr(ctx.getChild(2)))
+            if cls is TyCParser.OperandExprContext:
+                ctx = ctx.getChild(0)
+            elif cls is TyCParser.PostfixExprContext:
+                if ctx.getChildCount() > 1:
+                    return self._postfix(ctx.primaryExpr(), ctx.postfixPart())
+                ctx = ctx.getChild(0)
+            elif cls is TyCParser.PrimaryExprContext:
+                if ctx.getChildCount() == 1:
+                    return self._leaf(ctx.getChild(0).symbol)
+                ctx = ctx.getChild(1)
+            else:
+                return ctx.accept(self)
+
+    def _leaf(self, token):
+        if token.type == TyCParser.ID:
+            cls, value = Identifier, token.text
+        elif token.type == TyCParser.INTLIT:
+            cls, value = IntLiteral, int(token.text)
+        elif token.type == TyCParser.FLOATLIT:
+            cls, value = FloatLiteral, float(token.text)
+        else:
+            cls, value = StringLiteral, token.text
+        if self.leaves is None:
+            return cls(value)
+        return self.leaves.leaf(cls, value)
+
+    def visitExpr(self, ctx: TyCParser.ExprContext):
+        return self._expr(ctx)
+
+    def visitLhs(self, ctx: TyCParser.LhsContext):
+        if ctx.ID():
+            return self._leaf(ctx.ID().symbol)
+        obj = self._postfix(ctx.primaryExpr(), ctx.postfixPart())
+        return MemberAccess(obj, ctx.memberAccess().ID().getText())
+
+    def visitPrefixExpr(self, ctx: TyCParser.PrefixExprContext):
+        return PrefixOp(ctx.getChild(0).getText(), self._expr(ctx.opExpr()))
+
+    def _binary(self, ctx):
+        """Build operand op operand; the left-recursive rule nests by precedence.
+
+        A chain like a + b - c nests its left operands, so they are collected
+        in a loop and folded from the innermost one, rather than recursing
+        once per operator.
+        """
+        spine = []
+        while isinstance(ctx, _BINARY_CONTEXTS):
+            spine.append(ctx)
+            ctx = ctx.opExpr(0)
+        expr = self._expr(ctx)
+        for ctx in reversed(spine):
+            expr = BinaryOp(expr, ctx.getChild(1).getText(), self._expr(ctx.getChild(2)))
+        return expr
+
+    def visitMultiplicativeExpr(self, ctx: TyCParser.MultiplicativeExprContext):
+        return self._binary(ctx)
+
+    def visitAdditiveExpr(self, ctx: TyCParser.AdditiveExprContext):
+        return self._binary(ctx)
+
+    def visitRelationalExpr(self, ctx: TyCParser.RelationalExprContext):
+        return self._binary(ctx)
+
+    def visitEqualityExpr(self, ctx: TyCParser.EqualityExprContext):
+        return self._binary(ctx)
+
+    def visitLogicalAndExpr(self, ctx: TyCParser.LogicalAndExprContext):
+        return self._binary(ctx)
+
+    def visitLogicalOrExpr(self, ctx: TyCParser.LogicalOrExprContext):
+        return self._binary(ctx)
+
+    def visitOperandExpr(self, ctx: TyCParser.OperandExprContext):
+        return self._expr(ctx)
+
+    def visitUnaryExpr(self, ctx: TyCParser.UnaryExprContext):
+        if ctx.postfixExpr():
+            return self._expr(ctx.postfixExpr())
+        return PrefixOp(ctx.getChild(0).getText(), self.visit(ctx.unaryExpr()))
+
+    def visitPostfixExpr(self, ctx: TyCParser.PostfixExprContext):
+        return self._expr(ctx)
+
+    def _postfix(self, primary, parts):
+        """Apply postfix parts to a primary expression, left to right."""
+        expr = self._expr(primary)
+        for part in parts:
+            if part.memberAccess():
+                expr = MemberAccess(expr, part.memberAccess().ID().getText())
+            elif part.funcCall():
+                # A call of a plain name keeps the name; other callees keep the expression
+                callee = expr.name if isinstance(expr, Identifier) else expr
+                expr = FuncCall(callee, self.visit(part.funcCall()))
+            else:
+                expr = PostfixOp(part.getText(), expr)
+        return expr
+
+    def visitFuncCall(self, ctx: TyCParser.FuncCallContext):
+        return self.visit(ctx.argList()) if ctx.argList() else []
+
+    def visitArgList(self, ctx: TyCParser.ArgListContext):
+        return [self._expr(e) for e in ctx.expr()]
 
-    pass
+    def visitPrimaryExpr(self, ctx: TyCParser.PrimaryExprContext):
+        return self._expr(ctx)
@@ -7,6 +7,15 @@ from lexererr import *
 }
 
 @lexer::members {
+# Set to a list to record lexical errors there instead of raising them
+diagnostics = None
+
+def reportError(self, error, token):
+    if self.diagnostics is None:
+        raise error
+    self.diagnostics.append(LexerDiagnostic(error, token))
+    return token
+
 def emit(self):
     tk = self.type
     # Logic to satisfy "String Token Processing" requirements
@@ -18,15 +27,15 @@ def emit(self):
         # Remove opening quote, keep content for error message
         self.text = self.text[1:]
         result = super().emit()
-        raise UncloseString(result.text)
+        return self.reportError(UncloseString(result.text), result)
     elif tk == self.ILLEGAL_ESCAPE:
         # Remove opening quote, keep content for error message
         self.text = self.text[1:]
         result = super().emit()
-        raise IllegalEscape(result.text)
+        return self.reportError(IllegalEscape(result.text), result)
     elif tk == self.ERROR_CHAR:
         result = super().emit()
-        raise ErrorToken(result.text) 
+        return self.reportError(ErrorToken(result.text), result)
     else:
         return super().emit()
 }
@@ -111,9 +120,12 @@ stmt
 //     : lhs ASSIGN expr SEMI
 //     ;
 
+// An assignable expression: a bare ID or a postfix chain ending in a member
+// access. Written without overlapping alternatives so each choice needs at
+// most three tokens of lookahead ('.' ID '=' ends the chain).
 lhs
-    : ID (memberAccess)*
-    | postfixExpr memberAccess+
+    : ID
+    | primaryExpr postfixPart* memberAccess
     ;
 
 ifStmt
@@ -177,36 +189,21 @@ exprStmt
 ======================= */
 
 expr
-    : assignExpr
-    ;
-
-assignExpr
-    : lhs ASSIGN assignExpr
-    | logicalOrExpr
-    ;
-
-logicalOrExpr
-    : logicalAndExpr (OR logicalAndExpr)*
-    ;
-
-logicalAndExpr
-    : equalityExpr (AND equalityExpr)*
-    ;
-
-equalityExpr
-    : relationalExpr ((EQ | NEQ) relationalExpr)*
-    ;
-
-relationalExpr
-    : additiveExpr ((LT | GT | LE | GE) additiveExpr)*
-    ;
-
-additiveExpr
-    : multiplicativeExpr ((PLUS | MINUS) multiplicativeExpr)*
-    ;
-
-multiplicativeExpr
-    : unaryExpr ((MUL | DIV | MOD) unaryExpr)*
+    : lhs ASSIGN expr
+    | opExpr
+    ;
+
+// Prefix and binary operators in one left-recursive rule, tightest first.
+// Every binary level is left-associative.
+opExpr
+    : (NOT | PLUS | MINUS | INC | DEC) opExpr       # prefixExpr
+    | opExpr (MUL | DIV | MOD) opExpr               # multiplicativeExpr
+    | opExpr (PLUS | MINUS) opExpr                  # additiveExpr
+    | opExpr (LT | GT | LE | GE) opExpr             # relationalExpr
+    | opExpr (EQ | NEQ) opExpr                      # equalityExpr
+    | opExpr AND opExpr                             # logicalAndExpr
+    | opExpr OR opExpr                              # logicalOrExpr
+    | postfixExpr                                   # operandExpr
     ;
 
 unaryExpr
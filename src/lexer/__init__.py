@@ -0,0 +1,3 @@
+"""
+Lexer backends and token utilities for TyC language
+"""
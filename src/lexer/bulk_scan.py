@@ -0,0 +1,148 @@
+"""
+Bulk scanning fast path for the ANTLR-generated TyC lexer.
+TyCLexer matches every character of a block comment, whitespace run or string
+body through the lexer ATN simulator. This module contains the BulkScanLexer
+class, a TyCLexer that skips whitespace and comments with native string
+search and matches string literals with one regular expression before
+falling back to the generated lexer for every other token. Token boundaries,
+positions, text and lexer errors are identical to TyCLexer.
+"""
+
+import mmap
+import re
+
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+
+_WS = frozenset(b" \t\f\r\n")
+_SLASH, _STAR, _QUOTE, _BACKSLASH, _CR, _LF = b'/*"\\\r\n'
+
+
+def _patterns(kind):
+    """Search patterns for str buffers (kind=str) or bytes-like ones (bytes)."""
+    encode = (lambda s: s) if kind is str else (lambda s: s.encode("ascii"))
+    return {
+        "ws": re.compile(encode(r"[ \t\f\r\n]+")),
+        "line_comment": re.compile(encode(r"//[^\r\n]*")),
+        "string_body": re.compile(encode(r'[^"\\\r\n]*(?:\\[btnfr"\\][^"\\\r\n]*)*')),
+        "close": encode("*/"),
+        "newline": encode("\n"),
+    }
+
+
+_PATTERNS = {str: _patterns(str), bytes: _patterns(bytes)}
+
+
+def _searchable(input):
+    """The buffer of input that native search can run on, or None.
+
+    Plain InputStreams keep the source str; CompactInputStream (Latin-1) and
+    MappedFileStream keep one byte per code point. Wider code points are
+    stored as array('I'), which has no search methods.
+    """
+    strdata = getattr(input, "strdata", None)
+    if isinstance(strdata, str):
+        return strdata
+    data = getattr(input, "data", None)
+    if isinstance(data, (bytes, mmap.mmap)):
+        return data
+    return None
+
+
+class BulkScanLexer(TyCLexer):
+    """TyCLexer with bulk skipping of whitespace/comments and string matching."""
+
+    _scan_input = None
+    _scan_buffer = None
+
+    def nextToken(self):
+        input = self._input
+        if input is not self._scan_input:
+            self._scan_input = input
+            self._scan_buffer = _searchable(input)
+        buffer = self._scan_buffer
+        if buffer is None or self._hitEOF:
+            return super().nextToken()
+
+        patterns = _PATTERNS[str if isinstance(buffer, str) else bytes]
+        size = input.size
+        while True:
+            pos = input.index
+            if pos >= size:
+                # The generated lexer would have set this after the skip
+                self._hitEOF = True
+                break
+            c = input.LA(1)
+            if c in _WS:
+                self._skip(buffer, patterns, pos, patterns["ws"].match(buffer, pos).end())
+                continue
+            if c == _SLASH:
+                c2 = input.LA(2)
+                if c2 == _SLASH:
+                    end = patterns["line_comment"].match(buffer, pos).end()
+                    self._skip(buffer, patterns, pos, end)
+                    continue
+                if c2 == _STAR:
+                    close = buffer.find(patterns["close"], pos + 2)
+                    if close >= 0:
+                        self._skip(buffer, patterns, pos, close + 2)
+                        continue
+                    # Unterminated: DIV, then MUL, from the generated lexer
+            elif c == _QUOTE:
+                return self._string(buffer, patterns, pos)
+            break
+        return super().nextToken()
+
+    def _skip(self, buffer, patterns, pos: int, end: int):
+        """Consume buffer[pos:end], updating line and column like the ATN does."""
+        newline = patterns["newline"]
+        last = buffer.rfind(newline, pos, end)
+        interp = self._interp
+        if last >= 0:
+            # mmap has no count(); the slice copy is small next to the scan
+            interp.line += buffer[pos:end].count(newline)
+            interp.column = end - last - 1
+        else:
+            interp.column += end - pos
+        self._input.seek(end)
+
+    def _string(self, buffer, patterns, pos: int):
+        """Match STRINGLIT, ILLEGAL_ESCAPE or UNCLOSE_STRING at a quote.
+
+        The lexeme is handed to emit(), so quote stripping and lexer errors
+        go through the same code as in TyCLexer.
+        """
+        input = self._input
+        size = input.size
+        end = patterns["string_body"].match(buffer, pos + 1).end()
+        if end >= size:
+            ttype, stop = self.UNCLOSE_STRING, end
+        else:
+            c = input.LA(end - pos + 1)
+            if c == _QUOTE:
+                ttype, stop = self.STRINGLIT, end + 1
+            elif c != _BACKSLASH:
+                # A raw CR or LF ends the body and belongs to the lexeme
+                ttype, stop = self.UNCLOSE_STRING, end + 1
+            elif end + 1 >= size:
+                ttype, stop = self.UNCLOSE_STRING, end + 1
+            elif input.LA(end - pos + 2) in (_CR, _LF):
+                # No string rule matches a backslash-newline: the longest
+                # match is ERROR_CHAR on the opening quote.
+                ttype, stop = self.ERROR_CHAR, pos + 1
+            else:
+                ttype, stop = self.ILLEGAL_ESCAPE, end + 2
+
+        self._token = None
+        self._channel = Token.DEFAULT_CHANNEL
+        self._tokenStartCharIndex = pos
+        self._tokenStartLine = self._interp.line
+        self._tokenStartColumn = self._interp.column
+        self._type = ttype
+        self._text = input.getText(pos, stop - 1)
+        self._skip(buffer, patterns, pos, stop)
+        if stop >= size:
+            self._hitEOF = True
+        self.emit()
+        return self._token
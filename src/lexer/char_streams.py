@@ -0,0 +1,129 @@
+"""
+Compact character streams for TyC lexers.
+antlr4.InputStream expands the source into a Python list of ord() ints,
+roughly 8-9x the source size. The streams in this module keep the code points
+in a bytes-like buffer instead and can be passed to TyCLexer (or FastLexer)
+anywhere an InputStream is accepted.
+"""
+
+import mmap
+import sys
+from array import array
+
+from antlr4.InputStream import InputStream
+
+
+# Code points outside Latin-1 are stored as 32-bit unsigned ints
+_CODE_POINT_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+_CODE_POINT_CODEC = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# Bytes scanned per step when checking a mapped file for non-ASCII content
+_SCAN_CHUNK = 1 << 20
+
+
+class CompactInputStream(InputStream):
+    """InputStream storing code points in bytes (Latin-1) or array('I')."""
+
+    __slots__ = ("_codec",)
+
+    def __init__(self, data: str):
+        self.name = "<empty>"
+        self.strdata = None
+        self._index = 0
+        try:
+            # ASCII and Latin-1 text: one byte per code point
+            self.data = data.encode("latin-1")
+            self._codec = "latin-1"
+        except UnicodeEncodeError:
+            self.data = array(_CODE_POINT_TYPECODE)
+            self.data.frombytes(data.encode(_CODE_POINT_CODEC))
+            self._codec = _CODE_POINT_CODEC
+        self._size = len(self.data)
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        chunk = self.data[start : stop + 1]
+        if self._codec == "latin-1":
+            return chunk.decode("latin-1")
+        return chunk.tobytes().decode(self._codec)
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+
+class MappedFileStream(InputStream):
+    """Read-only memory-mapped stream over a single-byte encoded file.
+
+    Only ASCII (or explicitly Latin-1) files can be mapped, since every byte
+    must be exactly one code point. Use open_char_stream() to fall back to a
+    CompactInputStream for other files.
+    """
+
+    __slots__ = ("fileName", "_file")
+
+    def __init__(self, fileName: str, encoding: str = "ascii"):
+        if encoding not in ("ascii", "latin-1"):
+            raise ValueError("MappedFileStream supports only ascii and latin-1")
+        self.name = fileName
+        self.fileName = fileName
+        self.strdata = None
+        self._index = 0
+        self._file = open(fileName, "rb")
+        try:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self.data = b""
+        self._size = len(self.data)
+        if encoding == "ascii" and not is_ascii(self.data):
+            self.close()
+            raise UnicodeDecodeError(
+                "ascii", b"", 0, 1, f"{fileName} contains non-ASCII bytes"
+            )
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        return self.data[start : stop + 1].decode("latin-1")
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+    def close(self):
+        """Unmap the file; the stream must not be used afterwards."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_ascii(buffer) -> bool:
+    """Check a bytes-like buffer for non-ASCII bytes without copying it whole."""
+    for offset in range(0, len(buffer), _SCAN_CHUNK):
+        if not buffer[offset : offset + _SCAN_CHUNK].isascii():
+            return False
+    return True
+
+
+def open_char_stream(fileName: str, encoding: str = "utf-8"):
+    """Open a source file as the most compact stream that can represent it."""
+    if encoding == "latin-1":
+        return MappedFileStream(fileName, encoding)
+    try:
+        return MappedFileStream(fileName)
+    except UnicodeDecodeError:
+        pass
+    with open(fileName, "rb") as f:
+        stream = CompactInputStream(f.read().decode(encoding))
+    stream.name = fileName
+    return stream
@@ -0,0 +1,339 @@
+"""
+Hand-written lexer for TyC programming language.
+This module contains the FastLexer class, a table-driven replacement for the
+ANTLR-generated TyCLexer. It follows every lexer rule of TyC.g4 (including
+the emit() overrides) and produces CommonToken objects, so it can feed
+CommonTokenStream and TyCParser unchanged.
+"""
+
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.InputStream import InputStream
+from antlr4.Lexer import TokenSource
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from src.lexer.bulk_scan import BulkScanLexer
+from src.lexer.interning import InterningTokenFactory
+from lexererr import ErrorToken, IllegalEscape, LexerDiagnostic, UncloseString
+
+
+# ============================================================================
+# Lexer tables
+# ============================================================================
+
+KEYWORDS = {
+    "int": TyCLexer.INT,
+    "float": TyCLexer.FLOAT,
+    "string": TyCLexer.STRING,
+    "auto": TyCLexer.AUTO,
+    "void": TyCLexer.VOID,
+    "main": TyCLexer.MAIN,
+    "break": TyCLexer.BREAK,
+    "case": TyCLexer.CASE,
+    "continue": TyCLexer.CONTINUE,
+    "default": TyCLexer.DEFAULT,
+    "else": TyCLexer.ELSE,
+    "for": TyCLexer.FOR,
+    "if": TyCLexer.IF,
+    "return": TyCLexer.RETURN,
+    "struct": TyCLexer.STRUCT,
+    "switch": TyCLexer.SWITCH,
+    "while": TyCLexer.WHILE,
+}
+
+DOUBLE_CHAR_OPS = {
+    "==": TyCLexer.EQ,
+    "!=": TyCLexer.NEQ,
+    "<=": TyCLexer.LE,
+    ">=": TyCLexer.GE,
+    "||": TyCLexer.OR,
+    "&&": TyCLexer.AND,
+    "++": TyCLexer.INC,
+    "--": TyCLexer.DEC,
+}
+
+SINGLE_CHAR_OPS = {
+    ";": TyCLexer.SEMI,
+    ",": TyCLexer.COMMA,
+    "(": TyCLexer.LPAREN,
+    ")": TyCLexer.RPAREN,
+    "{": TyCLexer.LBRACE,
+    "}": TyCLexer.RBRACE,
+    ":": TyCLexer.COLON,
+    "=": TyCLexer.ASSIGN,
+    "<": TyCLexer.LT,
+    ">": TyCLexer.GT,
+    "+": TyCLexer.PLUS,
+    "-": TyCLexer.MINUS,
+    "*": TyCLexer.MUL,
+    "%": TyCLexer.MOD,
+    "!": TyCLexer.NOT,
+}
+
+# Character classes for the dispatch table (ASCII only; every other code
+# point can only start an ERROR_CHAR token).
+_ERROR, _WS, _IDENT, _DIGIT, _DOT, _QUOTE, _SLASH, _OP = range(8)
+
+_CHAR_KIND = [_ERROR] * 128
+for _c in " \t\f\r\n":
+    _CHAR_KIND[ord(_c)] = _WS
+for _c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+    _CHAR_KIND[ord(_c)] = _IDENT
+for _c in "0123456789":
+    _CHAR_KIND[ord(_c)] = _DIGIT
+for _c in set(SINGLE_CHAR_OPS) | {op[0] for op in DOUBLE_CHAR_OPS}:
+    _CHAR_KIND[ord(_c)] = _OP
+_CHAR_KIND[ord(".")] = _DOT
+_CHAR_KIND[ord('"')] = _QUOTE
+_CHAR_KIND[ord("/")] = _SLASH
+del _c
+
+_WS_RE = re.compile(r"[ \t\f\r\n]+")
+_ID_RE = re.compile(r"[a-zA-Z_][a-zA-Z_0-9]*")
+_EXP = r"[eE][+-]?[0-9]+"
+_NUMBER_RE = re.compile(rf"[0-9]+(\.[0-9]*(?:{_EXP})?|{_EXP})?")
+_DOT_FLOAT_RE = re.compile(rf"\.[0-9]+(?:{_EXP})?")
+_STRING_BODY_RE = re.compile(r'[^"\\\r\n]*(?:\\[btnfr"\\][^"\\\r\n]*)*')
+_LINE_COMMENT_RE = re.compile(r"//[^\r\n]*")
+
+
+# ============================================================================
+# Lexer
+# ============================================================================
+
+
+class FastLexer(TokenSource):
+    """Table-driven TyC lexer, token-for-token compatible with TyCLexer."""
+
+    # Set to a list to record lexical errors there instead of raising them
+    diagnostics = None
+
+    def __init__(self, input: InputStream = None):
+        self._factory = CommonTokenFactory.DEFAULT
+        self.inputStream = input
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    @inputStream.setter
+    def inputStream(self, input: InputStream):
+        self._input = input
+        self._tokenFactorySourcePair = (self, input)
+        self._data = str(input) if input is not None else ""
+        self._size = len(self._data)
+        self.reset()
+
+    def reset(self):
+        """Rewind to the start of the current input."""
+        self._pos = 0
+        self.line = 1
+        self.column = 0
+
+    @property
+    def sourceName(self):
+        return getattr(self._input, "name", "<unknown>")
+
+    def getSourceName(self):
+        return self.sourceName
+
+    def getCharIndex(self):
+        return self._pos
+
+    def getAllTokens(self):
+        """Return all tokens up to (but not including) EOF."""
+        tokens = []
+        t = self.nextToken()
+        while t.type != Token.EOF:
+            tokens.append(t)
+            t = self.nextToken()
+        return tokens
+
+    def nextToken(self):
+        """Match and return the next token, skipping WS and comments."""
+        data = self._data
+        size = self._size
+        while True:
+            pos = self._pos
+            if pos >= size:
+                return self._emit(Token.EOF, pos, pos, None)
+            c = data[pos]
+            o = ord(c)
+            kind = _CHAR_KIND[o] if o < 128 else _ERROR
+
+            if kind == _IDENT:
+                end = _ID_RE.match(data, pos).end()
+                lexeme = data[pos:end]
+                return self._emit(KEYWORDS.get(lexeme, TyCLexer.ID), pos, end, None)
+
+            if kind == _WS:
+                self._advance(pos, _WS_RE.match(data, pos).end())
+                continue
+
+            if kind == _OP:
+                ttype = DOUBLE_CHAR_OPS.get(data[pos : pos + 2])
+                if ttype is not None:
+                    return self._emit(ttype, pos, pos + 2, None)
+                ttype = SINGLE_CHAR_OPS.get(c)
+                if ttype is not None:
+                    return self._emit(ttype, pos, pos + 1, None)
+                return self._error_char(pos)
+
+            if kind == _DIGIT:
+                m = _NUMBER_RE.match(data, pos)
+                # Group 1 is the fraction/exponent part that makes a FLOATLIT.
+                ttype = TyCLexer.INTLIT if m.group(1) is None else TyCLexer.FLOATLIT
+                return self._emit(ttype, pos, m.end(), None)
+
+            if kind == _DOT:
+                m = _DOT_FLOAT_RE.match(data, pos)
+                if m is not None:
+                    return self._emit(TyCLexer.FLOATLIT, pos, m.end(), None)
+                return self._emit(TyCLexer.DOT, pos, pos + 1, None)
+
+            if kind == _QUOTE:
+                return self._string(pos)
+
+            if kind == _SLASH:
+                nxt = data[pos + 1 : pos + 2]
+                if nxt == "/":
+                    self._advance(pos, _LINE_COMMENT_RE.match(data, pos).end())
+                    continue
+                if nxt == "*":
+                    close = data.find("*/", pos + 2)
+                    if close >= 0:
+                        self._advance(pos, close + 2)
+                        continue
+                return self._emit(TyCLexer.DIV, pos, pos + 1, None)
+
+            return self._error_char(pos)
+
+    # ------------------------------------------------------------------------
+    # Token construction
+    # ------------------------------------------------------------------------
+
+    def _advance(self, pos: int, end: int):
+        """Move past data[pos:end], keeping line/column in sync with ANTLR."""
+        data = self._data
+        newlines = data.count("\n", pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - data.rindex("\n", pos, end) - 1
+        else:
+            self.column += end - pos
+        self._pos = end
+
+    def _emit(self, ttype: int, start: int, end: int, text):
+        """Create a token for data[start:end], which must not contain LF."""
+        line = self.line
+        column = self.column
+        self.column = column + end - start
+        self._pos = end
+        return self._factory.create(
+            self._tokenFactorySourcePair,
+            ttype,
+            text,
+            Token.DEFAULT_CHANNEL,
+            start,
+            end - 1,
+            line,
+            column,
+        )
+
+    def reportError(self, error, token):
+        """Raise error, or record it and return token in recovering mode."""
+        if self.diagnostics is None:
+            raise error
+        self.diagnostics.append(LexerDiagnostic(error, token))
+        return token
+
+    def _string(self, pos: int):
+        """Match STRINGLIT, ILLEGAL_ESCAPE or UNCLOSE_STRING starting at a quote."""
+        data = self._data
+        end = _STRING_BODY_RE.match(data, pos + 1).end()
+        if end >= self._size:
+            token = self._emit(TyCLexer.UNCLOSE_STRING, pos, end, data[pos + 1 : end])
+            return self.reportError(UncloseString(token.text), token)
+        c = data[end]
+        if c == '"':
+            return self._emit(TyCLexer.STRINGLIT, pos, end + 1, data[pos + 1 : end])
+        if c != "\\":
+            # A raw CR or LF ends the body; the newline belongs to the lexeme.
+            token = self._emit(
+                TyCLexer.UNCLOSE_STRING, pos, end + 1, data[pos + 1 : end + 1]
+            )
+            if c == "\n":
+                self.line += 1
+                self.column = 0
+            return self.reportError(UncloseString(token.text), token)
+        if end + 1 >= self._size:
+            token = self._emit(
+                TyCLexer.UNCLOSE_STRING, pos, end + 1, data[pos + 1 : end + 1]
+            )
+            return self.reportError(UncloseString(token.text), token)
+        if data[end + 1] in "\r\n":
+            # No string rule matches a backslash-newline, so the longest
+            # match falls back to ERROR_CHAR on the opening quote.
+            return self._error_char(pos)
+        token = self._emit(
+            TyCLexer.ILLEGAL_ESCAPE, pos, end + 2, data[pos + 1 : end + 2]
+        )
+        return self.reportError(IllegalEscape(token.text), token)
+
+    def _error_char(self, pos: int):
+        token = self._emit(TyCLexer.ERROR_CHAR, pos, pos + 1, None)
+        return self.reportError(ErrorToken(token.text), token)
+
+
+# ============================================================================
+# Backend selection
+# ============================================================================
+
+LEXER_BACKENDS = {
+    "antlr": TyCLexer,
+    "bulk": BulkScanLexer,
+    "fast": FastLexer,
+}
+
+
+def create_lexer(input_stream: InputStream, backend: str = "antlr", recover: bool = False,
+                 symbols=None):
+    """Create a TyC token source for input_stream using the named backend.
+
+    With recover=True the lexer does not raise on lexical errors: each one is
+    appended to lexer.diagnostics as a LexerDiagnostic, the offending token
+    (ERROR_CHAR, UNCLOSE_STRING or ILLEGAL_ESCAPE) is returned as usual and
+    scanning continues after it.
+
+    If symbols is a SymbolTable, ID, INTLIT and FLOATLIT lexemes are interned
+    into it and tokens are InternedTokens carrying their symbol id.
+    """
+    try:
+        lexer_class = LEXER_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown lexer backend '{backend}', expected one of "
+            + ", ".join(sorted(LEXER_BACKENDS))
+        ) from None
+    lexer = lexer_class(input_stream)
+    if recover:
+        lexer.diagnostics = []
+    if symbols is not None:
+        lexer._factory = InterningTokenFactory(symbols)
+    return lexer
+
+
+def seek_lexer(lexer, index: int, line: int, column: int):
+    """Make the next token of lexer (either backend) start scanning at index.
+
+    The lexer must be in its default mode, which is the only mode of TyC;
+    line and column are those of index in the input.
+    """
+    if isinstance(lexer, FastLexer):
+        lexer._pos = index
+    else:
+        lexer.inputStream.seek(index)
+    lexer.line = line
+    lexer.column = column
@@ -0,0 +1,191 @@
+"""
+Incremental relexing for TyC programming language.
+This module contains the IncrementalLexer class, which keeps the tokens of a
+source in a TokenBuffer and, after an edit, re-lexes only from the last token
+boundary that the edit cannot have affected until the new tokens line up with
+the old ones again. Tokens before the restart point are kept as they are and
+tokens after the resynchronization point are shifted, not re-lexed.
+"""
+
+import copy
+from bisect import bisect_left, bisect_right
+
+from antlr4.Token import Token
+
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer, seek_lexer
+from src.lexer.token_buffer import TokenBuffer
+
+# Characters past the end of a token the lexer may have looked at before
+# settling on it, e.g. "1e+" ahead of a non-digit after INTLIT "1".
+LOOKAHEAD = 3
+
+
+class IncrementalLexer:
+    """Token buffer of one source kept up to date across edits.
+
+    Lexical errors are raised (fail-fast) unless recover is true, in which
+    case error tokens stay in the buffer and every edit updates
+    diagnostics, as with create_lexer(..., recover=True).
+    """
+
+    def __init__(self, text: str, backend: str = "fast", recover: bool = False):
+        self.backend = backend
+        self.recover = recover
+        self.text = text
+        lexer = self._lexer(text)
+        self.buffer = TokenBuffer.from_lexer(lexer)
+        self.diagnostics = lexer.diagnostics
+
+    def _lexer(self, text: str):
+        return create_lexer(CompactInputStream(text), self.backend, recover=self.recover)
+
+    def edit(self, start: int, end: int, text: str) -> range:
+        """Replace self.text[start:end] with text and update the tokens.
+
+        Returns the indices of the tokens in the new buffer that were lexed
+        again; all others were carried over from the previous buffer. On a
+        lexical error in fail-fast mode the lexer state is left unchanged.
+        """
+        old_text = self.text
+        if not 0 <= start <= end <= len(old_text):
+            raise ValueError(f"edit range {start}:{end} outside of 0:{len(old_text)}")
+        new_text = old_text[:start] + text + old_text[end:]
+        delta = len(text) - (end - start)
+        old = self.buffer
+
+        keep = self._restart_index(start)
+        pos, line, column = self._position_after(keep - 1)
+
+        lexer = self._lexer(new_text)
+        seek_lexer(lexer, pos, line, column)
+        buffer = TokenBuffer(lexer.inputStream, lexer)
+        buffer.texts = {i: t for i, t in old.texts.items() if i < keep}
+        buffer.types = old.types[:keep]
+        buffer.starts = old.starts[:keep]
+        buffer.stops = old.stops[:keep]
+        buffer.lines = old.lines[:keep]
+        buffer.columns = old.columns[:keep]
+
+        # Old tokens starting at or after this offset follow the edited text
+        edit_end = start + len(text)
+        resync = None
+        while True:
+            t = lexer.nextToken()
+            if t.channel != Token.DEFAULT_CHANNEL:
+                continue
+            if t.start >= edit_end:
+                j = bisect_left(old.starts, t.start - delta)
+                if (
+                    j < len(old)
+                    and old.starts[j] == t.start - delta
+                    and old.types[j] == t.type
+                    and old.stops[j] == t.stop - delta
+                ):
+                    resync = (j, t)
+                    break
+            buffer.append(
+                t.type,
+                t.start,
+                t.stop,
+                t.line,
+                t.column,
+                t._text if t.type != Token.EOF else None,
+            )
+            if t.type == Token.EOF:
+                break
+        relexed = range(keep, len(buffer))
+
+        diagnostics = None
+        if self.recover:
+            diagnostics = [d for d in self.diagnostics if d.start < pos]
+            # The resynchronizing token is replaced by its shifted old copy
+            diagnostics.extend(d for d in lexer.diagnostics if d.start < t.start)
+        if resync is not None:
+            j, token = resync
+            shift = (delta, token.line - old.lines[j], token.column - old.columns[j])
+            self._append_shifted(buffer, j, shift)
+            if self.recover:
+                diagnostics.extend(
+                    self._shifted(d, old.lines[j], shift)
+                    for d in self.diagnostics
+                    if d.start >= old.starts[j]
+                )
+
+        self.text = new_text
+        self.buffer = buffer
+        self.diagnostics = diagnostics
+        return relexed
+
+    # ------------------------------------------------------------------------
+    # Restart and resynchronization
+    # ------------------------------------------------------------------------
+
+    def _restart_index(self, start: int) -> int:
+        """Number of leading tokens an edit at offset start cannot change.
+
+        A token is safe when every character the lexer examined to match it
+        lies before the line of the edit. Only two lexemes look further than
+        LOOKAHEAD characters past their end: an ERROR_CHAR on a quote
+        (scanned to the backslash-newline that broke the string, on the same
+        line) and an unterminated "/*" (scanned to EOF).
+        """
+        data = self.text
+        limit = data.rfind("\n", 0, start) + 1
+        last_close = data.rfind("*/")
+        opening = data.find("/*", max(last_close - 1, 0))
+        if 0 <= opening < limit:
+            limit = opening
+        return bisect_right(self.buffer.stops, limit - 1 - LOOKAHEAD)
+
+    def _position_after(self, i: int):
+        """Offset, line and column just past token i (or the start of input)."""
+        if i < 0:
+            return 0, 1, 0
+        buffer = self.buffer
+        start, pos = buffer.starts[i], buffer.stops[i] + 1
+        newlines = self.text.count("\n", start, pos)
+        if newlines:
+            return pos, buffer.lines[i] + newlines, pos - self.text.rindex("\n", start, pos) - 1
+        return pos, buffer.lines[i], buffer.columns[i] + pos - start
+
+    def _append_shifted(self, buffer: TokenBuffer, j: int, shift):
+        """Append old tokens j.. to buffer, moved by (offset, line, column)."""
+        old = self.buffer
+        delta, line_delta, column_delta = shift
+        offset = len(buffer) - j
+
+        for i, text in old.texts.items():
+            if i >= j:
+                buffer.texts[i + offset] = text
+        buffer.types.extend(old.types[j:])
+        if delta:
+            buffer.starts.extend(map(delta.__add__, old.starts[j:]))
+            buffer.stops.extend(map(delta.__add__, old.stops[j:]))
+        else:
+            buffer.starts.extend(old.starts[j:])
+            buffer.stops.extend(old.stops[j:])
+        if line_delta:
+            buffer.lines.extend(map(line_delta.__add__, old.lines[j:]))
+        else:
+            buffer.lines.extend(old.lines[j:])
+
+        columns = old.columns[j:]
+        if column_delta:
+            # Only tokens on the line of the resynchronization point move
+            # sideways; the first newline after it resets the column.
+            for k in range(bisect_right(old.lines, old.lines[j], j) - j):
+                columns[k] += column_delta
+        buffer.columns.extend(columns)
+
+    @staticmethod
+    def _shifted(diagnostic, resync_line: int, shift):
+        delta, line_delta, column_delta = shift
+        moved = copy.copy(diagnostic)
+        moved.start += delta
+        moved.stop += delta
+        if diagnostic.line == resync_line:
+            moved.column += column_delta
+        moved.line += line_delta
+        return moved
+
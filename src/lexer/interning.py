@@ -0,0 +1,117 @@
+"""
+Identifier and literal interning for TyC lexers.
+This module contains the SymbolTable class, which maps every distinct ID,
+INTLIT and FLOATLIT lexeme to a small integer id and its converted value,
+and InterningTokenFactory, a token factory that fills a SymbolTable as any
+lexer backend emits tokens. Interned tokens share one text object per
+lexeme and carry their id, so later phases can compare symbols by id and
+reuse the int()/float() conversion done once per distinct lexeme.
+"""
+
+import sys
+from array import array
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken
+
+from build.TyCLexer import TyCLexer
+
+# Token type -> converter from lexeme to value
+CONVERTERS = {
+    TyCLexer.ID: str,
+    TyCLexer.INTLIT: int,
+    TyCLexer.FLOATLIT: float,
+}
+
+# Symbol of tokens that are not interned
+NO_SYMBOL = -1
+
+
+class SymbolTable:
+    """Distinct lexemes of ID, INTLIT and FLOATLIT tokens, numbered from 0.
+
+    A table may be shared by several lexers (e.g. one per source file) so
+    ids are comparable across them. The three token types cannot produce
+    the same lexeme, so the lexeme alone identifies a symbol.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.lexemes = []
+        self.values = []
+        self.types = array("b")
+
+    def intern(self, type: int, text: str) -> int:
+        """Return the id of text, adding it as a symbol of type if new."""
+        id = self.ids.get(text)
+        if id is None:
+            id = len(self.lexemes)
+            lexeme = sys.intern(text)
+            self.ids[lexeme] = id
+            self.lexemes.append(lexeme)
+            self.values.append(CONVERTERS[type](lexeme))
+            self.types.append(type)
+        return id
+
+    def lookup(self, text: str) -> int:
+        """Return the id of text, or NO_SYMBOL if it was never interned."""
+        return self.ids.get(text, NO_SYMBOL)
+
+    def lexeme(self, id: int) -> str:
+        return self.lexemes[id]
+
+    def value(self, id: int):
+        """The converted value: the name for ID, an int or a float."""
+        return self.values[id]
+
+    def __len__(self):
+        return len(self.lexemes)
+
+
+class InternedToken(CommonToken):
+    """CommonToken carrying the SymbolTable id of its lexeme, or NO_SYMBOL."""
+
+    __slots__ = ("symbol",)
+
+    def clone(self):
+        t = InternedToken(self.source, self.type, self.channel, self.start, self.stop)
+        t.tokenIndex = self.tokenIndex
+        t.line = self.line
+        t.column = self.column
+        t._text = self._text
+        t.symbol = self.symbol
+        return t
+
+
+class InterningTokenFactory(CommonTokenFactory):
+    """Token factory that interns ID, INTLIT and FLOATLIT tokens into table.
+
+    Install it as lexer._factory, which create_lexer(symbols=...) does for
+    every backend.
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(self, table: SymbolTable):
+        super().__init__()
+        self.table = table
+
+    def create(self, source, type: int, text: str, channel: int, start: int, stop: int,
+               line: int, column: int):
+        t = InternedToken(source, type, channel, start, stop)
+        t.line = line
+        t.column = column
+        if type in CONVERTERS:
+            table = self.table
+            if text is None:
+                text = source[1].getText(start, stop)
+            id = table.ids.get(text)
+            if id is None:
+                id = table.intern(type, text)
+            t.symbol = id
+            t._text = table.lexemes[id]
+        else:
+            t.symbol = NO_SYMBOL
+            if text is not None:
+                t._text = text
+        return t
@@ -0,0 +1,155 @@
+"""
+Streaming tokenization of large TyC sources.
+This module lexes a text file object chunk by chunk and yields tokens as soon
+as no later input can change them, so memory stays bounded by the chunk size
+plus the longest single lexeme instead of growing with the file. Lexical
+errors are reported exactly as by a lexer on the whole source.
+
+Usage:
+    python -m src.lexer.streaming [--output PATH] [--backend NAME] FILE
+"""
+
+import argparse
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from lexererr import LexerError
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import LEXER_BACKENDS, create_lexer, seek_lexer
+from src.lexer.incremental import LOOKAHEAD
+
+# Characters read from the file per step
+CHUNK_SIZE = 1 << 20
+
+_ERROR_TYPES = (TyCLexer.ERROR_CHAR, TyCLexer.UNCLOSE_STRING, TyCLexer.ILLEGAL_ESCAPE)
+
+# Token types that may have been matched after scanning past LOOKAHEAD
+_LONG_SCAN_TYPES = (TyCLexer.DIV, TyCLexer.ERROR_CHAR)
+
+
+def _is_final(token, data: str) -> bool:
+    """True if reading past the end of data cannot change token.
+
+    Mirrors IncrementalLexer's restart rule: a token is final once every
+    character examined to match it is in data, which is LOOKAHEAD past its
+    end except for an unterminated "/*" (lexed as DIV after scanning to EOF)
+    and an ERROR_CHAR quote (scanned to the backslash-newline).
+    """
+    end = token.stop + 1
+    if token.type == TyCLexer.DIV and data.startswith("*", end):
+        return False
+    if token.type == TyCLexer.ERROR_CHAR and data[token.start] == '"':
+        breaks = [i for i in (data.find("\n", end), data.find("\r", end)) if i >= 0]
+        return bool(breaks) and min(breaks) + 1 < len(data)
+    return end + LOOKAHEAD < len(data)
+
+
+def stream_tokens(file, backend: str = "fast", diagnostics: list = None,
+                  chunk_size: int = CHUNK_SIZE):
+    """Yield the default-channel tokens of a text file object, ending with EOF.
+
+    Tokens carry their text and absolute start/stop offsets. A lexical error
+    is raised after the tokens before it have been yielded, unless
+    diagnostics is a list, in which case it is recorded there as a
+    LexerDiagnostic and the error token is yielded like the others.
+    """
+    pending = ""
+    base = 0
+    line, column = 1, 0
+    read_size = chunk_size
+    at_eof = False
+    while True:
+        if not at_eof:
+            chunk = file.read(read_size)
+            at_eof = not chunk
+            pending += chunk
+
+        lexer = create_lexer(CompactInputStream(pending), backend, recover=True)
+        seek_lexer(lexer, 0, line, column)
+        # Tokens ending before this offset are final unless of a long-scan type
+        safe_end = len(pending) - LOOKAHEAD - 1
+        done = 0
+        while True:
+            t = lexer.nextToken()
+            if t.channel != Token.DEFAULT_CHANNEL:
+                continue
+            if t.type == Token.EOF:
+                if at_eof:
+                    t.start += base
+                    t.stop += base
+                    yield t
+                    return
+                break
+            if (
+                not at_eof
+                and (t.stop >= safe_end or t.type in _LONG_SCAN_TYPES)
+                and not _is_final(t, pending)
+            ):
+                break
+            if t.type in _ERROR_TYPES:
+                diagnostic = lexer.diagnostics.pop()
+                diagnostic.start += base
+                diagnostic.stop += base
+                if diagnostics is None:
+                    raise diagnostic.error
+                diagnostics.append(diagnostic)
+            if t._text is None:
+                t._text = pending[t.start : t.stop + 1]
+            t.start += base
+            t.stop += base
+            done = t.stop + 1 - base
+            line, column = lexer.line, lexer.column
+            yield t
+
+        # Keep the unfinished tail; read more at once if nothing was final,
+        # so a single huge comment or string is not rescanned per chunk.
+        pending = pending[done:]
+        base += done
+        read_size = chunk_size if done else read_size * 2
+
+
+def write_tokens(file, out, backend: str = "fast", chunk_size: int = CHUNK_SIZE) -> bool:
+    """Write the tokens of file to out in Tokenizer.get_tokens_as_string format.
+
+    Returns False if the output ends with a lexical error message.
+    """
+    separator = ""
+    try:
+        for t in stream_tokens(file, backend, chunk_size=chunk_size):
+            out.write(separator)
+            out.write("<EOF>" if t.type == Token.EOF else t.text or "")
+            separator = ","
+    except LexerError as e:
+        out.write(separator + str(e))
+        return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream the tokens of a TyC source.")
+    parser.add_argument("file", help="TyC source file")
+    parser.add_argument("--output", help="output file (default: stdout)")
+    parser.add_argument("--backend", default="fast", choices=sorted(LEXER_BACKENDS))
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    with open(args.file, encoding="utf-8", newline="") as f:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                ok = write_tokens(f, out, args.backend, args.chunk_size)
+        else:
+            ok = write_tokens(f, sys.stdout, args.backend, args.chunk_size)
+            sys.stdout.write("\n")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
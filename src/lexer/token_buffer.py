@@ -0,0 +1,185 @@
+"""
+Columnar token storage for TyC programming language.
+This module contains the TokenBuffer class, which keeps the type, start,
+stop, line and column of every token in parallel typed arrays instead of one
+CommonToken object per token, and ColumnarTokenStream, a TokenStream adapter
+that lets TyCParser run directly on a TokenBuffer.
+"""
+
+from array import array
+
+from antlr4.BufferedTokenStream import TokenStream
+from antlr4.Token import CommonToken, Token
+from antlr4.error.Errors import IllegalStateException
+
+
+class TokenBuffer:
+    """Parallel-array store of the default-channel tokens of one source.
+
+    Token text is not copied: it is sliced from the char stream on demand.
+    Only tokens whose text differs from their source range (STRINGLIT with
+    its quotes stripped) keep an explicit text, in a sparse dict.
+    """
+
+    def __init__(self, input_stream, token_source=None):
+        self.input_stream = input_stream
+        self.token_source = token_source
+        self.types = array("b")
+        self.starts = array("q")
+        self.stops = array("q")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.texts = {}
+
+    @classmethod
+    def from_lexer(cls, lexer):
+        """Drain lexer into a new buffer. Lexer errors propagate unchanged."""
+        buffer = cls(lexer.inputStream, lexer)
+        buffer.fill(lexer)
+        return buffer
+
+    def fill(self, lexer):
+        """Append tokens from lexer up to and including EOF."""
+        append_type = self.types.append
+        append_start = self.starts.append
+        append_stop = self.stops.append
+        append_line = self.lines.append
+        append_column = self.columns.append
+        texts = self.texts
+        while True:
+            t = lexer.nextToken()
+            if t.channel != Token.DEFAULT_CHANNEL:
+                continue
+            if t._text is not None and t.type != Token.EOF:
+                texts[len(self.types)] = t._text
+            append_type(t.type)
+            append_start(t.start)
+            append_stop(t.stop)
+            append_line(t.line)
+            append_column(t.column)
+            if t.type == Token.EOF:
+                return self
+
+    def append(self, type: int, start: int, stop: int, line: int, column: int, text=None):
+        """Append a single token; text is only needed when it is not the source slice."""
+        if text is not None:
+            self.texts[len(self.types)] = text
+        self.types.append(type)
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self):
+        return len(self.types)
+
+    def text(self, i: int) -> str:
+        """Return the text of token i, slicing the source lazily."""
+        text = self.texts.get(i)
+        if text is not None:
+            return text
+        if self.types[i] == Token.EOF:
+            return "<EOF>"
+        return self.input_stream.getText(self.starts[i], self.stops[i])
+
+    def token(self, i: int) -> CommonToken:
+        """Materialize token i as a CommonToken (text stays lazy)."""
+        t = CommonToken(
+            (self.token_source, self.input_stream),
+            self.types[i],
+            Token.DEFAULT_CHANNEL,
+            self.starts[i],
+            self.stops[i],
+        )
+        t.tokenIndex = i
+        t.line = self.lines[i]
+        t.column = self.columns[i]
+        t._text = self.texts.get(i)
+        return t
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (excluding the source)."""
+        columns = (self.types, self.starts, self.stops, self.lines, self.columns)
+        return sum(c.itemsize * len(c) for c in columns) + sum(
+            len(text) for text in self.texts.values()
+        )
+
+
+class ColumnarTokenStream(TokenStream):
+    """TokenStream over a TokenBuffer, usable in place of CommonTokenStream."""
+
+    # Materialized tokens kept around for repeated LT()/get() calls
+    _CACHE_LIMIT = 64
+
+    def __init__(self, buffer: TokenBuffer):
+        self.tokens = buffer
+        self.tokenSource = buffer.token_source
+        self.index = 0
+        self._cache = {}
+
+    @property
+    def size(self):
+        return len(self.tokens)
+
+    def getSourceName(self):
+        return getattr(self.tokens.input_stream, "name", "<unknown>")
+
+    def get(self, i: int):
+        token = self._cache.get(i)
+        if token is None:
+            if len(self._cache) >= self._CACHE_LIMIT:
+                self._cache.clear()
+            token = self._cache[i] = self.tokens.token(i)
+        return token
+
+    def LA(self, i: int):
+        if i == 0:
+            return 0
+        pos = self.index + i if i < 0 else self.index + i - 1
+        if pos < 0:
+            return Token.INVALID_TYPE
+        last = len(self.tokens) - 1
+        return self.tokens.types[pos if pos < last else last]
+
+    def LT(self, k: int):
+        if k == 0:
+            return None
+        pos = self.index + k if k < 0 else self.index + k - 1
+        if pos < 0:
+            return None
+        return self.get(min(pos, len(self.tokens) - 1))
+
+    def consume(self):
+        if self.tokens.types[self.index] == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        self.index += 1
+
+    def mark(self):
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index: int):
+        self.index = min(index, len(self.tokens) - 1)
+
+    def getText(self, start=None, stop=None):
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        elif start is None:
+            start = 0
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        elif stop is None or stop >= len(self.tokens):
+            stop = len(self.tokens) - 1
+        if start < 0 or stop < 0 or stop < start:
+            return ""
+        parts = []
+        for i in range(start, stop + 1):
+            if self.tokens.types[i] == Token.EOF:
+                break
+            parts.append(self.tokens.text(i))
+        return "".join(parts)
@@ -0,0 +1,152 @@
+"""
+Unbuffered token stream for TyC parsers.
+CommonTokenStream keeps every token of a source for the whole parse. This
+module contains the UnbufferedTokenStream class, a port of the Java
+runtime's UnbufferedTokenStream (the Python runtime has none): it pulls
+tokens from its source only as the parser looks ahead and drops them once
+the parser has consumed them, except while a marker is held. Adaptive
+prediction holds a marker for the tokens of one decision, so the window
+stays as small as the grammar's lookahead.
+"""
+
+from antlr4.BufferedTokenStream import TokenStream
+from antlr4.Token import Token
+from antlr4.error.Errors import IllegalStateException
+
+
+class UnbufferedTokenStream(TokenStream):
+    """TokenStream holding only the tokens a parser may still look at.
+
+    tokens[p] is LT(1); tokens[0] is token number index - p. Seeking is
+    only possible within the window, which is enough for the parser and its
+    ATN simulator: they only seek back to the start of a held marker.
+    """
+
+    def __init__(self, tokenSource):
+        self.tokenSource = tokenSource
+        self.tokens = []
+        self.p = 0
+        # Absolute index of tokens[p]
+        self.index = 0
+        self.num_markers = 0
+        # LT(-1), and LT(-1) as of tokens[0] for seek(index - p)
+        self.last_token = None
+        self.last_token_buffer_start = None
+        # Largest window seen, for benchmarks and tests
+        self.peak = 0
+        self._fill(1)
+
+    @property
+    def size(self):
+        raise IllegalStateException("Unbuffered stream cannot know its size")
+
+    def getSourceName(self):
+        return getattr(self.tokenSource, "sourceName", "<unknown>")
+
+    def _sync(self, want: int):
+        need = self.p + want - len(self.tokens)
+        if need > 0:
+            self._fill(need)
+
+    def _fill(self, n: int):
+        tokens = self.tokens
+        for _ in range(n):
+            if tokens and tokens[-1].type == Token.EOF:
+                return
+            t = self.tokenSource.nextToken()
+            t.tokenIndex = self.index - self.p + len(tokens)
+            tokens.append(t)
+        if len(tokens) > self.peak:
+            self.peak = len(tokens)
+
+    def get(self, i: int):
+        start = self.index - self.p
+        if i < start or i >= start + len(self.tokens):
+            raise IndexError(
+                f"get({i}) outside buffer: {start}..{start + len(self.tokens)}"
+            )
+        return self.tokens[i - start]
+
+    def LT(self, k: int):
+        if k == -1:
+            return self.last_token
+        if k == 0:
+            return None
+        if k < -1:
+            raise IndexError(f"LT({k}) is not supported by an unbuffered stream")
+        self._sync(k)
+        i = self.p + k - 1
+        tokens = self.tokens
+        # Past EOF, keep returning EOF
+        return tokens[i] if i < len(tokens) else tokens[-1]
+
+    def LA(self, k: int):
+        if k == 0:
+            return 0
+        return self.LT(k).type
+
+    def consume(self):
+        if self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        tokens = self.tokens
+        self.last_token = tokens[self.p]
+        if self.p == len(tokens) - 1 and self.num_markers == 0:
+            # Nothing left to look back at: start a new window
+            tokens.clear()
+            self.p = -1
+            self.last_token_buffer_start = self.last_token
+        self.p += 1
+        self.index += 1
+        self._sync(1)
+
+    def mark(self):
+        if self.num_markers == 0:
+            self.last_token_buffer_start = self.last_token
+        self.num_markers += 1
+        return -self.num_markers
+
+    def release(self, marker: int):
+        if marker != -self.num_markers:
+            raise IllegalStateException("release() called with an invalid marker.")
+        self.num_markers -= 1
+        if self.num_markers == 0:
+            if self.p > 0:
+                del self.tokens[: self.p]
+                self.p = 0
+            self.last_token_buffer_start = self.last_token
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index: int):
+        if index == self.index:
+            return
+        if index > self.index:
+            self._sync(index - self.index)
+            index = min(index, self.index - self.p + len(self.tokens) - 1)
+        i = index - (self.index - self.p)
+        if i < 0:
+            raise IndexError(f"cannot seek to {index}: tokens before the window were released")
+        if i >= len(self.tokens):
+            raise IndexError(f"seek to index outside buffer: {index}")
+        self.p = i
+        self.index = index
+        self.last_token = self.last_token_buffer_start if i == 0 else self.tokens[i - 1]
+
+    def getText(self, start=None, stop=None):
+        """Text of the tokens from start to stop, which must be in the window."""
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        first = self.index - self.p
+        start = first if start is None else start
+        stop = first + len(self.tokens) - 1 if stop is None else stop
+        if start < first or stop >= first + len(self.tokens):
+            raise IndexError(f"interval {start}..{stop} not in token buffer window")
+        parts = []
+        for t in self.tokens[start - first : stop - first + 1]:
+            if t.type == Token.EOF:
+                break
+            parts.append(t.text)
+        return "".join(parts)
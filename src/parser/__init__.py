@@ -0,0 +1,3 @@
+"""
+Parser front-ends and runtime helpers for TyC language
+"""
@@ -0,0 +1,496 @@
+"""
+On-disk cache of the deserialized TyCLexer and TyCParser ATNs.
+The generated recognizers rebuild their ATN from the serialized integer list
+with ATNDeserializer when their module is imported, which decodes every
+state and transition and then re-verifies the whole graph. This module stores
+the resulting object graph in a flat, column-wise JSON layout keyed by the
+hash of src/grammar/TyC.g4, and rebuilds it on the next import without
+parsing or verifying again. A cache written for another grammar, runtime or
+Python version is ignored and rewritten.
+
+The cache is plain data: objects are only ever created from a fixed set of
+ATN state, transition, interval set and lexer action classes, and an entry
+that does not fit that shape is rejected and rebuilt.
+
+Nothing installs the cache implicitly: install() patches
+ATNDeserializer.deserialize for the whole process and writes the cache file,
+so it is only for entry points that opt in. It must run before
+build.TyCLexer / build.TyCParser are imported. For TyC's grammar the runtime
+deserializes each ATN in about 1.5 ms, which reading and checking the JSON
+cache does not beat; benchmarks/bench_startup.py measures both.
+"""
+
+import json
+import os
+import sys
+import zlib
+from itertools import chain, repeat
+
+from antlr4.IntervalSet import IntervalSet
+from antlr4.atn.ATN import ATN
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+from antlr4.atn.ATNState import (
+    BasicBlockStartState,
+    BasicState,
+    BlockEndState,
+    LoopEndState,
+    PlusBlockStartState,
+    PlusLoopbackState,
+    RuleStartState,
+    RuleStopState,
+    StarBlockStartState,
+    StarLoopbackState,
+    StarLoopEntryState,
+    TokensStartState,
+)
+from antlr4.atn.ATNType import ATNType
+from antlr4.atn.LexerAction import (
+    LexerActionType,
+    LexerChannelAction,
+    LexerCustomAction,
+    LexerModeAction,
+    LexerMoreAction,
+    LexerPopModeAction,
+    LexerPushModeAction,
+    LexerSkipAction,
+    LexerTypeAction,
+)
+from antlr4.atn.Transition import (
+    ActionTransition,
+    AtomTransition,
+    EpsilonTransition,
+    NotSetTransition,
+    PrecedencePredicateTransition,
+    PredicateTransition,
+    RangeTransition,
+    RuleTransition,
+    SetTransition,
+    WildcardTransition,
+)
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Bump when the on-disk layout changes
+FORMAT_VERSION = 2
+
+GRAMMAR_PATH = os.path.join(project_root, "src", "grammar", "TyC.g4")
+DEFAULT_CACHE_PATH = os.path.join(project_root, "build", "TyC.atn")
+
+_MAGIC = b"TYCATN\n"
+
+# The only classes a cache entry may instantiate, stored by name
+_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        ATN,
+        IntervalSet,
+        BasicBlockStartState,
+        BasicState,
+        BlockEndState,
+        LoopEndState,
+        PlusBlockStartState,
+        PlusLoopbackState,
+        RuleStartState,
+        RuleStopState,
+        StarBlockStartState,
+        StarLoopbackState,
+        StarLoopEntryState,
+        TokensStartState,
+        ActionTransition,
+        AtomTransition,
+        EpsilonTransition,
+        NotSetTransition,
+        PrecedencePredicateTransition,
+        PredicateTransition,
+        RangeTransition,
+        RuleTransition,
+        SetTransition,
+        WildcardTransition,
+        LexerChannelAction,
+        LexerCustomAction,
+        LexerModeAction,
+        LexerPushModeAction,
+        LexerTypeAction,
+    )
+}
+
+# IntEnum types of slot values such as ATN.grammarType
+_ENUMS = {cls.__name__: cls for cls in (ATNType, LexerActionType)}
+
+# Runtime singletons compared by identity, stored by name
+_SINGLETONS = {
+    "skip": LexerSkipAction.INSTANCE,
+    "more": LexerMoreAction.INSTANCE,
+    "pop-mode": LexerPopModeAction.INSTANCE,
+}
+
+# Slot value kinds, decided per (class, slot) when encoding
+_PLAIN = 0  # scalar value stored as is
+_REF = 1  # object index, -1 for None
+_REFS = 2  # list of object indices
+_ANY = 3  # tagged value, see _Encoder.value
+_PLAIN_TYPES = (type(None), bool, int, float, str)
+
+
+def runtime_stamp() -> tuple:
+    """Identify the installed runtime by its ATN module file.
+
+    Cheaper than asking importlib.metadata for the package version.
+    """
+    path = sys.modules[ATN.__module__].__file__
+    stat = os.stat(path)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def grammar_hash(path: str = GRAMMAR_PATH) -> tuple:
+    """Size and CRC-32 of the grammar file, or () when it is not shipped.
+
+    The cache only has to notice edits, and hashlib alone takes longer to
+    import than the cache saves.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return ()
+    return (len(data), zlib.crc32(data))
+
+
+def cache_key(path: str = GRAMMAR_PATH) -> tuple:
+    return (FORMAT_VERSION, runtime_stamp(), sys.version_info[:2], grammar_hash(path))
+
+
+def _slots(cls):
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in names)
+    return names
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+
+class _Encoder:
+    """Number every object reachable from an ATN and describe it column-wise."""
+
+    def __init__(self):
+        self.objects = []
+        self.index = {}
+        self.singletons = {id(obj): name for name, obj in _SINGLETONS.items()}
+
+    def ref(self, obj):
+        if obj is None:
+            return -1
+        i = self.index.get(id(obj))
+        if i is None:
+            # Only slot values are stored; a few runtime classes omit
+            # __slots__ but never set instance attributes
+            if _CLASSES.get(type(obj).__name__) is not type(obj) or getattr(
+                obj, "__dict__", None
+            ):
+                raise TypeError(f"cannot cache {type(obj).__name__} objects")
+            i = self.index[id(obj)] = len(self.objects)
+            self.objects.append(obj)
+        return i
+
+    def value(self, v):
+        """Tagged encoding for values of mixed or container types.
+
+        Scalars are stored as is and everything else as a list whose first
+        item names its kind.
+        """
+        t = type(v)
+        if t in _PLAIN_TYPES:
+            return v
+        if isinstance(v, int):
+            if _ENUMS.get(t.__name__) is not t:
+                raise TypeError(f"cannot cache {t.__name__} values")
+            return ["e", t.__name__, int(v)]
+        if t is list:
+            return ["l", [self.value(x) for x in v]]
+        if t is tuple:
+            return ["t", [self.value(x) for x in v]]
+        if t is dict:
+            return ["d", [[self.value(k), self.value(x)] for k, x in v.items()]]
+        if t is range:
+            return ["r", v.start, v.stop, v.step]
+        name = self.singletons.get(id(v))
+        if name is not None:
+            return ["s", name]
+        return ["o", self.ref(v)]
+
+    def kind(self, values):
+        index = self.index
+        if all(type(v) in _PLAIN_TYPES for v in values):
+            return _PLAIN
+        if all(v is None or id(v) in index for v in values):
+            return _REF
+        if all(type(v) is list and all(id(x) in index for x in v) for v in values):
+            return _REFS
+        return _ANY
+
+    def encode(self, root) -> list:
+        self.ref(root)
+        # Discover the whole graph first so object numbers are final
+        i = 0
+        while i < len(self.objects):
+            obj = self.objects[i]
+            if id(obj) not in self.singletons:
+                for name in _slots(type(obj)):
+                    if hasattr(obj, name):
+                        self.value(getattr(obj, name))
+            i += 1
+
+        # Renumber grouped by class: objects of a class are contiguous
+        groups = {}
+        for obj in self.objects:
+            if id(obj) not in self.singletons:
+                groups.setdefault(type(obj), []).append(obj)
+        self.objects = [obj for members in groups.values() for obj in members]
+        self.index = {id(obj): i for i, obj in enumerate(self.objects)}
+
+        classes = []
+        for cls, members in groups.items():
+            columns = []
+            for name in _slots(cls):
+                present = [hasattr(obj, name) for obj in members]
+                if not any(present):
+                    continue
+                values = [getattr(obj, name) for obj in members if hasattr(obj, name)]
+                kind = self.kind(values) if all(present) else _ANY
+                if kind == _ANY:
+                    column = [
+                        self.value(getattr(obj, name)) if ok else ["m"]
+                        for obj, ok in zip(members, present)
+                    ]
+                elif kind == _REF:
+                    column = [-1 if v is None else self.index[id(v)] for v in values]
+                elif kind == _REFS:
+                    column = [[self.index[id(x)] for x in v] for v in values]
+                else:
+                    column = values
+                columns.append([name, kind, column])
+            classes.append([cls.__name__, len(members), columns])
+        return [classes, self.index[id(root)]]
+
+
+def encode_atn(atn) -> list:
+    """Describe a deserialized ATN object graph as JSON-compatible data."""
+    return _Encoder().encode(atn)
+
+
+# ============================================================================
+# Decoding
+# ============================================================================
+
+
+_MISSING = object()
+
+
+def _check(ok: bool, what: str):
+    if not ok:
+        raise ValueError(f"malformed ATN cache entry: {what}")
+
+
+def _indices(column, low: int, high: int) -> bool:
+    # Whole-column checks run in C; JSON numbers are only int or float
+    return (
+        set(map(type, column)) <= {int}
+        and low <= min(column, default=low)
+        and max(column, default=low) < high
+    )
+
+
+def decode_atn(data):
+    """Rebuild the ATN object graph described by encode_atn.
+
+    Raises ValueError when data does not have the shape encode_atn writes.
+    """
+    try:
+        return _decode(data)
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise ValueError(f"malformed ATN cache entry: {e!r}") from None
+
+
+def _decode(data):
+    classes, root = data
+    resolved = []
+    objects = []
+    for name, count, columns in classes:
+        cls = _CLASSES.get(name)
+        _check(cls is not None, f"class {name!r}")
+        _check(type(count) is int and count >= 0, "object count")
+        resolved.append((cls, len(objects), count))
+        objects.extend(map(cls.__new__, repeat(cls, count)))
+    total = len(objects)
+    _check(type(root) is int and 0 <= root < total, "root index")
+    # Index -1 stands for None in reference columns
+    objects.append(None)
+
+    def value(v):
+        if type(v) in _PLAIN_TYPES:
+            return v
+        _check(type(v) is list and len(v) > 0, "tagged value")
+        tag = v[0]
+        if tag == "o":
+            _check(_indices(v[1:2], 0, total), "object index")
+            return objects[v[1]]
+        if tag == "l":
+            _check(type(v[1]) is list, "list")
+            return [value(x) for x in v[1]]
+        if tag == "s":
+            return _SINGLETONS[v[1]]
+        if tag == "r":
+            _check(_indices(v[1:4], -sys.maxsize, sys.maxsize), "range")
+            return range(v[1], v[2], v[3])
+        if tag == "t":
+            _check(type(v[1]) is list, "tuple")
+            return tuple(value(x) for x in v[1])
+        if tag == "d":
+            _check(type(v[1]) is list, "dict")
+            return {value(k): value(x) for k, x in v[1]}
+        if tag == "e":
+            _check(type(v[2]) is int, "enum value")
+            return _ENUMS[v[1]](v[2])
+        _check(tag == "m", f"tag {tag!r}")
+        return _MISSING
+
+    for (cls, first, count), (_, _, columns) in zip(resolved, classes):
+        members = objects[first : first + count]
+        slots = _slots(cls)
+        for name, kind, column in columns:
+            _check(name in slots, f"slot {cls.__name__}.{name}")
+            _check(type(column) is list and len(column) <= count, "column length")
+            targets = members
+            # The slot descriptor's setter, mapped over the whole column
+            setter = getattr(cls, name).__set__
+            if kind == _PLAIN:
+                _check(set(map(type, column)) <= set(_PLAIN_TYPES), "plain column")
+                values = column
+            elif kind == _REF:
+                _check(_indices(column, -1, total), "reference column")
+                values = [objects[i] for i in column]
+            elif kind == _REFS:
+                _check(
+                    set(map(type, column)) <= {list}
+                    and _indices(list(chain.from_iterable(column)), 0, total),
+                    "reference list column",
+                )
+                values = [[objects[i] for i in row] for row in column]
+            else:
+                _check(kind == _ANY, f"column kind {kind!r}")
+                values = [value(v) for v in column]
+                if any(v is _MISSING for v in values):
+                    pairs = [(o, v) for o, v in zip(members, values) if v is not _MISSING]
+                    targets, values = [o for o, _ in pairs], [v for _, v in pairs]
+            _check(len(values) == len(targets), "column length")
+            list(map(setter, targets, values))
+    atn = objects[root]
+    _check(type(atn) is ATN, "root object")
+    return atn
+
+
+# ============================================================================
+# Cache file
+# ============================================================================
+
+
+class ATNCache:
+    """The ATNs of one cache file, looked up by their serialized form."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, grammar: str = GRAMMAR_PATH):
+        self.path = path
+        # As read back from JSON, where tuples become lists
+        self.key = json.loads(json.dumps(cache_key(grammar)))
+        self.entries = []  # [serialized ATN, encoded graph]
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> bool:
+        """Read entries from disk. Returns False if missing, stale or malformed."""
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    return False
+                key, entries = json.loads(f.read())
+        except (OSError, ValueError, TypeError):
+            return False
+        if key != self.key or type(entries) is not list:
+            return False
+        if not all(type(e) is list and len(e) == 2 and type(e[0]) is list for e in entries):
+            return False
+        self.entries = entries
+        return True
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_MAGIC)
+                f.write(json.dumps([self.key, self.entries], separators=(",", ":")).encode())
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only build directory just means running uncached
+            pass
+
+    def deserialize(self, data, fallback):
+        """Return the ATN for data, from the cache or by calling fallback."""
+        serialized = list(data)
+        for entry in self.entries:
+            if entry[0] == serialized:
+                try:
+                    atn = decode_atn(entry[1])
+                except ValueError:
+                    # Rejected: rebuild it below and overwrite the entry
+                    self.entries.remove(entry)
+                    break
+                self.hits += 1
+                return atn
+        self.misses += 1
+        atn = fallback(data)
+        try:
+            encoded = encode_atn(atn)
+        except (TypeError, ValueError):
+            return atn
+        self.entries.append([serialized, encoded])
+        self.save()
+        return atn
+
+
+_installed = None
+
+
+def install(path: str = DEFAULT_CACHE_PATH, grammar: str = GRAMMAR_PATH) -> ATNCache:
+    """Route ATNDeserializer.deserialize through the cache at path.
+
+    Recognizer modules imported afterwards get their ATN from the cache,
+    which is written on the first import that misses. Calling install again
+    is a no-op and returns the active cache.
+    """
+    global _installed
+    if _installed is not None:
+        return _installed
+    cache = ATNCache(path, grammar)
+    original = ATNDeserializer.deserialize
+
+    def deserialize(self, data):
+        return cache.deserialize(data, lambda d: original(self, d))
+
+    deserialize.__wrapped__ = original
+    ATNDeserializer.deserialize = deserialize
+    _installed = cache
+    return cache
+
+
+def uninstall():
+    """Restore the runtime's own ATNDeserializer.deserialize."""
+    global _installed
+    if _installed is not None:
+        ATNDeserializer.deserialize = ATNDeserializer.deserialize.__wrapped__
+        _installed = None
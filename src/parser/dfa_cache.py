@@ -0,0 +1,469 @@
+"""
+Persisted DFA cache for TyCLexer and TyCParser.
+The ANTLR runtime builds the prediction DFAs of a recognizer lazily, so every
+fresh process pays the adaptive-prediction warm-up again. This module saves
+the warmed decisionsToDFA tables to disk after a training run and loads them
+back into the generated classes, so new lexers and parsers start warm.
+
+Usage:
+    python -m src.parser.dfa_cache [--output PATH] files ...
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from importlib.metadata import PackageNotFoundError, version
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+from antlr4.PredictionContext import (
+    ArrayPredictionContext,
+    PredictionContext,
+    SingletonPredictionContext,
+)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet, OrderedATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerAction import LexerIndexedCustomAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import AND, OR, PrecedencePredicate, Predicate, SemanticContext
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.utils.error_listener import NewErrorListener
+
+
+# Bump when the on-disk layout changes
+FORMAT_VERSION = 2
+
+DEFAULT_CACHE_PATH = os.path.join(build_dir, "TyC.dfa")
+
+RECOGNIZERS = (TyCLexer, TyCParser)
+
+
+def runtime_version() -> str:
+    try:
+        return version("antlr4-python3-runtime")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def fingerprint(recognizer) -> str:
+    """Hash of the serialized ATN the DFA tables were built from."""
+    module = sys.modules[recognizer.__module__]
+    data = ",".join(map(str, module.serializedATN()))
+    return hashlib.sha256(data.encode("ascii")).hexdigest()
+
+
+# ============================================================================
+# Encoding as plain JSON data
+# ============================================================================
+#
+# The tables are written as nested JSON lists and numbers: ATN states and
+# lexer actions by index into the recognizer's ATN, prediction contexts by
+# index into a table shared by every DFA of the recognizer. Loading a cache
+# never runs code from it; an entry that does not fit the ATN is rejected.
+
+
+class _Encoder:
+    """Encodes the DFA tables of one recognizer."""
+
+    def __init__(self, atn):
+        self.actions = {id(a): i for i, a in enumerate(atn.lexerActions or ())}
+        self.contexts = []
+        self._context_ids = {}
+
+    def context(self, ctx):
+        if ctx is None:
+            return None
+        index = self._context_ids.get(id(ctx))
+        if index is not None:
+            return index
+        # Parents first, iteratively: context graphs can be deep
+        stack = [ctx]
+        while stack:
+            top = stack[-1]
+            parents = top.parents if isinstance(top, ArrayPredictionContext) else [top.parentCtx]
+            pending = [
+                p for p in parents if p is not None and id(p) not in self._context_ids
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if id(top) in self._context_ids:
+                continue
+            if top is PredictionContext.EMPTY:
+                entry = ["empty"]
+            elif isinstance(top, ArrayPredictionContext):
+                refs = [None if p is None else self._context_ids[id(p)] for p in top.parents]
+                entry = ["array", refs, list(top.returnStates)]
+            else:
+                parent = top.parentCtx
+                entry = [
+                    "singleton",
+                    None if parent is None else self._context_ids[id(parent)],
+                    top.returnState,
+                ]
+            self._context_ids[id(top)] = len(self.contexts)
+            self.contexts.append(entry)
+        return self._context_ids[id(ctx)]
+
+    def semantic(self, sem):
+        if sem is SemanticContext.NONE:
+            return None
+        if isinstance(sem, Predicate):
+            return ["predicate", sem.ruleIndex, sem.predIndex, sem.isCtxDependent]
+        if isinstance(sem, PrecedencePredicate):
+            return ["precedence", sem.precedence]
+        if isinstance(sem, AND):
+            return ["and", [self.semantic(o) for o in sem.opnds]]
+        if isinstance(sem, OR):
+            return ["or", [self.semantic(o) for o in sem.opnds]]
+        raise TypeError(f"cannot encode semantic context {sem!r}")
+
+    def action(self, action):
+        if isinstance(action, LexerIndexedCustomAction):
+            return ["indexed", action.offset, self.actions[id(action.action)]]
+        return self.actions[id(action)]
+
+    def executor(self, executor):
+        if executor is None:
+            return None
+        return [self.action(a) for a in executor.lexerActions]
+
+    def config(self, c):
+        record = [
+            c.state.stateNumber,
+            c.alt,
+            self.context(c.context),
+            self.semantic(c.semanticContext),
+            c.reachesIntoOuterContext,
+            c.precedenceFilterSuppressed,
+        ]
+        if isinstance(c, LexerATNConfig):
+            record += [self.executor(c.lexerActionExecutor), c.passedThroughNonGreedyDecision]
+        return record
+
+    def config_set(self, configs):
+        conflicting = configs.conflictingAlts
+        return [
+            isinstance(configs, OrderedATNConfigSet),
+            configs.fullCtx,
+            configs.readonly,
+            configs.uniqueAlt,
+            None if conflicting is None else sorted(conflicting),
+            configs.hasSemanticContext,
+            configs.dipsIntoOuterContext,
+            [self.config(c) for c in configs.configs],
+        ]
+
+    def dfa(self, dfa):
+        """Describe a DFA as a flat list of states with edges as indices.
+
+        The states in dfa.states come first, so the dict can be rebuilt from
+        a prefix of the list once every state is complete.
+        """
+        states = list(dfa.states.values())
+        in_dict = len(states)
+        index = {id(s): i for i, s in enumerate(states)}
+
+        def add(state):
+            if state is not None and state is not ATNSimulator.ERROR and id(state) not in index:
+                index[id(state)] = len(states)
+                states.append(state)
+
+        add(dfa.s0)
+        i = 0
+        while i < len(states):
+            for target in states[i].edges or ():
+                add(target)
+            i += 1
+
+        def edge_ref(target):
+            if target is None:
+                return None
+            if target is ATNSimulator.ERROR:
+                return -1
+            return index[id(target)]
+
+        records = []
+        for s in states:
+            predicates = None
+            if s.predicates is not None:
+                predicates = [[self.semantic(p.pred), p.alt] for p in s.predicates]
+            records.append(
+                [
+                    s.stateNumber,
+                    self.config_set(s.configs),
+                    None if s.edges is None else [edge_ref(t) for t in s.edges],
+                    s.isAcceptState,
+                    s.prediction,
+                    self.executor(s.lexerActionExecutor),
+                    s.requiresFullContext,
+                    predicates,
+                ]
+            )
+        s0 = None if dfa.s0 is None else index[id(dfa.s0)]
+        return [dfa.decision, dfa.precedenceDfa, s0, in_dict, records]
+
+
+class _Decoder:
+    """Rebuilds the DFA tables of one recognizer from _Encoder output.
+
+    Malformed input raises ValueError, TypeError, KeyError or IndexError.
+    """
+
+    def __init__(self, atn, contexts):
+        self.atn = atn
+        self.contexts = []
+        for entry in contexts:
+            kind = entry[0]
+            if kind == "empty":
+                ctx = PredictionContext.EMPTY
+            elif kind == "array":
+                parents = [self.context(p) for p in entry[1]]
+                if len(parents) != len(entry[2]):
+                    raise ValueError("array prediction context is inconsistent")
+                ctx = ArrayPredictionContext(parents, list(map(int, entry[2])))
+            elif kind == "singleton":
+                ctx = SingletonPredictionContext.create(self.context(entry[1]), int(entry[2]))
+            else:
+                raise ValueError(f"unknown prediction context {kind!r}")
+            self.contexts.append(ctx)
+
+    def context(self, index):
+        if index is None:
+            return None
+        # Only contexts listed before the one being decoded
+        return _item(self.contexts, index)
+
+    def state(self, number):
+        return _item(self.atn.states, number)
+
+    def semantic(self, record):
+        if record is None:
+            return SemanticContext.NONE
+        kind = record[0]
+        if kind == "predicate":
+            return Predicate(int(record[1]), int(record[2]), bool(record[3]))
+        if kind == "precedence":
+            return PrecedencePredicate(int(record[1]))
+        if kind in ("and", "or"):
+            # The constructors reduce and reorder operands; keep them as saved
+            sem = object.__new__(AND if kind == "and" else OR)
+            sem.opnds = [self.semantic(o) for o in record[1]]
+            return sem
+        raise ValueError(f"unknown semantic context {kind!r}")
+
+    def action(self, record):
+        actions = self.atn.lexerActions or ()
+        if isinstance(record, list):
+            kind, offset, index = record
+            if kind != "indexed":
+                raise ValueError(f"unknown lexer action {kind!r}")
+            return LexerIndexedCustomAction(int(offset), _item(actions, index))
+        return _item(actions, record)
+
+    def executor(self, record):
+        if record is None:
+            return None
+        return LexerActionExecutor([self.action(a) for a in record])
+
+    def config(self, record):
+        state, alt, context, semantic, outer, suppressed = record[:6]
+        context = self.context(context)
+        semantic = self.semantic(semantic)
+        if len(record) == 8:
+            c = LexerATNConfig(self.state(state), int(alt), context, semantic)
+            c.lexerActionExecutor = self.executor(record[6])
+            c.passedThroughNonGreedyDecision = bool(record[7])
+        elif len(record) == 6:
+            c = ATNConfig(self.state(state), int(alt), context, semantic)
+        else:
+            raise ValueError("malformed ATN config")
+        c.reachesIntoOuterContext = int(outer)
+        c.precedenceFilterSuppressed = bool(suppressed)
+        return c
+
+    def config_set(self, record):
+        ordered, full_ctx, readonly, unique, conflicting, semantic, outer, configs = record
+        s = OrderedATNConfigSet() if ordered else ATNConfigSet(bool(full_ctx))
+        s.fullCtx = bool(full_ctx)
+        for c in configs:
+            c = self.config(c)
+            if not readonly:
+                s.getOrAdd(c)
+            s.configs.append(c)
+        s.uniqueAlt = int(unique)
+        s.conflictingAlts = None if conflicting is None else set(conflicting)
+        s.hasSemanticContext = bool(semantic)
+        s.dipsIntoOuterContext = bool(outer)
+        if readonly:
+            s.setReadonly(True)
+        return s
+
+    def dfa(self, dfa, record):
+        """(precedenceDfa, s0, states dict) of dfa from its record."""
+        decision, precedence_dfa, s0, in_dict, records = record
+        if decision != dfa.decision:
+            raise ValueError(f"DFA cache entry for decision {decision} != {dfa.decision}")
+        states = []
+        for number, configs, _, accept, prediction, executor, full_ctx, predicates in records:
+            s = DFAState(int(number), self.config_set(configs))
+            s.isAcceptState = bool(accept)
+            s.prediction = prediction
+            s.lexerActionExecutor = self.executor(executor)
+            s.requiresFullContext = bool(full_ctx)
+            if predicates is not None:
+                s.predicates = [PredPrediction(self.semantic(p), alt) for p, alt in predicates]
+            states.append(s)
+        for s, record in zip(states, records):
+            edges = record[2]
+            if edges is not None:
+                s.edges = [
+                    None if e is None else ATNSimulator.ERROR if e == -1 else _item(states, e)
+                    for e in edges
+                ]
+        return (
+            bool(precedence_dfa),
+            None if s0 is None else _item(states, s0),
+            {s: s for s in states[:in_dict]},
+        )
+
+
+def _item(items, index):
+    """items[index] for a non-negative int index, else IndexError."""
+    if type(index) is not int or not 0 <= index < len(items):
+        raise IndexError(f"index {index!r} out of range")
+    return items[index]
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def dump_dfas(recognizer) -> dict:
+    """Encode recognizer.decisionsToDFA (a generated lexer/parser class)."""
+    encoder = _Encoder(recognizer.atn)
+    dfas = [encoder.dfa(dfa) for dfa in recognizer.decisionsToDFA]
+    return {"contexts": encoder.contexts, "dfas": dfas}
+
+
+def load_dfas(recognizer, data: dict):
+    """Replace recognizer.decisionsToDFA contents in place with dumped tables.
+
+    The list object is shared with every existing ATN simulator of the class,
+    so lexers and parsers created before the load start using it too. The
+    tables are only replaced once all of data has been decoded.
+    """
+    decoder = _Decoder(recognizer.atn, data["contexts"])
+    if len(data["dfas"]) != len(recognizer.decisionsToDFA):
+        raise ValueError("DFA cache does not match the number of decisions")
+    tables = [
+        decoder.dfa(dfa, entry) for dfa, entry in zip(recognizer.decisionsToDFA, data["dfas"])
+    ]
+    for dfa, (precedence_dfa, s0, states) in zip(recognizer.decisionsToDFA, tables):
+        dfa.precedenceDfa = precedence_dfa
+        dfa.s0 = s0
+        dfa._states = states
+
+
+def save_dfa_cache(path: str = DEFAULT_CACHE_PATH, recognizers=RECOGNIZERS):
+    """Write the current DFA tables of recognizers to path."""
+    payload = {
+        "format": FORMAT_VERSION,
+        "runtime": runtime_version(),
+        "recognizers": {
+            r.__name__: {"fingerprint": fingerprint(r), "dfas": dump_dfas(r)}
+            for r in recognizers
+        },
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="ascii") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def load_dfa_cache(path: str = DEFAULT_CACHE_PATH, recognizers=RECOGNIZERS) -> bool:
+    """Preload DFA tables from path.
+
+    Returns False, leaving the tables untouched, if the file is missing,
+    malformed, or was written for another grammar, runtime or format.
+    """
+    try:
+        with open(path, encoding="ascii") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("format") != FORMAT_VERSION or payload.get("runtime") != runtime_version():
+        return False
+    entries = payload.get("recognizers")
+    if not isinstance(entries, dict):
+        return False
+    for r in recognizers:
+        entry = entries.get(r.__name__)
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint(r):
+            return False
+    try:
+        for r in recognizers:
+            load_dfas(r, entries[r.__name__]["dfas"])
+    except (ValueError, TypeError, KeyError, IndexError):
+        # Tables decoded before the bad entry stay loaded; they are valid
+        return False
+    return True
+
+
+def count_dfa_states(recognizer) -> int:
+    return sum(len(dfa.states) for dfa in recognizer.decisionsToDFA)
+
+
+def warm_up(sources):
+    """Lex and parse every source to populate the shared DFA tables.
+
+    Sources with lexical or syntax errors still contribute the decisions made
+    before the error.
+    """
+    for source in sources:
+        parser = TyCParser(CommonTokenStream(TyCLexer(CompactInputStream(source))))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            parser.program()
+        except Exception:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the TyC DFA cache.")
+    parser.add_argument("files", nargs="+", help="TyC source files to train on")
+    parser.add_argument("--output", default=DEFAULT_CACHE_PATH)
+    args = parser.parse_args(argv)
+
+    sources = []
+    for name in args.files:
+        with open(name, encoding="utf-8") as f:
+            sources.append(f.read())
+
+    warm_up(sources)
+    save_dfa_cache(args.output)
+    print(
+        f"Trained on {len(sources)} sources: "
+        f"{count_dfa_states(TyCLexer)} lexer / {count_dfa_states(TyCParser)} parser "
+        f"DFA states written to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""
+Direct-to-AST parser for TyC programming language.
+TyCParser builds a full parse tree first, with nine nested contexts around
+every primary expression, and ASTGeneration then walks it to build the AST.
+This module contains DirectParser, a recursive-descent parser that builds the
+nodes of src/utils/nodes.py straight from the token list, using precedence
+climbing for the binary operator levels, and parse_ast(), which selects
+between the two paths per call.
+
+DirectParser accepts exactly the programs TyC.g4 accepts and builds the same
+AST. It does not report errors itself: on a lexical or syntax error the input
+is parsed again by TyCParser, so the raised LexerError or SyntaxException is
+exactly the one of the ANTLR path.
+"""
+
+from antlr4 import CommonTokenStream
+from antlr4.Token import Token
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from lexererr import LexerError
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.fast_lexer import create_lexer
+from src.parser.stack_safe import safe_ast
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import *
+
+_ID = TyCLexer.ID
+_SEMI = TyCLexer.SEMI
+_COMMA = TyCLexer.COMMA
+_COLON = TyCLexer.COLON
+_LPAREN = TyCLexer.LPAREN
+_RPAREN = TyCLexer.RPAREN
+_LBRACE = TyCLexer.LBRACE
+_RBRACE = TyCLexer.RBRACE
+_ASSIGN = TyCLexer.ASSIGN
+_DOT = TyCLexer.DOT
+_AUTO = TyCLexer.AUTO
+_CASE = TyCLexer.CASE
+_DEFAULT = TyCLexer.DEFAULT
+
+# Binary operator token -> precedence level; all levels are left-associative
+_PRECEDENCE = {
+    TyCLexer.OR: 1,
+    TyCLexer.AND: 2,
+    TyCLexer.EQ: 3,
+    TyCLexer.NEQ: 3,
+    TyCLexer.LT: 4,
+    TyCLexer.GT: 4,
+    TyCLexer.LE: 4,
+    TyCLexer.GE: 4,
+    TyCLexer.PLUS: 5,
+    TyCLexer.MINUS: 5,
+    TyCLexer.MUL: 6,
+    TyCLexer.DIV: 6,
+    TyCLexer.MOD: 6,
+}
+
+_PREFIX_OPS = frozenset(
+    (TyCLexer.NOT, TyCLexer.PLUS, TyCLexer.MINUS, TyCLexer.INC, TyCLexer.DEC)
+)
+_POSTFIX_OPS = frozenset((TyCLexer.INC, TyCLexer.DEC))
+
+# Types are canonical, so every declaration can share these
+_PRIMITIVE_TYPES = {
+    TyCLexer.INT: IntType(),
+    TyCLexer.FLOAT: FloatType(),
+    TyCLexer.STRING: StringType(),
+}
+
+# Leaf token type -> (node class, converter from text to value)
+_LEAVES = {
+    _ID: (Identifier, str),
+    TyCLexer.INTLIT: (IntLiteral, int),
+    TyCLexer.FLOATLIT: (FloatLiteral, float),
+    TyCLexer.STRINGLIT: (StringLiteral, str),
+}
+
+# Tokens that end the statement list of a switch case
+_CASE_END = frozenset((_CASE, _DEFAULT, _RBRACE))
+
+
+class _Mismatch(Exception):
+    """The input is not a TyC program; TyCParser reports the exact error."""
+
+
+class DirectParser:
+    """Recursive-descent TyC parser producing AST nodes.
+
+    types and texts are the token types and texts of the whole source,
+    ending with EOF. With a LeafTable, identifiers and literals are
+    hash-consed as in ASTGeneration.
+    """
+
+    def __init__(self, types: list, texts: list, leaves: LeafTable = None):
+        # Extra EOFs so two-token lookahead never runs off the end
+        self.types = types + [Token.EOF, Token.EOF]
+        self.texts = texts
+        self.leaves = leaves
+        self.pos = 0
+        # Last postfix expression that may stand on the left of '='
+        self._lhs = None
+
+    def _expect(self, ttype: int) -> str:
+        if self.types[self.pos] != ttype:
+            raise _Mismatch()
+        self.pos += 1
+        return self.texts[self.pos - 1]
+
+    # ========================================================================
+    # Declarations
+    # ========================================================================
+
+    def parse_program(self) -> Program:
+        decls = []
+        while self.types[self.pos] != Token.EOF:
+            decls.append(self._decl())
+        if not decls:
+            raise _Mismatch()
+        return Program(decls)
+
+    def _decl(self):
+        types = self.types
+        t = types[self.pos]
+        if t == TyCLexer.STRUCT:
+            return self._struct_decl()
+        if t == TyCLexer.VOID:
+            if types[self.pos + 1] == TyCLexer.MAIN:
+                self.pos += 1
+                name = self._expect(TyCLexer.MAIN)
+                self._expect(_LPAREN)
+                self._expect(_RPAREN)
+                return FuncDecl(VoidType(), name, [], self._block())
+            self.pos += 1
+            return self._func_decl(VoidType())
+        if t == _ID and types[self.pos + 1] == _LPAREN:
+            return self._func_decl(None)
+        if (t in _PRIMITIVE_TYPES or t == _ID) and types[self.pos + 2] == _LPAREN:
+            return self._func_decl(self._type())
+        return self._var_decl()
+
+    def _struct_decl(self) -> StructDecl:
+        self.pos += 1
+        name = self._expect(_ID)
+        self._expect(_LBRACE)
+        members = []
+        while self.types[self.pos] != _RBRACE:
+            member_type = self._type()
+            members.append(MemberDecl(member_type, self._expect(_ID)))
+            self._expect(_SEMI)
+        self.pos += 1
+        self._expect(_SEMI)
+        return StructDecl(name, members)
+
+    def _func_decl(self, return_type) -> FuncDecl:
+        name = self._expect(_ID)
+        self._expect(_LPAREN)
+        params = []
+        if self.types[self.pos] != _RPAREN:
+            while True:
+                param_type = self._type()
+                params.append(Param(param_type, self._expect(_ID)))
+                if self.types[self.pos] != _COMMA:
+                    break
+                self.pos += 1
+        self._expect(_RPAREN)
+        return FuncDecl(return_type, name, params, self._block())
+
+    def _type(self):
+        t = self.types[self.pos]
+        primitive = _PRIMITIVE_TYPES.get(t)
+        if primitive is not None:
+            self.pos += 1
+            return primitive
+        return StructType(self._expect(_ID))
+
+    def _var_decl(self) -> VarDecl:
+        if self.types[self.pos] == _AUTO:
+            self.pos += 1
+            var_type = None
+        else:
+            var_type = self._type()
+        name = self._expect(_ID)
+        init_value = None
+        if self.types[self.pos] == _ASSIGN:
+            self.pos += 1
+            init_value = self._expr()
+        self._expect(_SEMI)
+        return VarDecl(var_type, name, init_value)
+
+    # ========================================================================
+    # Statements
+    # ========================================================================
+
+    def _starts_var_decl(self) -> bool:
+        t = self.types[self.pos]
+        return t in _PRIMITIVE_TYPES or t == _AUTO or (t == _ID and self.types[self.pos + 1] == _ID)
+
+    def _block(self) -> BlockStmt:
+        self._expect(_LBRACE)
+        statements = []
+        while self.types[self.pos] != _RBRACE:
+            statements.append(self._var_decl() if self._starts_var_decl() else self._stmt())
+        self.pos += 1
+        return BlockStmt(statements)
+
+    def _stmt(self):
+        t = self.types[self.pos]
+        if t == _LBRACE:
+            return self._block()
+        if t == TyCLexer.IF:
+            self.pos += 1
+            condition = self._condition()
+            then_stmt = self._stmt()
+            else_stmt = None
+            if self.types[self.pos] == TyCLexer.ELSE:
+                self.pos += 1
+                else_stmt = self._stmt()
+            return IfStmt(condition, then_stmt, else_stmt)
+        if t == TyCLexer.WHILE:
+            self.pos += 1
+            condition = self._condition()
+            return WhileStmt(condition, self._stmt())
+        if t == TyCLexer.FOR:
+            return self._for_stmt()
+        if t == TyCLexer.SWITCH:
+            return self._switch_stmt()
+        if t == TyCLexer.BREAK:
+            self.pos += 1
+            self._expect(_SEMI)
+            return BreakStmt()
+        if t == TyCLexer.CONTINUE:
+            self.pos += 1
+            self._expect(_SEMI)
+            return ContinueStmt()
+        if t == TyCLexer.RETURN:
+            self.pos += 1
+            expr = None if self.types[self.pos] == _SEMI else self._expr()
+            self._expect(_SEMI)
+            return ReturnStmt(expr)
+        expr = self._expr()
+        self._expect(_SEMI)
+        return ExprStmt(expr)
+
+    def _condition(self):
+        self._expect(_LPAREN)
+        expr = self._expr()
+        self._expect(_RPAREN)
+        return expr
+
+    def _for_stmt(self) -> ForStmt:
+        self.pos += 1
+        self._expect(_LPAREN)
+        init = None
+        if self.types[self.pos] != _SEMI:
+            if self._starts_var_decl():
+                if self.types[self.pos] == _AUTO:
+                    self.pos += 1
+                    var_type = None
+                else:
+                    var_type = self._type()
+                name = self._expect(_ID)
+                self._expect(_ASSIGN)
+                init = VarDecl(var_type, name, self._expr())
+            else:
+                lhs = self._postfix()
+                init = ExprStmt(self._assignment(lhs))
+        self._expect(_SEMI)
+        condition = None if self.types[self.pos] == _SEMI else self._expr()
+        self._expect(_SEMI)
+        update = None
+        if self.types[self.pos] != _RPAREN:
+            update = self._unary()
+            if self.types[self.pos] == _ASSIGN:
+                update = self._assignment(update)
+        self._expect(_RPAREN)
+        return ForStmt(init, condition, update, self._stmt())
+
+    def _switch_stmt(self) -> SwitchStmt:
+        self.pos += 1
+        expr = self._condition()
+        self._expect(_LBRACE)
+        cases = []
+        default_case = None
+        while True:
+            t = self.types[self.pos]
+            if t == _CASE:
+                self.pos += 1
+                case_expr = self._expr()
+                self._expect(_COLON)
+                cases.append(CaseStmt(case_expr, self._case_body()))
+            elif t == _DEFAULT and default_case is None:
+                self.pos += 1
+                self._expect(_COLON)
+                default_case = DefaultStmt(self._case_body())
+            else:
+                break
+        self._expect(_RBRACE)
+        return SwitchStmt(expr, cases, default_case)
+
+    def _case_body(self) -> list:
+        statements = []
+        while self.types[self.pos] not in _CASE_END:
+            statements.append(self._var_decl() if self._starts_var_decl() else self._stmt())
+        return statements
+
+    # ========================================================================
+    # Expressions
+    # ========================================================================
+
+    def _expr(self):
+        expr = self._binary(1)
+        if self.types[self.pos] == _ASSIGN:
+            return self._assignment(expr)
+        return expr
+
+    def _assignment(self, lhs) -> AssignExpr:
+        """Parse '= expr' after lhs, which must be an assignable postfix expression."""
+        if lhs is not self._lhs:
+            raise _Mismatch()
+        self._expect(_ASSIGN)
+        return AssignExpr(lhs, self._expr())
+
+    def _binary(self, min_precedence: int):
+        left = self._unary()
+        types = self.types
+        while True:
+            precedence = _PRECEDENCE.get(types[self.pos])
+            if precedence is None or precedence < min_precedence:
+                return left
+            operator = self.texts[self.pos]
+            self.pos += 1
+            left = BinaryOp(left, operator, self._binary(precedence + 1))
+
+    def _unary(self):
+        if self.types[self.pos] in _PREFIX_OPS:
+            operator = self.texts[self.pos]
+            self.pos += 1
+            return PrefixOp(operator, self._unary())
+        return self._postfix()
+
+    def _postfix(self):
+        types = self.types
+        texts = self.texts
+        t = types[self.pos]
+        text = texts[self.pos]
+        self.pos += 1
+        # The grammar's lhs: a bare ID, or any postfix chain ending in '.member'
+        assignable = False
+        leaf = _LEAVES.get(t)
+        if leaf is not None:
+            cls, convert = leaf
+            if self.leaves is None:
+                expr = cls(convert(text))
+            else:
+                expr = self.leaves.leaf(cls, convert(text))
+            assignable = t == _ID
+        elif t == _LPAREN:
+            expr = self._expr()
+            self._expect(_RPAREN)
+        else:
+            raise _Mismatch()
+
+        while True:
+            t = types[self.pos]
+            if t == _DOT:
+                self.pos += 1
+                expr = MemberAccess(expr, self._expect(_ID))
+                assignable = True
+            elif t == _LPAREN:
+                self.pos += 1
+                args = []
+                if types[self.pos] != _RPAREN:
+                    args.append(self._expr())
+                    while types[self.pos] == _COMMA:
+                        self.pos += 1
+                        args.append(self._expr())
+                self._expect(_RPAREN)
+                callee = expr.name if isinstance(expr, Identifier) else expr
+                expr = FuncCall(callee, args)
+                assignable = False
+            elif t in _POSTFIX_OPS:
+                expr = PostfixOp(texts[self.pos], expr)
+                self.pos += 1
+                assignable = False
+            else:
+                break
+        self._lhs = expr if assignable else None
+        return expr
+
+
+# ============================================================================
+# Backend selection
+# ============================================================================
+
+
+def antlr_ast(input_stream, lexer_backend: str = "antlr") -> Program:
+    """Parse with TyCParser (SLL, then LL) and convert the tree with ASTGeneration."""
+    parser = TyCParser(CommonTokenStream(create_lexer(input_stream, lexer_backend)))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return ASTGeneration().visit(parse_two_stage(parser))
+
+
+def direct_ast(input_stream, lexer_backend: str = "antlr") -> Program:
+    """Parse with DirectParser, falling back to antlr_ast() to report errors."""
+    lexer = create_lexer(input_stream, lexer_backend)
+    types = []
+    texts = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            types.append(t.type)
+            texts.append(t.text)
+            if t.type == Token.EOF:
+                break
+        return DirectParser(types, texts).parse_program()
+    except (LexerError, _Mismatch):
+        pass
+    input_stream.seek(0)
+    return antlr_ast(input_stream, lexer_backend)
+
+
+PARSER_BACKENDS = {
+    "antlr": antlr_ast,
+    "direct": direct_ast,
+    "safe": safe_ast,
+}
+
+
+def parse_ast(input_stream, backend: str = "antlr", lexer_backend: str = "antlr") -> Program:
+    """Build the AST of input_stream with the named parser backend.
+
+    Both backends return equal trees and raise the same LexerError or
+    SyntaxException for invalid input.
+    """
+    try:
+        parse = PARSER_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown parser backend '{backend}', expected one of "
+            + ", ".join(sorted(PARSER_BACKENDS))
+        ) from None
+    return parse(input_stream, lexer_backend)
@@ -0,0 +1,152 @@
+"""
+Parallel parsing of TyC sources by top-level declaration.
+Top-level declarations cannot nest, so a brace-depth scan over a source
+finds every declaration boundary: a ';' at depth 0, or a '}' returning to
+depth 0 that is not followed by ';' (which would end a struct declaration).
+The scan only needs to recognize string literals and comments, whose braces
+and semicolons do not count, so it runs as one regular expression instead
+of a full lex. This module cuts a large source at those boundaries into
+batches of whole declarations, parses the batches in a process pool and
+merges their declarations into one Program in source order.
+
+Each worker lexes its batch starting at the batch's absolute line and
+column, so token positions, and any position the AST records, are those of
+the whole source without remapping. A source that does not split cleanly or
+has a batch that fails to lex or parse is parsed again sequentially, so
+errors are exactly those of a sequential parse.
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+
+from build.TyCParser import TyCParser
+from lexererr import LexerError
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer, seek_lexer
+from src.parser.dfa_cache import load_dfa_cache
+from src.parser.direct_parser import antlr_ast
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener, SyntaxException
+from src.utils.nodes import Program
+
+# String literals and comments (as in TyC.g4), and the tokens the scan counts.
+# A malformed string is not matched, so its contents may be mis-split, but
+# such a source fails to lex in some batch and is parsed sequentially.
+_SCAN = re.compile(r'"(?:[^"\\\r\n]|\\[btnfr"\\])*"|//[^\r\n]*|/\*.*?\*/|[{};]', re.S)
+_SKIP = re.compile(r"(?:[ \t\f\r\n]+|//[^\r\n]*|/\*.*?\*/)*", re.S)
+
+# Characters per batch sent to a worker; large enough to amortize the transfer
+BATCH_CHARS = 256 * 1024
+
+# Shorter sources are parsed in this process
+MIN_PARALLEL_CHARS = 2 * BATCH_CHARS
+
+
+def split_declarations(source: str):
+    """End offsets of the top-level declarations of source.
+
+    Returns None if the braces do not balance; a source whose split is
+    wrong in any other way fails to parse in some batch.
+    """
+    ends = []
+    depth = 0
+    for m in _SCAN.finditer(source):
+        c = m.group()
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth < 0:
+                return None
+            end = m.end()
+            if depth == 0 and not source.startswith(";", _SKIP.match(source, end).end()):
+                ends.append(end)
+        elif c == ";" and depth == 0:
+            ends.append(m.end())
+    return None if depth else ends
+
+
+def batch_declarations(source: str, ends, batch_chars: int = BATCH_CHARS):
+    """Cut source after declarations into (text, line, column) batches of about batch_chars.
+
+    The batches cover the whole source; line and column are those of the
+    first character of each batch, counted like the lexer does.
+    """
+    batches = []
+    start = 0
+    line, column = 1, 0
+    # The last batch runs to the end of source, trailing comments included
+    for end in ends[:-1]:
+        if end - start >= batch_chars:
+            batches.append((source[start:end], line, column))
+            newlines = source.count("\n", start, end)
+            if newlines:
+                line += newlines
+                column = end - source.rfind("\n", start, end) - 1
+            else:
+                column += end - start
+            start = end
+    batches.append((source[start:], line, column))
+    return batches
+
+
+def _init_worker():
+    load_dfa_cache()
+
+
+def _parse_batch(batch):
+    """Declarations of (text, line, column), a run of whole declarations.
+
+    Returns None if the batch does not parse; the caller then re-parses the
+    whole source for the exact error.
+    """
+    text, line, column = batch
+    lexer = create_lexer(CompactInputStream(text), "fast")
+    seek_lexer(lexer, 0, line, column)
+    parser = TyCParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        return ASTGeneration().visit(parse_two_stage(parser)).decls
+    except (SyntaxException, LexerError):
+        return None
+
+
+def parse_parallel(source: str, workers: int = None, batch_chars: int = BATCH_CHARS,
+                   min_chars: int = MIN_PARALLEL_CHARS, executor=None) -> Program:
+    """The Program of source, parsing batches of declarations in parallel.
+
+    workers defaults to os.cpu_count(); pass an existing executor to reuse
+    its processes across calls. Raises the LexerError or SyntaxException a
+    sequential parse (antlr_ast) would.
+    """
+    sequential = lambda: antlr_ast(CompactInputStream(source), "fast")
+    if len(source) < min_chars:
+        return sequential()
+    ends = split_declarations(source)
+    if not ends:
+        return sequential()
+
+    batches = batch_declarations(source, ends, batch_chars)
+    if executor is None:
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            results = list(pool.map(_parse_batch, batches))
+    else:
+        results = list(executor.map(_parse_batch, batches))
+
+    decls = []
+    for result in results:
+        if result is None:
+            return sequential()
+        decls.extend(result)
+    return Program(decls)
@@ -0,0 +1,112 @@
+"""
+Reusable lexer/parser instances for batches of TyC sources.
+Building a lexer, token stream and TyCParser and installing the error
+listener for every snippet costs more than parsing most test-sized inputs.
+This module contains the ParserPool class, which keeps one of each and
+points them at the next source with the runtime's own setInputStream and
+setTokenStream resets, and parse_many, which runs a batch of sources
+through a pool in this process or in a pool per worker process. All
+parsers share the class-level DFA tables of TyCParser (load_dfa_cache()
+warms them from disk in every worker).
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+
+from build.TyCParser import TyCParser
+from lexererr import LexerError
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.dfa_cache import load_dfa_cache
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener, SyntaxException
+
+
+class ParserPool:
+    """One lexer, token stream, parser and AST builder, reused per source.
+
+    A pool is not thread-safe; use one per thread or process.
+    """
+
+    def __init__(self, backend: str = "antlr"):
+        self.lexer = create_lexer(CompactInputStream(""), backend)
+        self.stream = CommonTokenStream(self.lexer)
+        self.parser = TyCParser(self.stream)
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+        self.ast_generation = ASTGeneration()
+
+    def parse(self, source: str, rule: str = "program"):
+        """Parse source (SLL, then LL on failure) and return the parse tree.
+
+        The tree is only valid until the next call. Raises LexerError or
+        SyntaxException like a fresh parser would.
+        """
+        self.lexer.inputStream = CompactInputStream(source)
+        self.stream.setTokenSource(self.lexer)
+        self.parser.setTokenStream(self.stream)
+        return parse_two_stage(self.parser, rule)
+
+    def build_ast(self, source: str):
+        """The Program of source, as ASTGeneration builds it."""
+        return self.ast_generation.visit(self.parse(source))
+
+
+def _parse_all(pool: ParserPool, sources, ast: bool) -> list:
+    results = []
+    for source in sources:
+        try:
+            if ast:
+                results.append(pool.build_ast(source))
+            else:
+                pool.parse(source)
+                results.append(None)
+        except (SyntaxException, LexerError) as e:
+            results.append(e)
+    return results
+
+
+_worker_pool = None
+
+
+def _init_worker(backend: str):
+    global _worker_pool
+    load_dfa_cache()
+    _worker_pool = ParserPool(backend)
+
+
+def _parse_chunk(args):
+    sources, ast = args
+    return _parse_all(_worker_pool, sources, ast)
+
+
+def parse_many(sources, ast: bool = True, workers: int = 0, backend: str = "antlr",
+               pool: ParserPool = None, chunk_size: int = None) -> list:
+    """Parse every source, returning one result per source in order.
+
+    A result is the source's Program (or None with ast=False, which only
+    checks the syntax), or the LexerError or SyntaxException it raised.
+    With workers=0 the sources are parsed in this process, on pool if
+    given; otherwise chunks of chunk_size sources are spread over that many
+    worker processes, each with its own ParserPool. Process start-up makes
+    workers pay off only for large batches.
+    """
+    sources = list(sources)
+    if not workers:
+        return _parse_all(pool or ParserPool(backend), sources, ast)
+
+    if chunk_size is None:
+        # A few chunks per worker balance uneven sources
+        chunk_size = max(1, -(-len(sources) // (4 * workers)))
+    chunks = [(sources[i : i + chunk_size], ast) for i in range(0, len(sources), chunk_size)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(backend,)) as executor:
+        return [result for chunk in executor.map(_parse_chunk, chunks) for result in chunk]
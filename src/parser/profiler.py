@@ -0,0 +1,303 @@
+"""
+Decision profiling for TyCParser.
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module
+provides one: a ParserATNSimulator that records, for every prediction
+decision, how often it runs, how long adaptive prediction takes, how far it
+looks ahead in SLL mode, how often it falls back to full LL prediction and
+how often that finds an ambiguity or a context sensitivity. profile_sources
+parses a set of sources under it and reports the totals per decision or per
+rule as a sorted text table and as JSON, so grammar hot spots can be tracked
+across grammar changes.
+
+Usage:
+    python -m src.parser.profiler [--json PATH] [--sort KEY] [--by-rule] files ...
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.dfa.DFA import DFA
+
+from build.TyCParser import TyCParser
+from lexererr import LexerError
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import LEXER_BACKENDS, create_lexer
+from src.utils.error_listener import NewErrorListener, SyntaxException
+
+DEFAULT_JSON_PATH = os.path.join(project_root, "reports", "parser_profile.json")
+
+# Columns of the text table: (key, header)
+COLUMNS = (
+    ("decision", "decision"),
+    ("rule", "rule"),
+    ("invocations", "calls"),
+    ("time_ms", "time ms"),
+    ("sll_lookahead_avg", "SLL avg k"),
+    ("sll_max_lookahead", "SLL max k"),
+    ("ll_fallbacks", "LL"),
+    ("ll_max_lookahead", "LL max k"),
+    ("ambiguities", "ambig"),
+    ("context_sensitivities", "ctx sens"),
+)
+
+SORT_KEYS = ("time_ms", "invocations", "sll_max_lookahead", "ll_fallbacks",
+             "ll_max_lookahead", "ambiguities", "decision", "rule")
+
+
+class DecisionInfo:
+    """Prediction statistics of one decision, or of all decisions of a rule."""
+
+    def __init__(self, decision, rule: str):
+        self.decision = decision
+        self.rule = rule
+        self.invocations = 0
+        self.time_ns = 0
+        self.sll_lookahead_total = 0
+        self.sll_max_lookahead = 0
+        self.ll_fallbacks = 0
+        self.ll_lookahead_total = 0
+        self.ll_max_lookahead = 0
+        self.ambiguities = 0
+        self.context_sensitivities = 0
+
+    def add(self, other: "DecisionInfo"):
+        self.invocations += other.invocations
+        self.time_ns += other.time_ns
+        self.sll_lookahead_total += other.sll_lookahead_total
+        self.sll_max_lookahead = max(self.sll_max_lookahead, other.sll_max_lookahead)
+        self.ll_fallbacks += other.ll_fallbacks
+        self.ll_lookahead_total += other.ll_lookahead_total
+        self.ll_max_lookahead = max(self.ll_max_lookahead, other.ll_max_lookahead)
+        self.ambiguities += other.ambiguities
+        self.context_sensitivities += other.context_sensitivities
+
+    def as_dict(self) -> dict:
+        return {
+            "decision": self.decision,
+            "rule": self.rule,
+            "invocations": self.invocations,
+            "time_ms": round(self.time_ns / 1e6, 3),
+            "sll_lookahead_total": self.sll_lookahead_total,
+            "sll_lookahead_avg": round(self.sll_lookahead_total / self.invocations, 2)
+            if self.invocations else 0.0,
+            "sll_max_lookahead": self.sll_max_lookahead,
+            "ll_fallbacks": self.ll_fallbacks,
+            "ll_lookahead_total": self.ll_lookahead_total,
+            "ll_max_lookahead": self.ll_max_lookahead,
+            "ambiguities": self.ambiguities,
+            "context_sensitivities": self.context_sensitivities,
+        }
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator that fills a DecisionInfo per decision.
+
+    Lookahead depth is the number of tokens prediction examined, counted
+    like ANTLR's Java profiler: SLL depth is the index of the last token
+    matched against the DFA or ATN minus the decision's start index, plus
+    one; LL depth is measured the same way over the full-context pass.
+    """
+
+    def __init__(self, parser, decisionToDFA=None):
+        atn = parser.atn
+        if decisionToDFA is None:
+            # Private tables, so results do not depend on earlier parses
+            decisionToDFA = [DFA(atn.getDecisionState(i), i)
+                             for i in range(len(atn.decisionToState))]
+        super().__init__(parser, atn, decisionToDFA, parser.sharedContextCache)
+        names = parser.ruleNames
+        self.decisions = [
+            DecisionInfo(i, names[state.ruleIndex])
+            for i, state in enumerate(atn.decisionToState)
+        ]
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._current = -1
+
+    def adaptivePredict(self, input, decision: int, outerContext):
+        info = self.decisions[decision]
+        start = input.index
+        self._sll_stop = -1
+        self._ll_stop = -1
+        self._current = decision
+        started = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info.time_ns += time.perf_counter_ns() - started
+            info.invocations += 1
+            self._current = -1
+            if self._sll_stop >= 0:
+                k = self._sll_stop - start + 1
+                info.sll_lookahead_total += k
+                if k > info.sll_max_lookahead:
+                    info.sll_max_lookahead = k
+            if self._ll_stop >= 0:
+                k = self._ll_stop - start + 1
+                info.ll_lookahead_total += k
+                if k > info.ll_max_lookahead:
+                    info.ll_max_lookahead = k
+
+    def getExistingTargetState(self, previousD, t: int):
+        self._sll_stop = self._input.index
+        return super().getExistingTargetState(previousD, t)
+
+    def computeTargetState(self, dfa, previousD, t: int):
+        self._sll_stop = self._input.index
+        return super().computeTargetState(dfa, previousD, t)
+
+    def computeReachSet(self, closure, t: int, fullCtx: bool):
+        if fullCtx:
+            self._ll_stop = self._input.index
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex: int,
+                                    stopIndex: int):
+        self.decisions[dfa.decision].ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex,
+                                            stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction: int, configs, startIndex: int,
+                                 stopIndex: int):
+        self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex: int, stopIndex: int, exact: bool,
+                        ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def profile_sources(sources, backend: str = "antlr"):
+    """Parse every (name, source) pair under one ProfilingATNSimulator.
+
+    The sources share fresh DFA tables, as one cold process would. Tokens
+    are buffered before parsing so lexing is not timed. Returns the
+    simulator and a list of per-file results (name, token count and the
+    lexical or syntax error message, if any).
+    """
+    simulator = None
+    files = []
+    for name, source in sources:
+        lexer = create_lexer(CompactInputStream(source), backend)
+        stream = CommonTokenStream(lexer)
+        error = None
+        try:
+            stream.fill()
+        except LexerError as e:
+            error = str(e)
+        parser = TyCParser(stream)
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        if simulator is None:
+            simulator = ProfilingATNSimulator(parser)
+        else:
+            simulator.parser = parser
+        parser._interp = simulator
+        if error is None:
+            try:
+                parser.program()
+            except (SyntaxException, LexerError) as e:
+                error = str(e)
+        files.append({"file": name, "tokens": len(stream.tokens), "error": error})
+    return simulator, files
+
+
+def rule_totals(decisions) -> list:
+    """DecisionInfo totals per rule, for rules with at least one decision."""
+    rules = {}
+    for info in decisions:
+        total = rules.get(info.rule)
+        if total is None:
+            total = rules[info.rule] = DecisionInfo(None, info.rule)
+        total.add(info)
+    return list(rules.values())
+
+
+def sort_rows(rows: list, key: str) -> list:
+    """Rows (as_dict() results) sorted by key, largest first for counts."""
+    if key in ("decision", "rule"):
+        return sorted(rows, key=lambda r: (r[key] is None, r[key]))
+    return sorted(rows, key=lambda r: (-r[key], r["rule"]))
+
+
+def format_table(rows: list, by_rule: bool = False) -> str:
+    columns = [c for c in COLUMNS if not (by_rule and c[0] == "decision")]
+    cells = [[h for _, h in columns]]
+    cells += [["" if r[k] is None else str(r[k]) for k, _ in columns] for r in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    lines = []
+    for n, row in enumerate(cells):
+        # Left-align the rule name, right-align the numbers
+        lines.append("  ".join(
+            c.ljust(w) if columns[i][0] == "rule" else c.rjust(w)
+            for i, (c, w) in enumerate(zip(row, widths))
+        ).rstrip())
+        if n == 0:
+            lines.append("  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def build_report(simulator, files) -> dict:
+    decisions = simulator.decisions if simulator else []
+    return {
+        "files": files,
+        "decisions": [d.as_dict() for d in decisions],
+        "rules": [r.as_dict() for r in rule_totals(decisions)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile TyCParser prediction decisions.")
+    parser.add_argument("files", nargs="+", help="TyC source files to parse")
+    parser.add_argument("--json", default=DEFAULT_JSON_PATH,
+                        help=f"JSON report path, '-' for stdout (default: {DEFAULT_JSON_PATH})")
+    parser.add_argument("--sort", default="time_ms", choices=SORT_KEYS)
+    parser.add_argument("--by-rule", action="store_true", help="one row per rule")
+    parser.add_argument("--all", action="store_true", help="include decisions never invoked")
+    parser.add_argument("--backend", default="antlr", choices=sorted(LEXER_BACKENDS))
+    args = parser.parse_args(argv)
+
+    sources = []
+    for name in args.files:
+        with open(name, encoding="utf-8", newline="") as f:
+            sources.append((name, f.read()))
+
+    simulator, files = profile_sources(sources, args.backend)
+    report = build_report(simulator, files)
+
+    rows = report["rules" if args.by_rule else "decisions"]
+    if not args.all:
+        rows = [r for r in rows if r["invocations"]]
+    text = format_table(sort_rows(rows, args.sort), args.by_rule)
+    failed = [f for f in files if f["error"]]
+    summary = f"Profiled {len(files)} files ({len(failed)} with errors)"
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        print(text, file=sys.stderr)
+        print(summary, file=sys.stderr)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(report, out, indent=2)
+        print(text)
+        print(f"{summary}; JSON report written to {args.json}")
+    for f in failed:
+        print(f"{f['file']}: {f['error']}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
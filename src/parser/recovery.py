@@ -0,0 +1,312 @@
+"""
+Multi-error syntax checking for TyC sources.
+NewErrorListener raises on the first syntax error, which is what the
+compiler wants, but a linter run over a corpus then reports one error per
+file per run. This module checks a source in a recovering mode instead,
+collecting syntax errors with CollectingErrorListener and lexical ones with
+the lexer's recovering mode.
+
+Recovery is panic mode at statement and declaration boundaries. ANTLR's
+single-token insertion and deletion still repair a missing or extra token
+in place, but never delete or insert a ';' or '}', which would merge the
+next statement into the broken one. Any other error unwinds to the
+innermost statement, local or member variable, or top-level declaration
+being parsed, which skips ahead to the next ';' or a '}' that ends it,
+stopping early at a '}' that closes the enclosing block or a keyword that
+starts a declaration, and parsing resumes with the next one. Top-level junk
+is skipped to the next declaration. Until a token matches again ANTLR
+suppresses the follow-on errors of one mistake.
+
+Recovery work is bounded: the check stops after max_errors reported errors
+or RECOVERIES_PER_ERROR recovery attempts per allowed error, and skipped
+tokens are never parsed again, so a file that is mostly garbage costs no
+more than a valid one of the same size.
+
+The first diagnostic is the error a default parse raises, unless a lexical
+error comes first. Compilation keeps the first-error behavior; this mode is
+only for reporting.
+
+Usage:
+    python -m src.parser.recovery [--max-errors N] [--backend NAME] files ...
+"""
+
+import argparse
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+from antlr4.IntervalSet import IntervalSet
+from antlr4.Token import Token
+from antlr4.error.ErrorStrategy import DefaultErrorStrategy
+from antlr4.error.Errors import InputMismatchException
+
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import LEXER_BACKENDS, create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import CollectingErrorListener
+
+# Errors reported before a check gives up on the rest of the source
+MAX_ERRORS = 100
+
+# Recovery attempts allowed per allowed error. One mistake deep in an
+# expression unwinds through every enclosing rule, each of which recovers
+# once; garbage input makes ANTLR recover at almost every token.
+RECOVERIES_PER_ERROR = 20
+
+# Tokens that start a declaration; a skip stops before them
+_DECL_START = frozenset(
+    (
+        TyCParser.STRUCT,
+        TyCParser.VOID,
+        TyCParser.INT,
+        TyCParser.FLOAT,
+        TyCParser.STRING,
+        TyCParser.AUTO,
+    )
+)
+
+# Tokens that end a statement; in-place repairs never add or drop them
+_BOUNDARY_END = frozenset((TyCParser.SEMI, TyCParser.RBRACE))
+
+# Where panic mode outside a boundary rule stops
+_RECOVERY_SET = IntervalSet()
+for _t in _DECL_START:
+    _RECOVERY_SET.addOne(_t)
+_RECOVERY_SET.addOne(Token.EOF)
+
+
+class RecoveryLimit(Exception):
+    """Raised when a check has spent its error or recovery budget."""
+
+
+class _Resync(Exception):
+    """Unwinds the parser to the innermost boundary rule after an error."""
+
+    def __init__(self, offending: int):
+        super().__init__()
+        # Index of the token the error was found at, possibly past the
+        # parser's position when prediction looked ahead
+        self.offending = offending
+
+
+class BoundaryErrorStrategy(DefaultErrorStrategy):
+    """Error strategy of RecoveringParser, counting errors and recoveries.
+
+    Reaching max_errors + 1 errors or more than max_recoveries recovery
+    attempts raises RecoveryLimit.
+    """
+
+    def __init__(self, max_errors: int = MAX_ERRORS, max_recoveries: int = None):
+        super().__init__()
+        self.max_errors = max_errors
+        self.max_recoveries = (
+            RECOVERIES_PER_ERROR * max_errors if max_recoveries is None else max_recoveries
+        )
+        self.errors = 0
+        self.recoveries = 0
+
+    def beginErrorCondition(self, recognizer):
+        # Every reported error, including those of sync() and recoverInline(),
+        # starts an error condition; suppressed follow-on errors do not.
+        if self.errors == self.max_errors:
+            raise RecoveryLimit()
+        self.errors += 1
+        super().beginErrorCondition(recognizer)
+
+    def spend(self):
+        self.recoveries += 1
+        if self.recoveries > self.max_recoveries:
+            raise RecoveryLimit()
+
+    def recover(self, recognizer, e):
+        self.spend()
+        if recognizer.boundary_rules:
+            raise _Resync(e.offendingToken.tokenIndex)
+        # An error in program itself: skip to the next declaration
+        super().recover(recognizer, e)
+
+    def recoverInline(self, recognizer):
+        self.spend()
+        if not recognizer.boundary_rules:
+            return super().recoverInline(recognizer)
+        matched = self.singleTokenDeletion(recognizer)
+        if matched is not None:
+            recognizer.consume()
+            return matched
+        if self.singleTokenInsertion(recognizer):
+            return self.getMissingSymbol(recognizer)
+        # Report here: _Resync is not a RecognitionException, so the rule's
+        # own handler does not see it
+        e = InputMismatchException(recognizer)
+        self.reportError(recognizer, e)
+        raise _Resync(e.offendingToken.tokenIndex)
+
+    def singleTokenDeletion(self, recognizer):
+        # Dropping a ';' or '}' would merge the next statement into this one
+        if recognizer.getTokenStream().LA(1) in _BOUNDARY_END:
+            return None
+        return super().singleTokenDeletion(recognizer)
+
+    def singleTokenInsertion(self, recognizer):
+        # getMissingSymbol conjures the first expected token type
+        if self.getExpectedTokens(recognizer)[0] in _BOUNDARY_END:
+            return False
+        return super().singleTokenInsertion(recognizer)
+
+    def getErrorRecoverySet(self, recognizer):
+        # Instead of the FOLLOW sets of every rule being parsed, which costs
+        # a walk of the rule stack per error
+        return _RECOVERY_SET
+
+
+class RecoveringParser(TyCParser):
+    """A TyCParser that resumes after an error at the next boundary.
+
+    Boundary rules are decl, varDecl, stmt and structVar: when an error
+    inside one is not repaired in place, the rule is abandoned and the
+    tokens up to its likely end are skipped.
+    """
+
+    def __init__(self, input, max_errors: int = MAX_ERRORS):
+        super().__init__(input)
+        self._errHandler = BoundaryErrorStrategy(max_errors)
+        self.boundary_rules = 0
+
+    def _boundary(self, rule):
+        start = self._input.index
+        self.boundary_rules += 1
+        try:
+            return rule()
+        except _Resync as resync:
+            self._skip(start, resync.offending)
+        finally:
+            self.boundary_rules -= 1
+
+    def _skip(self, start: int, offending: int):
+        """Consume the rest of a broken statement or declaration begun at start.
+
+        Prediction may find the error ahead of the parser; the tokens before
+        offending, the token it was found at, are skipped regardless of
+        boundaries.
+        """
+        self._errHandler.spend()
+        stream = self._input
+        if stream.index == start and stream.LA(1) != Token.EOF:
+            stream.consume()
+        depth = 0
+        while True:
+            t = stream.LA(1)
+            if t == Token.EOF:
+                break
+            if stream.index < offending and (t != TyCParser.RBRACE or depth):
+                stream.consume()
+                depth += (t == TyCParser.LBRACE) - (t == TyCParser.RBRACE)
+                continue
+            if t == TyCParser.RBRACE:
+                if depth == 0:
+                    # Closes the enclosing block, or at the top level ends
+                    # a function whose body did not parse
+                    if self.boundary_rules == 1:
+                        stream.consume()
+                    break
+                depth -= 1
+                stream.consume()
+                if depth == 0:
+                    break
+                continue
+            if depth == 0 and t in _DECL_START:
+                break
+            stream.consume()
+            if t == TyCParser.LBRACE:
+                depth += 1
+            elif t == TyCParser.SEMI and depth == 0:
+                break
+        # Parsing starts afresh at the boundary
+        self._errHandler.endErrorCondition(self)
+
+    def decl(self):
+        return self._boundary(super().decl)
+
+    def varDecl(self):
+        return self._boundary(super().varDecl)
+
+    def stmt(self):
+        return self._boundary(super().stmt)
+
+    def structVar(self):
+        return self._boundary(super().structVar)
+
+    def program(self):
+        tree = super().program()
+        # An error in program itself ends it early; check the rest as
+        # further declarations
+        while self._input.LA(1) != Token.EOF:
+            self.decl()
+        return tree
+
+
+def check_syntax(input_stream, lexer_backend: str = "antlr", max_errors: int = MAX_ERRORS):
+    """Every lexical and syntax error of input_stream, in source order.
+
+    Returns (diagnostics, truncated): LexerDiagnostics and SyntaxDiagnostics
+    sorted by position, at most one per token, and whether the check stopped
+    at the error or recovery budget before the end of the source.
+    """
+    lexer = create_lexer(input_stream, lexer_backend, recover=True)
+    listener = CollectingErrorListener()
+    parser = RecoveringParser(CommonTokenStream(lexer), max_errors)
+    parser.removeErrorListeners()
+    parser.addErrorListener(listener)
+    truncated = False
+    try:
+        parse_two_stage(parser)
+    except RecoveryLimit:
+        truncated = True
+
+    # A bad token is reported by the lexer and again by the parser, and a
+    # missing end of input by every rule it cuts short
+    diagnostics = list(lexer.diagnostics)
+    seen = {(d.line, d.column) for d in diagnostics}
+    for d in listener.diagnostics:
+        if (d.line, d.column) not in seen:
+            seen.add((d.line, d.column))
+            diagnostics.append(d)
+    diagnostics.sort(key=lambda d: (d.line, d.column))
+    if len(diagnostics) > max_errors:
+        del diagnostics[max_errors:]
+        truncated = True
+    return diagnostics, truncated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report every syntax error of TyC sources.")
+    parser.add_argument("files", nargs="+", help="TyC source files to check")
+    parser.add_argument("--max-errors", type=int, default=MAX_ERRORS,
+                        help=f"errors reported per file (default: {MAX_ERRORS})")
+    parser.add_argument("--backend", default="antlr", choices=sorted(LEXER_BACKENDS))
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for name in args.files:
+        with open(name, encoding="utf-8", newline="") as f:
+            source = f.read()
+        diagnostics, truncated = check_syntax(
+            CompactInputStream(source), args.backend, args.max_errors
+        )
+        for d in diagnostics:
+            print(f"{name}: {d}")
+        if truncated:
+            print(f"{name}: too many errors, stopped after {len(diagnostics)}")
+        failed += bool(diagnostics)
+    print(f"Checked {len(args.files)} files ({failed} with errors)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
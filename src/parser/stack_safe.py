@@ -0,0 +1,224 @@
+"""
+Nesting-safe parsing of TyC sources.
+TyCParser's rule methods and the ASTGeneration visitor recurse once per
+level of the parse tree: a parenthesized expression costs four rule levels
+and a nested block or statement two, and the visitor takes about three
+Python frames per level. Python's default recursion limit of 1000 frames is
+therefore reached by a few hundred nested parentheses, blocks or if
+statements, and the parse dies with a RecursionError.
+
+This module parses with DepthLimitedParser, which raises NestingDepthError
+(a SyntaxException) once the parse tree would be deeper than max_depth rule
+levels, and falls back to running the parse and AST conversion on a thread
+whose stack and recursion limit are sized for that depth when the calling
+thread's run out. Its token stream also rejects a '(' or '{' nested more
+than max_depth / 2 brackets deep as soon as it is read: such a source
+exceeds the limit in any case, and prediction over deeply nested
+parentheses looks ahead to their closing ')', which makes a parse that only
+stops at the rule limit quadratic in the nesting depth.
+"""
+
+import os
+import sys
+import threading
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4 import CommonTokenStream
+from antlr4.Token import Token
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.fast_lexer import create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NestingDepthError, NewErrorListener
+
+# Parse tree depth allowed by default: about 500 nested parentheses or 1000
+# nested blocks, if or else statements. Parsing time grows quadratically with
+# the depth of nested parentheses; 500 of them take a second or two.
+DEFAULT_MAX_DEPTH = 2000
+
+# Python frames per rule level (parser, prediction and visitor), with headroom
+FRAMES_PER_LEVEL = 8
+
+# Thread stack bytes per rule level; only the pages used are committed
+STACK_PER_LEVEL = 16 * 1024
+
+_OPEN = frozenset((TyCParser.LPAREN, TyCParser.LBRACE))
+_CLOSE = frozenset((TyCParser.RPAREN, TyCParser.RBRACE))
+
+
+class DepthLimitedTokenStream(CommonTokenStream):
+    """A CommonTokenStream that rejects brackets nested deeper than max_brackets.
+
+    The NestingDepthError is raised when the parser first reads the bracket,
+    like a LexerError for a bad token, and again on every later read.
+    """
+
+    def __init__(self, lexer, max_brackets: int, max_depth: int):
+        super().__init__(lexer)
+        self.max_brackets = max_brackets
+        self.max_depth = max_depth
+        self.brackets = 0
+        self.rejected = None
+
+    def fetch(self, n: int):
+        if self.fetchedEOF:
+            return 0
+        if self.rejected is not None:
+            raise NestingDepthError(self.rejected, self.max_depth)
+        for i in range(n):
+            t = self.tokenSource.nextToken()
+            if t.type in _OPEN:
+                self.brackets += 1
+                if self.brackets > self.max_brackets:
+                    self.rejected = t
+                    raise NestingDepthError(t, self.max_depth)
+            elif t.type in _CLOSE:
+                self.brackets -= 1
+            t.tokenIndex = len(self.tokens)
+            self.tokens.append(t)
+            if t.type == Token.EOF:
+                self.fetchedEOF = True
+                return i + 1
+        return n
+
+    def fill(self):
+        # Formatting a no-viable-alternative error reads the rest of the
+        # source; the syntax error is reported even if deep nesting follows.
+        try:
+            super().fill()
+        except NestingDepthError:
+            pass
+
+
+class DepthLimitedParser(TyCParser):
+    """A TyCParser that raises NestingDepthError beyond max_depth rule levels.
+
+    Only rule invocations count: the loop of a left-recursive rule such as
+    a + b + c stays at one level.
+    """
+
+    def __init__(self, input, max_depth: int = DEFAULT_MAX_DEPTH):
+        super().__init__(input)
+        self.max_depth = max_depth
+        self.depth = 0
+
+    def _enter(self):
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.depth -= 1
+            raise NestingDepthError(self._input.LT(1), self.max_depth)
+
+    def enterRule(self, localctx, state: int, ruleIndex: int):
+        self._enter()
+        super().enterRule(localctx, state, ruleIndex)
+
+    def exitRule(self):
+        self.depth -= 1
+        super().exitRule()
+
+    def enterRecursionRule(self, localctx, state: int, ruleIndex: int, precedence: int):
+        self._enter()
+        super().enterRecursionRule(localctx, state, ruleIndex, precedence)
+
+    def unrollRecursionContexts(self, parentCtx):
+        self.depth -= 1
+        super().unrollRecursionContexts(parentCtx)
+
+    def reset(self):
+        super().reset()
+        self.depth = 0
+
+
+# Recursion limits requested by running run_with_stack() calls, and the
+# limit to restore when none is left
+_limit_lock = threading.Lock()
+_limits = []
+_base_limit = None
+
+
+def run_with_stack(fn, *args, max_depth: int = DEFAULT_MAX_DEPTH):
+    """Call fn(*args) on a thread with room for max_depth rule levels.
+
+    Returns fn's result or raises its exception. The recursion limit is
+    process-wide, so it is raised while any call runs and restored when the
+    last one returns.
+    """
+    global _base_limit
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = fn(*args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    with _limit_lock:
+        if not _limits:
+            _base_limit = sys.getrecursionlimit()
+        limit = _base_limit + FRAMES_PER_LEVEL * max_depth
+        _limits.append(limit)
+        sys.setrecursionlimit(max(_limits))
+        old_stack_size = threading.stack_size(
+            max(STACK_PER_LEVEL * max_depth, threading.stack_size())
+        )
+        try:
+            thread = threading.Thread(target=target)
+            thread.start()
+        finally:
+            threading.stack_size(old_stack_size)
+    thread.join()
+    with _limit_lock:
+        _limits.remove(limit)
+        sys.setrecursionlimit(max(_limits, default=_base_limit))
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def parse_depth_limited(input_stream, lexer_backend: str = "antlr",
+                        max_depth: int = DEFAULT_MAX_DEPTH):
+    """Parse tree of input_stream (SLL, then LL), at most max_depth rule levels deep.
+
+    Must run with enough stack for max_depth levels, e.g. under
+    run_with_stack(). Raises LexerError, SyntaxException or NestingDepthError.
+    """
+    lexer = create_lexer(input_stream, lexer_backend)
+    stream = DepthLimitedTokenStream(lexer, max_depth // 2, max_depth)
+    parser = DepthLimitedParser(stream, max_depth)
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        return parse_two_stage(parser)
+    except NestingDepthError:
+        if stream.rejected is None:
+            raise
+        # SLL lookahead may have read the bracket past a syntax error that
+        # only LL prediction reports; parse_two_stage leaves the parser in LL.
+        parser.reset()
+        return parser.program()
+
+
+def _build_ast(input_stream, lexer_backend: str, max_depth: int):
+    return ASTGeneration().visit(parse_depth_limited(input_stream, lexer_backend, max_depth))
+
+
+def safe_ast(input_stream, lexer_backend: str = "antlr",
+             max_depth: int = DEFAULT_MAX_DEPTH):
+    """Like antlr_ast(), but raising NestingDepthError instead of RecursionError.
+
+    Any source within max_depth rule levels is parsed however deeply it
+    nests. Starting a thread costs more than parsing a small source, so the
+    parse runs in the calling thread first and only moves to one from
+    run_with_stack() if it runs out of stack there.
+    """
+    try:
+        return _build_ast(input_stream, lexer_backend, max_depth)
+    except RecursionError:
+        input_stream.seek(0)
+    return run_with_stack(_build_ast, input_stream, lexer_backend, max_depth,
+                          max_depth=max_depth)
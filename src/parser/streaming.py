@@ -0,0 +1,99 @@
+"""
+Streaming parsing of large TyC sources.
+This module runs TyCParser on an UnbufferedTokenStream fed by the chunked
+stream_tokens() tokenizer, so neither the source text nor its token list is
+ever held in memory as a whole. With parse trees switched off (a syntax
+check) memory stays bounded by the chunk size and the lookahead window; a
+parse tree keeps the tokens it references alive, so parse_declarations
+builds the AST one top-level declaration at a time instead.
+
+The stream cannot be rewound, so prediction runs in plain LL mode rather
+than through parse_two_stage; results and error messages are those of an
+LL parse of the whole source, with one exception: BufferedTokenStream lexes
+the rest of the source while formatting a no-viable-alternative error, so
+a lexical error anywhere after it is reported instead, while the streaming
+parser reports the syntax error it actually reached.
+"""
+
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+build_dir = os.path.join(project_root, "build")
+if build_dir not in sys.path:
+    sys.path.insert(0, build_dir)
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import Token
+
+from build.TyCParser import TyCParser
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.streaming import CHUNK_SIZE, stream_tokens
+from src.lexer.unbuffered_stream import UnbufferedTokenStream
+from src.utils.error_listener import NewErrorListener
+from src.utils.nodes import Program
+
+
+class IteratorTokenSource:
+    """TokenSource over an iterator of tokens ending with EOF."""
+
+    _factory = CommonTokenFactory.DEFAULT
+
+    def __init__(self, tokens, sourceName: str = "<unknown>"):
+        self._tokens = iter(tokens)
+        self.sourceName = sourceName
+
+    def nextToken(self):
+        return next(self._tokens)
+
+
+def streaming_parser(file, backend: str = "fast", chunk_size: int = CHUNK_SIZE,
+                     build_trees: bool = True) -> TyCParser:
+    """A TyCParser reading the tokens of a text file object as it parses.
+
+    The parser reports syntax errors through NewErrorListener; lexical
+    errors propagate as LexerError when the parser reaches them.
+    """
+    source = IteratorTokenSource(
+        stream_tokens(file, backend, chunk_size=chunk_size), getattr(file, "name", "<unknown>")
+    )
+    parser = TyCParser(UnbufferedTokenStream(source))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    parser.buildParseTrees = build_trees
+    return parser
+
+
+def parse_stream(file, rule: str = "program", backend: str = "fast",
+                 chunk_size: int = CHUNK_SIZE, build_trees: bool = True):
+    """Parse rule from a text file object through an unbuffered token stream.
+
+    Returns the parse tree, or None when build_trees is False, in which
+    case the parse only checks the syntax in bounded memory.
+    """
+    parser = streaming_parser(file, backend, chunk_size, build_trees)
+    tree = getattr(parser, rule)()
+    return tree if build_trees else None
+
+
+def parse_declarations(file, backend: str = "fast", chunk_size: int = CHUNK_SIZE):
+    """Yield the AST node of each top-level declaration of a text file object.
+
+    Each decl is parsed on its own and converted with ASTGeneration before
+    the next one is read, and its parse tree is dropped once converted, so
+    memory is bounded by the largest declaration rather than the file. The
+    loop has the shape of program (decl+ EOF): declarations before an error
+    are yielded, then the error is raised as by parse_stream.
+    """
+    parser = streaming_parser(file, backend, chunk_size)
+    stream = parser.getTokenStream()
+    visitor = ASTGeneration()
+    while True:
+        yield visitor.visit(parser.decl())
+        if stream.LA(1) == Token.EOF:
+            return
+
+
+def parse_program_stream(file, backend: str = "fast", chunk_size: int = CHUNK_SIZE):
+    """The Program of a text file object, built one declaration at a time."""
+    return Program(list(parse_declarations(file, backend, chunk_size)))
@@ -0,0 +1,49 @@
+"""
+Two-stage SLL-then-LL parsing for TyCParser.
+Full LL prediction re-examines the whole parser call stack whenever SLL
+prediction finds a conflict. This module runs a parser rule first in SLL
+mode with a bail-out error strategy, which is enough for almost every input,
+and only re-parses with full LL prediction and the parser's own error
+listeners when the SLL pass fails, so results and error messages are those
+of a plain LL parse.
+"""
+
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from lexererr import LexerError
+
+
+def parse_two_stage(parser, rule: str = "program"):
+    """Parse rule of parser (a TyCParser on a fresh token stream).
+
+    The parser is set up as for a single LL parse, e.g. with
+    NewErrorListener.INSTANCE as its only error listener; those listeners
+    only see the LL pass. Returns the parse tree of the pass that succeeded.
+    """
+    listeners = parser._listeners
+    error_handler = parser._errHandler
+    parser._listeners = []
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return getattr(parser, rule)()
+    except ParseCancellationException:
+        relex = False
+    except LexerError:
+        # The lexer has already skipped the bad input; an LL parse might
+        # stop at a syntax error before reaching it, so lex again.
+        relex = True
+    finally:
+        parser._listeners = listeners
+        parser._errHandler = error_handler
+        parser._interp.predictionMode = PredictionMode.LL
+
+    if relex:
+        stream = parser.getTokenStream()
+        lexer = stream.tokenSource
+        lexer.reset()
+        stream.setTokenSource(lexer)
+    parser.reset()
+    return getattr(parser, rule)()
@@ -0,0 +1,338 @@
+"""
+Flat arena storage for TyC ASTs.
+This module contains the ASTArena class, which stores the nodes of any
+number of ASTs in parallel typed arrays indexed by integer node id instead
+of one object per node, and NodeView, a read-only stand-in for a node that
+lets ASTVisitor subclasses walk an arena without converting it back.
+
+Per node the arena keeps a kind code (the node class), an operator code, a
+symbol id (the node's name or literal value in a table shared by every AST
+of the arena) and the offset of its child slots. A node field takes one
+slot holding the child's id, or -1 for None; a list field takes a length
+slot followed by one slot per element. Nodes are numbered in pre-order, so
+the ids of an AST, and of every subtree, are contiguous. Conversion in
+both directions is iterative and lossless, positions included.
+"""
+
+import re
+from array import array
+
+from src.utils.nodes import *
+
+# Node classes by kind code
+KINDS = (
+    Program,
+    StructDecl,
+    MemberDecl,
+    FuncDecl,
+    Param,
+    IntType,
+    FloatType,
+    StringType,
+    VoidType,
+    StructType,
+    BlockStmt,
+    VarDecl,
+    IfStmt,
+    WhileStmt,
+    ForStmt,
+    SwitchStmt,
+    CaseStmt,
+    DefaultStmt,
+    BreakStmt,
+    ContinueStmt,
+    ReturnStmt,
+    ExprStmt,
+    BinaryOp,
+    PrefixOp,
+    PostfixOp,
+    AssignExpr,
+    MemberAccess,
+    FuncCall,
+    Identifier,
+    StructLiteral,
+    IntLiteral,
+    FloatLiteral,
+    StringLiteral,
+)
+
+# Operators by operator code
+OPERATORS = (
+    "+", "-", "*", "/", "%", "<", ">", "<=", ">=", "==", "!=", "&&", "||", "!", "++", "--",
+)
+
+# Symbol, operator and child of nodes that have none
+NONE = -1
+
+# Field kinds
+_NODE, _LIST, _OPERATOR, _SYMBOL, _CALLEE = range(5)
+
+_LIST_ATTRS = {"decls", "members", "params", "statements", "cases", "args", "values"}
+_SYMBOL_ATTRS = {"name", "struct_name", "member", "value"}
+
+
+def _fields(cls):
+    """(attribute, field kind) of every field of cls, in constructor order."""
+    fields = []
+    for klass in reversed(cls.__mro__):
+        for attr in klass.__dict__.get("__slots__", ()):
+            if attr in ("line", "column", "__weakref__"):
+                continue
+            if cls is FuncCall and attr == "name":
+                # The callee: a plain name, or an expression
+                fields.append((attr, _CALLEE))
+            elif attr in _LIST_ATTRS:
+                fields.append((attr, _LIST))
+            elif attr == "operator":
+                fields.append((attr, _OPERATOR))
+            elif attr in _SYMBOL_ATTRS:
+                fields.append((attr, _SYMBOL))
+            else:
+                fields.append((attr, _NODE))
+    return tuple(fields)
+
+
+_KIND_CODES = {cls: kind for kind, cls in enumerate(KINDS)}
+_FIELDS = tuple(_fields(cls) for cls in KINDS)
+_OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+_TYPE_KINDS = frozenset(kind for kind, cls in enumerate(KINDS) if issubclass(cls, Type))
+# visit_* method of every kind, the one its accept() calls
+_VISIT = tuple("visit_" + re.sub(r"(?<!^)(?=[A-Z])", "_", cls.__name__).lower() for cls in KINDS)
+
+
+class ASTArena:
+    """Parallel-array store of the nodes of one or more ASTs.
+
+    add() appends an AST and returns the id of its root, node() rebuilds the
+    node objects of any subtree, and view() wraps a node for visitors.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.operators = array("b")
+        self.symbols = array("i")
+        self.first = array("I")
+        self.children = array("i")
+        self.roots = array("I")
+        # Sparse (line, column) of nodes that have a position
+        self.positions = {}
+        self.values = []
+        self._value_ids = {}
+
+    @classmethod
+    def from_programs(cls, programs):
+        arena = cls()
+        for program in programs:
+            arena.add(program)
+        return arena
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def symbol(self, value) -> int:
+        """Return the id of a name or literal value, adding it if new."""
+        if value is None:
+            return NONE
+        # 1, 1.0 and "1" are distinct symbols, and so are 0.0 and -0.0
+        key = (value.__class__, value.hex() if isinstance(value, float) else value)
+        id = self._value_ids.get(key)
+        if id is None:
+            id = self._value_ids[key] = len(self.values)
+            self.values.append(value)
+        return id
+
+    def add(self, root: ASTNode) -> int:
+        """Append the AST under root and return the id of root."""
+        kinds, operators, symbols = self.kinds, self.operators, self.symbols
+        first, children = self.first, self.children
+        root_id = len(kinds)
+        stack = [(root, NONE)]
+        while stack:
+            node, slot = stack.pop()
+            id = len(kinds)
+            if slot != NONE:
+                children[slot] = id
+            kind = _KIND_CODES.get(node.__class__)
+            if kind is None:
+                raise TypeError(f"cannot store {node.__class__.__name__} in an ASTArena")
+            if node.line is not None or node.column is not None:
+                self.positions[id] = (node.line, node.column)
+            operator = symbol = NONE
+            first.append(len(children))
+            pending = []
+            for attr, field in _FIELDS[kind]:
+                value = getattr(node, attr)
+                if field == _NODE or (field == _CALLEE and isinstance(value, ASTNode)):
+                    children.append(NONE)
+                    if value is not None:
+                        pending.append((value, len(children) - 1))
+                elif field == _LIST:
+                    if value is None:
+                        children.append(NONE)
+                        continue
+                    children.append(len(value))
+                    for item in value:
+                        children.append(NONE)
+                        if item is not None:
+                            pending.append((item, len(children) - 1))
+                elif field == _OPERATOR:
+                    operator = _OPERATOR_CODES[value]
+                elif field == _CALLEE:
+                    children.append(NONE)
+                    symbol = self.symbol(value)
+                else:
+                    symbol = self.symbol(value)
+            kinds.append(kind)
+            operators.append(operator)
+            symbols.append(symbol)
+            # Pre-order: the first child is popped next
+            stack.extend(reversed(pending))
+        self.roots.append(root_id)
+        return root_id
+
+    def kind(self, id: int) -> type:
+        """The node class of node id."""
+        return KINDS[self.kinds[id]]
+
+    def _read(self, id: int) -> list:
+        """(attribute, field kind, value) of every field of node id.
+
+        The kind is _NODE with a child id (NONE for None), _LIST with a list
+        of ids (or None), or _SYMBOL with the value itself; a callee given by
+        name reads as a symbol, one given as an expression as a node.
+        """
+        children = self.children
+        pos = self.first[id]
+        fields = []
+        for attr, field in _FIELDS[self.kinds[id]]:
+            if field == _NODE:
+                fields.append((attr, _NODE, children[pos]))
+                pos += 1
+            elif field == _LIST:
+                n = children[pos]
+                if n == NONE:
+                    fields.append((attr, _LIST, None))
+                    pos += 1
+                else:
+                    fields.append((attr, _LIST, children[pos + 1 : pos + 1 + n].tolist()))
+                    pos += 1 + n
+            elif field == _OPERATOR:
+                code = self.operators[id]
+                fields.append((attr, _SYMBOL, None if code == NONE else OPERATORS[code]))
+            elif field == _CALLEE and children[pos] != NONE:
+                fields.append((attr, _NODE, children[pos]))
+                pos += 1
+            else:
+                pos += field == _CALLEE
+                symbol = self.symbols[id]
+                fields.append((attr, _SYMBOL, None if symbol == NONE else self.values[symbol]))
+        return fields
+
+    def fields(self, id: int) -> list:
+        """(attribute, value) of every field of node id.
+
+        Node fields give the child's id (NONE for None) and list fields a
+        list of ids; names, literal values and operators are given as is.
+        """
+        return [(attr, value) for attr, _, value in self._read(id)]
+
+    def child_ids(self, id: int) -> list:
+        """Ids of the children of node id, in field order."""
+        ids = []
+        for _, field, value in self._read(id):
+            if field == _NODE and value != NONE:
+                ids.append(value)
+            elif field == _LIST and value is not None:
+                ids.extend(child for child in value if child != NONE)
+        return ids
+
+    def node(self, id: int) -> ASTNode:
+        """Rebuild the node objects of the subtree rooted at node id."""
+        # Create every node of the subtree, then link them; neither step recurses
+        nodes = {}
+        order = [id]
+        for i in order:
+            kind = self.kinds[i]
+            if kind in _TYPE_KINDS:
+                # The canonical instance, which has no children
+                nodes[i] = KINDS[kind](*(value for _, _, value in self._read(i)))
+                continue
+            node = object.__new__(KINDS[kind])
+            node.line, node.column = self.positions.get(i, (None, None))
+            nodes[i] = node
+            order.extend(self.child_ids(i))
+        for i in order:
+            if self.kinds[i] in _TYPE_KINDS:
+                continue
+            node = nodes[i]
+            for attr, field, value in self._read(i):
+                if field == _NODE:
+                    value = None if value == NONE else nodes[value]
+                elif field == _LIST and value is not None:
+                    value = [None if child == NONE else nodes[child] for child in value]
+                setattr(node, attr, value)
+        return nodes[id]
+
+    def programs(self) -> list:
+        """Rebuild every AST added to the arena, in order."""
+        return [self.node(root) for root in self.roots]
+
+    def view(self, id: int) -> "NodeView":
+        return NodeView(self, id)
+
+
+class NodeView:
+    """Node id of an ASTArena, read like the node object it stands for.
+
+    Fields read as on the node, with child nodes as NodeViews, and accept()
+    calls the visitor method the node's own accept() would, so BaseVisitor
+    subclasses walk an arena unchanged. Views are not instances of the node
+    classes; kind is the class a view stands for.
+    """
+
+    __slots__ = ("arena", "id", "_fields")
+
+    def __init__(self, arena: ASTArena, id: int):
+        self.arena = arena
+        self.id = id
+        self._fields = None
+
+    @property
+    def kind(self) -> type:
+        return self.arena.kind(self.id)
+
+    def __getattr__(self, name):
+        if name in ("line", "column"):
+            return self.arena.positions.get(self.id, (None, None))[name == "column"]
+        if self._fields is None:
+            self._fields = self._read_fields()
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(f"{self.kind.__name__} node has no field {name!r}") from None
+
+    def _read_fields(self):
+        arena = self.arena
+        fields = {}
+        for attr, field, value in arena._read(self.id):
+            if field == _NODE:
+                value = None if value == NONE else NodeView(arena, value)
+            elif field == _LIST and value is not None:
+                value = [None if child == NONE else NodeView(arena, child) for child in value]
+            fields[attr] = value
+        return fields
+
+    def accept(self, visitor, o=None):
+        return getattr(visitor, _VISIT[self.arena.kinds[self.id]])(self, o)
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and other.arena is self.arena and other.id == self.id
+
+    def __hash__(self):
+        return hash((id(self.arena), self.id))
+
+    def __str__(self):
+        return str(self.arena.node(self.id))
+
+    def __repr__(self):
+        return f"NodeView({self.kind.__name__}, {self.id})"
@@ -1,4 +1,4 @@
-from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
 
 
 class SyntaxException(Exception):
@@ -16,3 +16,42 @@ class NewErrorListener(ConsoleErrorListener):
 
 
 NewErrorListener.INSTANCE = NewErrorListener()
+
+
+class NestingDepthError(SyntaxException):
+    """A source nested deeper than a parser's depth limit allows."""
+
+    def __init__(self, token, max_depth: int):
+        self.max_depth = max_depth
+        super().__init__(
+            f"Error on line {token.line} col {token.column}: "
+            f"nesting deeper than {max_depth} levels"
+        )
+
+
+class SyntaxDiagnostic:
+    """A syntax error recorded by CollectingErrorListener instead of raised."""
+
+    def __init__(self, token):
+        self.type = token.type
+        self.line = token.line
+        self.column = token.column
+        self.start = token.start
+        self.stop = token.stop
+        self.message = token.text
+
+    def __str__(self):
+        return f"Error on line {self.line} col {self.column}: {self.message}"
+
+    def __repr__(self):
+        return f"SyntaxDiagnostic({self})"
+
+
+class CollectingErrorListener(ErrorListener):
+    """Records every syntax error reported to it in diagnostics, in order."""
+
+    def __init__(self):
+        self.diagnostics = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.diagnostics.append(SyntaxDiagnostic(offendingSymbol))
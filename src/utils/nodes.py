@@ -2,8 +2,13 @@
 AST Node classes for TyC programming language.
 This module defines all the AST node types used to represent
 the abstract syntax tree for TyC programs.
+
+Every node class declares __slots__, so nodes carry no per-instance
+__dict__; a subclass that adds attributes must list them in its own
+__slots__.
 """
 
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Union, TYPE_CHECKING
 
@@ -14,6 +19,8 @@ if TYPE_CHECKING:
 class ASTNode(ABC):
     """Base class for all AST nodes."""
 
+    __slots__ = ("line", "column")
+
     def __init__(self):
         self.line = None
         self.column = None
@@ -36,6 +43,8 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire TyC program."""
 
+    __slots__ = ("decls",)
+
     def __init__(self, decls: List["Decl"]):
         super().__init__()
         self.decls = decls
@@ -50,12 +59,15 @@ class Program(ASTNode):
 
 class Decl(ASTNode):
     """Base class for declarations (struct or function)."""
-    pass
+
+    __slots__ = ()
 
 
 class StructDecl(Decl):
     """Struct declaration node."""
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List["MemberDecl"]):
         super().__init__()
         self.name = name
@@ -72,6 +84,8 @@ class StructDecl(Decl):
 class MemberDecl(ASTNode):
     """Struct member declaration node."""
 
+    __slots__ = ("member_type", "name")
+
     def __init__(self, member_type: "Type", name: str):
         super().__init__()
         self.member_type = member_type
@@ -87,6 +101,8 @@ class MemberDecl(ASTNode):
 class FuncDecl(Decl):
     """Function declaration node."""
 
+    __slots__ = ("return_type", "name", "params", "body")
+
     def __init__(
         self,
         return_type: Optional["Type"],
@@ -112,6 +128,8 @@ class FuncDecl(Decl):
 class Param(ASTNode):
     """Function parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -130,13 +148,66 @@ class Param(ASTNode):
 
 
 class Type(ASTNode):
-    """Base class for type annotations."""
-    pass
+    """Base class for type annotations.
+
+    Types are canonical: IntType(), FloatType(), StringType() and VoidType()
+    each return one shared instance and StructType(name) one instance per
+    name, so equal types are the same object and compare with `is`. Since one
+    instance stands for every occurrence, types are immutable and carry no
+    position; line and column are always None.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __new__(cls, *args):
+        key = (cls, *args)
+        ref = _canonical_types.get(key)
+        node = None if ref is None else ref()
+        if node is None:
+            node = object.__new__(cls)
+            fields = ("line", "column", *cls.__slots__)
+            for name, value in zip(fields, (None, None, *args)):
+                object.__setattr__(node, name, value)
+            _canonical_types[key] = weakref.ref(node, _forget_type(key))
+        return node
+
+    def __init__(self, *args):
+        # Python runs __init__ on every IntType() call, including those that
+        # return the shared instance; __new__ has set every field already
+        pass
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} instances are shared and immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} instances are shared and immutable")
+
+    def __reduce__(self):
+        # Unpickle and copy to the canonical instance
+        return (type(self), tuple(getattr(self, name) for name in type(self).__slots__))
+
+
+# (class, constructor arguments) -> weak reference to the Type instance they
+# make, so the types of ASTs that are gone (struct names above all) do not
+# pile up in a long-running process. A plain dict of refs rather than a
+# WeakValueDictionary, whose lookups run in Python.
+_canonical_types = {}
+
+
+def _forget_type(key):
+    def forget(ref):
+        # Unless the key was taken by a newer instance meanwhile
+        if _canonical_types.get(key) is ref:
+            del _canonical_types[key]
+
+    return forget
 
 
 class IntType(Type):
     """Integer type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -150,6 +221,8 @@ class IntType(Type):
 class FloatType(Type):
     """Float type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -163,6 +236,8 @@ class FloatType(Type):
 class StringType(Type):
     """String type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -176,6 +251,8 @@ class StringType(Type):
 class VoidType(Type):
     """Void type node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -189,9 +266,11 @@ class VoidType(Type):
 class StructType(Type):
     """Struct type node."""
 
+    __slots__ = ("struct_name",)
+
     def __init__(self, struct_name: str):
+        # struct_name is set by Type.__new__
         super().__init__()
-        self.struct_name = struct_name
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_type(self, o)
@@ -207,12 +286,15 @@ class StructType(Type):
 
 class Stmt(ASTNode):
     """Base class for all statement nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
     """Block statement containing statements."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -230,6 +312,8 @@ class VarDecl(Stmt):
     If var_type is None, it means 'auto' (type inference).
     """
 
+    __slots__ = ("var_type", "name", "init_value")
+
     def __init__(
         self,
         var_type: Optional["Type"],
@@ -253,6 +337,8 @@ class VarDecl(Stmt):
 class IfStmt(Stmt):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self, condition: "Expr", then_stmt: Stmt, else_stmt: Optional[Stmt] = None
     ):
@@ -272,6 +358,8 @@ class IfStmt(Stmt):
 class WhileStmt(Stmt):
     """While statement."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expr", body: Stmt):
         super().__init__()
         self.condition = condition
@@ -287,6 +375,8 @@ class WhileStmt(Stmt):
 class ForStmt(Stmt):
     """For statement."""
 
+    __slots__ = ("init", "condition", "update", "body")
+
     def __init__(
         self,
         init: Optional[Union["VarDecl", "ExprStmt"]],
@@ -313,6 +403,8 @@ class ForStmt(Stmt):
 class SwitchStmt(Stmt):
     """Switch statement."""
 
+    __slots__ = ("expr", "cases", "default_case")
+
     def __init__(
         self,
         expr: "Expr",
@@ -336,6 +428,8 @@ class SwitchStmt(Stmt):
 class CaseStmt(ASTNode):
     """Case statement in switch."""
 
+    __slots__ = ("expr", "statements")
+
     def __init__(self, expr: "Expr", statements: List[Stmt]):
         super().__init__()
         self.expr = expr
@@ -352,6 +446,8 @@ class CaseStmt(ASTNode):
 class DefaultStmt(ASTNode):
     """Default statement in switch."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__()
         self.statements = statements
@@ -367,6 +463,8 @@ class DefaultStmt(ASTNode):
 class BreakStmt(Stmt):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -380,6 +478,8 @@ class BreakStmt(Stmt):
 class ContinueStmt(Stmt):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -393,6 +493,8 @@ class ContinueStmt(Stmt):
 class ReturnStmt(Stmt):
     """Return statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Optional["Expr"] = None):
         super().__init__()
         self.expr = expr
@@ -408,6 +510,8 @@ class ReturnStmt(Stmt):
 class ExprStmt(Stmt):
     """Expression statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: "Expr"):
         super().__init__()
         self.expr = expr
@@ -426,12 +530,15 @@ class ExprStmt(Stmt):
 
 class Expr(ASTNode):
     """Base class for all expression nodes."""
-    pass
+
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -448,6 +555,8 @@ class BinaryOp(Expr):
 class PrefixOp(Expr):
     """Prefix unary operation expression (++x, --x, +x, -x, !x)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--', '+', '-', '!'
@@ -463,6 +572,8 @@ class PrefixOp(Expr):
 class PostfixOp(Expr):
     """Postfix unary operation expression (x++, x--)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '++', '--'
@@ -480,6 +591,8 @@ class AssignExpr(Expr):
     lhs can be Identifier or MemberAccess.
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "Expr", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs  # Identifier or MemberAccess
@@ -498,6 +611,8 @@ class MemberAccess(Expr):
     Can be nested: MemberAccess(MemberAccess(obj, "member1"), "member2")
     """
 
+    __slots__ = ("obj", "member")
+
     def __init__(self, obj: Expr, member: str):
         super().__init__()
         self.obj = obj
@@ -513,6 +628,8 @@ class MemberAccess(Expr):
 class FuncCall(Expr):
     """Function call expression."""
 
+    __slots__ = ("name", "args")
+
     def __init__(self, name: str, args: List[Expr]):
         super().__init__()
         self.name = name
@@ -529,6 +646,8 @@ class FuncCall(Expr):
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -543,6 +662,8 @@ class Identifier(Expr):
 class StructLiteral(Expr):
     """Struct literal expression (initialization with {})."""
 
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Expr]):
         super().__init__()
         self.values = values
@@ -563,6 +684,8 @@ class StructLiteral(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -571,6 +694,8 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
@@ -584,6 +709,8 @@ class IntLiteral(Literal):
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
@@ -597,6 +724,8 @@ class FloatLiteral(Literal):
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
@@ -605,3 +734,35 @@ class StringLiteral(Literal):
 
     def __str__(self):
         return f"StringLiteral({self.value!r})"
+
+
+# ============================================================================
+# Hash-consing
+# ============================================================================
+
+
+class LeafTable:
+    """Hash-consing table of Identifier and literal leaves.
+
+    leaf() returns one shared node per leaf class and value, so the repeated
+    names and literals of large programs share nodes. AST builders use a
+    table only when given one; a shared leaf stands for every occurrence
+    and must not be mutated, positions included.
+    """
+
+    __slots__ = ("leaves",)
+
+    def __init__(self):
+        self.leaves = {}
+
+    def __len__(self):
+        return len(self.leaves)
+
+    def leaf(self, cls, value):
+        """The shared cls(value) node (cls is Identifier or a Literal class)."""
+        # 1 and 1.0 are distinct leaves, and so are 0.0 and -0.0
+        key = (cls, value.hex() if isinstance(value, float) else value)
+        node = self.leaves.get(key)
+        if node is None:
+            node = self.leaves[key] = cls(value)
+        return node
@@ -0,0 +1,99 @@
+"""
+Arena AST test cases for TyC compiler
+"""
+
+import pytest
+from tests.utils import ASTGenerator
+from src.utils.arena import KINDS, NONE, ASTArena, NodeView
+from src.utils.nodes import *
+from src.utils.visitor import BaseVisitor
+
+SOURCES = [
+    "struct P { int x; P next; };\nint g = 1;\n"
+    "int f(int n, float y) {\n  for (int i = 0; i < n; ++i) { n = n - i; }\n  return n;\n}\n",
+    'void main() {\n  auto s = "a";\n  string t;\n  f(g).x = -1.5e3;\n  if (a) b++; else { }\n'
+    "  while (!a && b || c) break;\n  switch (x) { case 1: continue; default: x = y = 2; }\n}\n",
+    "foo() { for (;;) { } return; }",
+]
+
+
+class Recorder(BaseVisitor):
+    """Records every node visited, in order."""
+
+    def __init__(self):
+        self.seen = []
+
+    def visit(self, node, o=None):
+        self.seen.append(str(node))
+        return super().visit(node, o)
+
+
+def test_round_trip():
+    programs = [ASTGenerator(s).generate() for s in SOURCES]
+    arena = ASTArena.from_programs(programs)
+    assert [str(p) for p in arena.programs()] == [str(p) for p in programs]
+    assert len(arena.roots) == 3 and arena.roots[0] == 0
+    assert arena.kind(arena.roots[1]) is Program
+
+
+def test_lossless_edge_cases():
+    call = FuncCall(MemberAccess(Identifier("a"), "f"), [IntLiteral(1), FloatLiteral(1.0)])
+    call.line, call.column = 3, 7
+    program = Program([
+        FuncDecl(None, "h", [], BlockStmt([
+            ExprStmt(call),
+            ExprStmt(FuncCall("g", [])),
+            VarDecl(None, "z", FloatLiteral(-0.0)),
+            ForStmt(None, None, None, BlockStmt([])),
+        ]))
+    ])
+    arena = ASTArena()
+    copy = arena.node(arena.add(program))
+    assert str(copy) == str(program)
+    stmts = copy.decls[0].body.statements
+    assert (stmts[0].expr.line, stmts[0].expr.column) == (3, 7)
+    assert stmts[0].expr.args[0].value == 1 and type(stmts[0].expr.args[1].value) is float
+    assert str(stmts[2].init_value.value) == "-0.0"
+    assert stmts[1].expr.name == "g" and copy.decls[0].return_type is None
+
+
+def test_subtrees_are_contiguous():
+    arena = ASTArena()
+    root = arena.add(ASTGenerator(SOURCES[0]).generate())
+    func = arena.child_ids(root)[2]
+    assert arena.kind(func) is FuncDecl
+    assert str(arena.node(func)) == str(ASTGenerator(SOURCES[0]).generate().decls[2])
+    assert min(arena.child_ids(func)) == func + 1
+    assert all(NONE < k < len(KINDS) for k in arena.kinds)
+
+
+def test_symbols_are_shared():
+    arena = ASTArena.from_programs(ASTGenerator(s).generate() for s in SOURCES)
+    ids = [arena.symbols[i] for i in range(len(arena)) if arena.kind(i) is Identifier]
+    names = [arena.values[i] for i in ids]
+    assert len(set(ids)) == len(set(names)) < len(names)
+
+
+def test_visitor_walks_views():
+    for source in SOURCES:
+        program = ASTGenerator(source).generate()
+        arena = ASTArena()
+        view = arena.view(arena.add(program))
+        on_objects, on_views = Recorder(), Recorder()
+        on_objects.visit(program)
+        on_views.visit(view)
+        assert on_views.seen == on_objects.seen
+    assert view.kind is Program and isinstance(view.decls[0], NodeView)
+    with pytest.raises(AttributeError):
+        view.name
+
+
+def test_rejects_unknown_nodes():
+    class Custom(Expr):
+        __slots__ = ()
+
+        def accept(self, visitor, o=None):
+            pass
+
+    with pytest.raises(TypeError):
+        ASTArena().add(ExprStmt(Custom()))
@@ -1,18 +1,311 @@
 """
 AST Generation test cases for TyC compiler.
-TODO: Implement 100 test cases for AST generation
 """
 
 import pytest
 from tests.utils import ASTGenerator
 
 
-def test_ast_gen_placeholder():
-    """Placeholder test - replace with actual test cases"""
-    source = """void main() {
-}"""
-    # TODO: Add actual test assertions
-    # Example:
-    # expected = "Program([FuncDecl(VoidType(), main, [], BlockStmt([]))])"
-    # assert str(ASTGenerator(source).generate()) == expected
-    assert True
+def ast_of(source):
+    return str(ASTGenerator(source).generate())
+
+
+def main_of(*statements):
+    """Expected string for void main() { <statements> }"""
+    return f"Program([FuncDecl(VoidType(), main, [], BlockStmt([{', '.join(statements)}]))])"
+
+
+# ============================================================================
+# Declarations
+# ============================================================================
+
+
+def test_struct_decl():
+    """Test: struct declaration with members of several types"""
+    source = "struct Point { int x; float y; string n; Point next; };"
+    expected = (
+        "Program([StructDecl(Point, [MemberDecl(IntType(), x), MemberDecl(FloatType(), y), "
+        "MemberDecl(StringType(), n), MemberDecl(StructType(Point), next)])])"
+    )
+    assert ast_of(source) == expected
+
+
+def test_empty_struct_decl():
+    """Test: struct declaration without members"""
+    assert ast_of("struct E {};") == "Program([StructDecl(E, [])])"
+
+
+def test_global_var_decls():
+    """Test: global declarations with and without initialisers"""
+    source = "int g = 1; string s; auto h = 2.5; Point p;"
+    expected = (
+        "Program([VarDecl(IntType(), g = IntLiteral(1)), VarDecl(StringType(), s), "
+        "VarDecl(auto, h = FloatLiteral(2.5)), VarDecl(StructType(Point), p)])"
+    )
+    assert ast_of(source) == expected
+
+
+def test_func_decls():
+    """Test: typed, void and inferred return types with parameters"""
+    source = (
+        "int add(int a, int b) { return a + b; }\n"
+        "void log(string m) { return; }\n"
+        "scale(Point p, float k) { return k; }"
+    )
+    expected = (
+        "Program(["
+        "FuncDecl(IntType(), add, [Param(IntType(), a), Param(IntType(), b)], "
+        "BlockStmt([ReturnStmt(return BinaryOp(Identifier(a), +, Identifier(b)))])), "
+        "FuncDecl(VoidType(), log, [Param(StringType(), m)], BlockStmt([ReturnStmt(return)])), "
+        "FuncDecl(auto, scale, [Param(StructType(Point), p), Param(FloatType(), k)], "
+        "BlockStmt([ReturnStmt(return Identifier(k))]))])"
+    )
+    assert ast_of(source) == expected
+
+
+def test_main_decl():
+    """Test: void main() { } with local declarations"""
+    assert ast_of("void main() { }") == main_of()
+    expected = main_of(
+        "VarDecl(IntType(), x = IntLiteral(1))",
+        "VarDecl(auto, y = StringLiteral('a'))",
+        "BlockStmt([VarDecl(FloatType(), z)])",
+    )
+    assert ast_of('void main() { int x = 1; auto y = "a"; { float z; } }') == expected
+
+
+# ============================================================================
+# Statements
+# ============================================================================
+
+
+def test_for_all_clauses_empty():
+    """Test: for (;;) break;"""
+    expected = main_of("ForStmt(for None; None; None do BreakStmt())")
+    assert ast_of("void main() { for (;;) break; }") == expected
+
+
+def test_for_typed_init_postfix_update():
+    """Test: for (int i = 0; i < 10; i++) { continue; }"""
+    expected = main_of(
+        "ForStmt(for VarDecl(IntType(), i = IntLiteral(0)); "
+        "BinaryOp(Identifier(i), <, IntLiteral(10)); PostfixOp(Identifier(i)++) "
+        "do BlockStmt([ContinueStmt()]))"
+    )
+    assert ast_of("void main() { for (int i = 0; i < 10; i++) { continue; } }") == expected
+
+
+def test_for_auto_init_empty_condition():
+    """Test: for (auto i = 0; ; ++i) {}"""
+    expected = main_of(
+        "ForStmt(for VarDecl(auto, i = IntLiteral(0)); None; PrefixOp(++Identifier(i)) "
+        "do BlockStmt([]))"
+    )
+    assert ast_of("void main() { for (auto i = 0; ; ++i) {} }") == expected
+
+
+def test_for_assignment_clauses():
+    """Test: for (p.x = 1; p.x; p.x = p.x - 1) {}"""
+    expected = main_of(
+        "ForStmt(for ExprStmt(AssignExpr(MemberAccess(Identifier(p).x) = IntLiteral(1))); "
+        "MemberAccess(Identifier(p).x); "
+        "AssignExpr(MemberAccess(Identifier(p).x) = "
+        "BinaryOp(MemberAccess(Identifier(p).x), -, IntLiteral(1))) do BlockStmt([]))"
+    )
+    assert ast_of("void main() { for (p.x = 1; p.x; p.x = p.x - 1) {} }") == expected
+
+
+def test_for_empty_init_only():
+    """Test: for (; i < n; ) i++;"""
+    expected = main_of(
+        "ForStmt(for None; BinaryOp(Identifier(i), <, Identifier(n)); None "
+        "do ExprStmt(PostfixOp(Identifier(i)++)))"
+    )
+    assert ast_of("void main() { for (; i < n; ) i++; }") == expected
+
+
+def test_switch_fall_through_and_default():
+    """Test: empty case falls through; default between cases is kept apart"""
+    source = (
+        "void main() { switch (x) { case 1: case 2: y = 1; break; "
+        "default: y = 0; case 3: z++; } }"
+    )
+    expected = main_of(
+        "SwitchStmt(switch Identifier(x) cases ["
+        "CaseStmt(case IntLiteral(1): []), "
+        "CaseStmt(case IntLiteral(2): [ExprStmt(AssignExpr(Identifier(y) = IntLiteral(1))), "
+        "BreakStmt()]), "
+        "CaseStmt(case IntLiteral(3): [ExprStmt(PostfixOp(Identifier(z)++))])], "
+        "default DefaultStmt(default: [ExprStmt(AssignExpr(Identifier(y) = IntLiteral(0)))]))"
+    )
+    assert ast_of(source) == expected
+
+
+def test_switch_empty_and_default_only():
+    """Test: switch without cases, and with only a default"""
+    source = "void main() { switch (x) { } switch (x + 1) { default: int t = 2; } }"
+    expected = main_of(
+        "SwitchStmt(switch Identifier(x) cases [])",
+        "SwitchStmt(switch BinaryOp(Identifier(x), +, IntLiteral(1)) cases [], "
+        "default DefaultStmt(default: [VarDecl(IntType(), t = IntLiteral(2))]))",
+    )
+    assert ast_of(source) == expected
+
+
+# ============================================================================
+# Expressions
+# ============================================================================
+
+
+def test_every_precedence_level():
+    """Test: || < && < ==,!= < relational < additive < multiplicative < unary"""
+    source = "void main() { x = a || b && c == d < e + f * !g; }"
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(Identifier(a), ||, "
+        "BinaryOp(Identifier(b), &&, BinaryOp(Identifier(c), ==, "
+        "BinaryOp(Identifier(d), <, BinaryOp(Identifier(e), +, "
+        "BinaryOp(Identifier(f), *, PrefixOp(!Identifier(g))))))))))"
+    )
+    assert ast_of(source) == expected
+
+
+def test_precedence_reversed_order():
+    """Test: tighter operators on the left still bind first"""
+    source = "void main() { x = a * b + c > d != e && f || g; }"
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(BinaryOp(BinaryOp("
+        "BinaryOp(BinaryOp(BinaryOp(Identifier(a), *, Identifier(b)), +, Identifier(c)), "
+        ">, Identifier(d)), !=, Identifier(e)), &&, Identifier(f)), ||, Identifier(g))))"
+    )
+    assert ast_of(source) == expected
+
+
+def test_parentheses_override_precedence():
+    """Test: x = (a + b) * c;"""
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(x) = BinaryOp(BinaryOp(Identifier(a), +, "
+        "Identifier(b)), *, Identifier(c))))"
+    )
+    assert ast_of("void main() { x = (a + b) * c; }") == expected
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [("-", "+"), ("/", "%"), ("*", "/"), ("<", ">="), ("<=", ">"), ("!=", "=="), ("&&", "&&"), ("||", "||")],
+)
+def test_binary_left_associative(ops):
+    """Test: a op1 b op2 c groups as (a op1 b) op2 c"""
+    first, second = ops
+    source = f"void main() {{ x = a {first} b {second} c; }}"
+    expected = main_of(
+        f"ExprStmt(AssignExpr(Identifier(x) = BinaryOp(BinaryOp(Identifier(a), {first}, "
+        f"Identifier(b)), {second}, Identifier(c))))"
+    )
+    assert ast_of(source) == expected
+
+
+def test_assignment_right_associative():
+    """Test: a = b.c = d;"""
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(a) = AssignExpr(MemberAccess(Identifier(b).c) = "
+        "Identifier(d))))"
+    )
+    assert ast_of("void main() { a = b.c = d; }") == expected
+
+
+def test_prefix_chain_right_associative():
+    """Test: x = !-+a; y = - -b;"""
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(x) = PrefixOp(!PrefixOp(-PrefixOp(+Identifier(a))))))",
+        "ExprStmt(AssignExpr(Identifier(y) = PrefixOp(-PrefixOp(-Identifier(b)))))",
+    )
+    assert ast_of("void main() { x = !-+a; y = - -b; }") == expected
+
+
+def test_prefix_and_postfix_increment_decrement():
+    """Test: ++x; --x; x++; x--;"""
+    expected = main_of(
+        "ExprStmt(PrefixOp(++Identifier(x)))",
+        "ExprStmt(PrefixOp(--Identifier(x)))",
+        "ExprStmt(PostfixOp(Identifier(x)++))",
+        "ExprStmt(PostfixOp(Identifier(x)--))",
+    )
+    assert ast_of("void main() { ++x; --x; x++; x--; }") == expected
+
+
+def test_postfix_binds_tighter_than_prefix():
+    """Test: y = -x++; z = ++p.n; w = --a.b--;"""
+    expected = main_of(
+        "ExprStmt(AssignExpr(Identifier(y) = PrefixOp(-PostfixOp(Identifier(x)++))))",
+        "ExprStmt(AssignExpr(Identifier(z) = PrefixOp(++MemberAccess(Identifier(p).n))))",
+        "ExprStmt(AssignExpr(Identifier(w) = "
+        "PrefixOp(--PostfixOp(MemberAccess(Identifier(a).b)--))))",
+    )
+    assert ast_of("void main() { y = -x++; z = ++p.n; w = --a.b--; }") == expected
+
+
+def test_member_chain_lhs():
+    """Test: assignment targets ending in a member access"""
+    source = "void main() { a.b.c = 1; f().x = 2; (p).q = 3; s.t.u.v = w.x; }"
+    expected = main_of(
+        "ExprStmt(AssignExpr(MemberAccess(MemberAccess(Identifier(a).b).c) = IntLiteral(1)))",
+        "ExprStmt(AssignExpr(MemberAccess(FuncCall(f, []).x) = IntLiteral(2)))",
+        "ExprStmt(AssignExpr(MemberAccess(Identifier(p).q) = IntLiteral(3)))",
+        "ExprStmt(AssignExpr(MemberAccess(MemberAccess(MemberAccess(Identifier(s).t).u).v) = "
+        "MemberAccess(Identifier(w).x)))",
+    )
+    assert ast_of(source) == expected
+
+
+def test_member_chain_lhs_through_calls():
+    """Test: g(1).h(2).k = v;"""
+    expected = main_of(
+        "ExprStmt(AssignExpr(MemberAccess(FuncCall(MemberAccess(FuncCall(g, "
+        "[IntLiteral(1)]).h), [IntLiteral(2)]).k) = Identifier(v)))"
+    )
+    assert ast_of("void main() { g(1).h(2).k = v; }") == expected
+
+
+def test_calls_on_identifier():
+    """Test: f(); g(1, "s", 2.5);"""
+    expected = main_of(
+        "ExprStmt(FuncCall(f, []))",
+        "ExprStmt(FuncCall(g, [IntLiteral(1), StringLiteral('s'), FloatLiteral(2.5)]))",
+    )
+    assert ast_of('void main() { f(); g(1, "s", 2.5); }') == expected
+
+
+def test_calls_on_non_identifier_callees():
+    """Test: the callee of a call on a call or member access is an expression"""
+    source = "void main() { f()(1); a.g(2, 3); f(1)(2).m; x = (a.b)(c)(); }"
+    expected = main_of(
+        "ExprStmt(FuncCall(FuncCall(f, []), [IntLiteral(1)]))",
+        "ExprStmt(FuncCall(MemberAccess(Identifier(a).g), [IntLiteral(2), IntLiteral(3)]))",
+        "ExprStmt(MemberAccess(FuncCall(FuncCall(f, [IntLiteral(1)]), [IntLiteral(2)]).m))",
+        "ExprStmt(AssignExpr(Identifier(x) = FuncCall(FuncCall(MemberAccess(Identifier(a).b), "
+        "[Identifier(c)]), [])))",
+    )
+    assert ast_of(source) == expected
+
+
+def test_call_arguments_are_full_expressions():
+    """Test: f(a = 1, b + c * d, -e);"""
+    expected = main_of(
+        "ExprStmt(FuncCall(f, [AssignExpr(Identifier(a) = IntLiteral(1)), "
+        "BinaryOp(Identifier(b), +, BinaryOp(Identifier(c), *, Identifier(d))), "
+        "PrefixOp(-Identifier(e))]))"
+    )
+    assert ast_of("void main() { f(a = 1, b + c * d, -e); }") == expected
+
+
+def test_if_else_and_while():
+    """Test: if/else nesting and while loops"""
+    source = "void main() { if (a) if (b) x = 1; else x = 2; while (i < 3) i++; }"
+    expected = main_of(
+        "IfStmt(if Identifier(a) then IfStmt(if Identifier(b) then "
+        "ExprStmt(AssignExpr(Identifier(x) = IntLiteral(1))), else "
+        "ExprStmt(AssignExpr(Identifier(x) = IntLiteral(2)))))",
+        "WhileStmt(while BinaryOp(Identifier(i), <, IntLiteral(3)) do "
+        "ExprStmt(PostfixOp(Identifier(i)++)))",
+    )
+    assert ast_of(source) == expected
@@ -0,0 +1,154 @@
+"""
+ATN cache test cases for TyC compiler
+"""
+
+import json
+import subprocess
+import sys
+from tests.utils import Parser, project_root
+from antlr4.atn.ATNDeserializer import ATNDeserializer
+from build import TyCLexer, TyCParser
+from src.parser import atn_cache
+
+
+def describe(atn):
+    """Structural summary of an ATN, independent of object identity."""
+    states = []
+    for s in atn.states:
+        transitions = [
+            (
+                type(t).__name__,
+                t.target.stateNumber,
+                t.serializationType,
+                None if t.label is None else [(r.start, r.stop) for r in t.label.intervals],
+                getattr(t, "ruleIndex", None),
+            )
+            for t in s.transitions
+        ]
+        states.append(
+            (type(s).__name__, s.stateNumber, s.ruleIndex, s.epsilonOnlyTransitions,
+             getattr(s, "decision", None), transitions)
+        )
+    return (
+        atn.grammarType,
+        atn.maxTokenType,
+        states,
+        [s.stateNumber for s in atn.decisionToState],
+        [s.stateNumber for s in atn.ruleToStartState],
+        [s.stateNumber for s in atn.ruleToStopState],
+        atn.ruleToTokenType,
+        atn.lexerActions,
+        {k: s.stateNumber for k, s in (atn.modeNameToStartState or {}).items()},
+    )
+
+
+def deserialize(module):
+    original = getattr(ATNDeserializer.deserialize, "__wrapped__", ATNDeserializer.deserialize)
+    return original(ATNDeserializer(), module.serializedATN())
+
+
+def test_round_trip_lexer_and_parser():
+    for module in (TyCLexer, TyCParser):
+        atn = deserialize(module)
+        decoded = atn_cache.decode_atn(atn_cache.encode_atn(atn))
+        assert describe(decoded) == describe(atn)
+        assert all(s.atn is decoded for s in decoded.states)
+
+
+def test_lexer_actions_round_trip():
+    atn = deserialize(TyCLexer)
+    decoded = atn_cache.decode_atn(atn_cache.encode_atn(atn))
+    assert [type(a) for a in decoded.lexerActions] == [type(a) for a in atn.lexerActions]
+    for a, b in zip(atn.lexerActions, decoded.lexerActions):
+        assert a == b
+
+
+def test_cache_miss_then_hit(tmp_path):
+    path = str(tmp_path / "TyC.atn")
+    cache = atn_cache.ATNCache(path)
+    cache.deserialize(TyCParser.serializedATN(), lambda d: deserialize(TyCParser))
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache = atn_cache.ATNCache(path)
+    atn = cache.deserialize(TyCParser.serializedATN(), lambda d: deserialize(TyCParser))
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert describe(atn) == describe(deserialize(TyCParser))
+
+
+def test_grammar_change_invalidates(tmp_path):
+    grammar = tmp_path / "TyC.g4"
+    grammar.write_text("grammar TyC;\n")
+    path = str(tmp_path / "TyC.atn")
+    atn_cache.ATNCache(path, str(grammar)).deserialize(
+        TyCLexer.serializedATN(), lambda d: deserialize(TyCLexer)
+    )
+    assert atn_cache.ATNCache(path, str(grammar)).load()
+
+    grammar.write_text("grammar TyC;\nprogram: EOF;\n")
+    cache = atn_cache.ATNCache(path, str(grammar))
+    assert cache.entries == []
+    cache.deserialize(TyCLexer.serializedATN(), lambda d: deserialize(TyCLexer))
+    assert cache.misses == 1
+
+
+def test_corrupt_cache_ignored(tmp_path):
+    path = tmp_path / "TyC.atn"
+    path.write_bytes(b"TYCATN\n" + json.dumps([1, 2])[:3].encode())
+    assert not atn_cache.ATNCache(str(path)).load()
+    path.write_bytes(b"not a cache")
+    assert not atn_cache.ATNCache(str(path)).load()
+
+
+def test_crafted_entry_rejected(tmp_path):
+    path = str(tmp_path / "TyC.atn")
+    cache = atn_cache.ATNCache(path)
+    cache.deserialize(TyCLexer.serializedATN(), lambda d: deserialize(TyCLexer))
+    with open(path, "rb") as f:
+        magic, payload = f.read(7), json.loads(f.read())
+    classes = payload[1][0][1][0]
+    crafted = [
+        # Values may only name the known enums, objects only the ATN classes
+        ["ATN", 1, [["grammarType", 3, [["e", "os.system", 0]]]]],
+        ["Popen", 1, []],
+        # Slots and indices must fit the class and the graph
+        ["ATN", 1, [["__class__", 0, [0]]]],
+        ["ATN", 1, [["states", 2, [[10**6]]]]],
+    ]
+    for entry in crafted:
+        payload[1][0][1][0] = [entry] + classes[1:]
+        with open(path, "wb") as f:
+            f.write(magic + json.dumps(payload).encode())
+        cache = atn_cache.ATNCache(path)
+        assert cache.load()
+        atn = cache.deserialize(TyCLexer.serializedATN(), lambda d: deserialize(TyCLexer))
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert describe(atn) == describe(deserialize(TyCLexer))
+        # The rejected entry was rewritten
+        assert atn_cache.ATNCache(path).deserialize(TyCLexer.serializedATN(), None) is not None
+
+
+def test_cached_import_in_new_process(tmp_path):
+    path = str(tmp_path / "TyC.atn")
+    script = (
+        "import sys; sys.path.insert(0, 'build');"
+        "from src.parser import atn_cache;"
+        f"cache = atn_cache.install({path!r});"
+        "from tests.utils import Parser;"
+        "print(cache.hits, cache.misses,"
+        " Parser('void main() { int x = ; }').parse(),"
+        " Parser('int f(int a) { return a * 2; }').parse())"
+    )
+    runs = [
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split(" ", 2)
+        for _ in range(2)
+    ]
+    assert runs[0][:2] == ["0", "2"]
+    assert runs[1][:2] == ["2", "0"]
+    assert runs[1][2].strip() == "Error on line 1 col 22: ; success"
+    assert Parser("void main() { int x = ; }").parse() == "Error on line 1 col 22: ;"
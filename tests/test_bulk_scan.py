@@ -0,0 +1,90 @@
+"""
+Bulk scanning lexer test cases for TyC compiler
+BulkScanLexer must produce exactly the tokens and errors of TyCLexer.
+"""
+
+import random
+
+import pytest
+from antlr4 import InputStream
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from src.lexer.bulk_scan import BulkScanLexer
+from src.lexer.char_streams import CompactInputStream, MappedFileStream
+
+
+def lex(lexer_class, stream, recover=False):
+    lexer = lexer_class(stream)
+    if recover:
+        lexer.diagnostics = []
+    tokens = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            tokens.append((t.type, t.text, t.start, t.stop, t.line, t.column))
+            if t.type == -1:
+                break
+    except Exception as e:
+        tokens.append(str(e))
+    return tokens, [str(d) for d in lexer.diagnostics or ()]
+
+
+def check(source, recover=False):
+    expected = lex(TyCLexer, InputStream(source), recover)
+    assert lex(BulkScanLexer, InputStream(source), recover) == expected
+    assert lex(BulkScanLexer, CompactInputStream(source), recover) == expected
+
+
+SOURCES = [
+    "/* license\n * header\n */\nint main() { return 0; }\n",
+    'string s = "a\\tb\\"c\\\\";  // trailing\r\nfloat f;',
+    "int a; /* never closed\n",
+    "a /* x */ b /**/ c /* * / */ d",
+    "// only a comment",
+    "   \n\t\f\r\n",
+    'x = "unclosed\r\nint y;',
+    'x = "unclosed at eof',
+    'x = "ends in backslash\\',
+    'x = "bad \\q escape";',
+    'a = "abc\\\n";',
+    'a = "abc\\\r\n";',
+    'a = "é€" /* ü */ "x";',
+    "a @ b",
+]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("recover", [False, True])
+def test_matches_antlr_lexer(source, recover):
+    check(source, recover)
+
+
+def test_bulk_backend():
+    for source in SOURCES:
+        assert (
+            Tokenizer(source, "bulk").get_tokens_as_string()
+            == Tokenizer(source, "antlr").get_tokens_as_string()
+        )
+
+
+def test_mapped_file(tmp_path):
+    path = tmp_path / "prog.tyc"
+    for source in SOURCES:
+        if source.isascii():
+            path.write_bytes(source.encode("ascii"))
+            with MappedFileStream(str(path)) as stream:
+                assert lex(BulkScanLexer, stream, True) == lex(TyCLexer, InputStream(source), True)
+
+
+def test_long_comment_and_string_positions():
+    source = "/*" + "x\n" * 5000 + "*/ a = \"" + "y" * 5000 + "\";\nb"
+    tokens, _ = lex(BulkScanLexer, CompactInputStream(source))
+    assert [t[4:] for t in tokens] == [(5001, 3), (5001, 5), (5001, 7), (5001, 5009), (5002, 0), (5002, 1)]
+    check(source)
+
+
+def test_random_sources_match_antlr_lexer():
+    rng = random.Random(9)
+    pieces = ["a", " ", "\n", "\r\n", "/", "*", "*/", "/*", "//", '"', "\\", "\\n", "\\q", "1.5", "é", "@"]
+    for _ in range(300):
+        check("".join(rng.choice(pieces) for _ in range(rng.randint(0, 25))), recover=True)
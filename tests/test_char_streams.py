@@ -0,0 +1,116 @@
+"""
+Character stream test cases for TyC compiler
+Checks that CompactInputStream and MappedFileStream lex exactly like
+antlr4.InputStream when plugged into TyCLexer.
+"""
+
+import pytest
+from antlr4 import InputStream
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from src.lexer.char_streams import (
+    CompactInputStream,
+    MappedFileStream,
+    open_char_stream,
+)
+from src.lexer.fast_lexer import FastLexer
+
+
+def lex_all(stream, lexer_class=TyCLexer):
+    lexer = lexer_class(stream)
+    result = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            result.append((t.type, t.text, t.line, t.column))
+            if t.type == -1:
+                break
+    except Exception as e:
+        result.append(str(e))
+    return result
+
+
+SOURCES = [
+    "int x = 5;\nfloat y = 1.5e3; // done",
+    'string s = "café ñ";',
+    'string s = "中文 \U0001f600"; x = 1;',
+    "x = é;",
+    "",
+]
+
+
+def test_compact_stream_ascii_uses_bytes():
+    stream = CompactInputStream("int x;")
+    assert isinstance(stream.data, bytes)
+    assert stream.size == 6
+    assert stream.LA(1) == ord("i")
+
+
+def test_compact_stream_wide_uses_array():
+    stream = CompactInputStream("a中\U0001f600")
+    assert stream.data.typecode in ("I", "L")
+    assert stream.size == 3
+    assert stream.getText(1, 2) == "中\U0001f600"
+
+
+def test_compact_stream_get_text_bounds():
+    stream = CompactInputStream("hello")
+    assert stream.getText(1, 3) == "ell"
+    assert stream.getText(3, 100) == "lo"
+    assert stream.getText(10, 12) == ""
+    assert str(stream) == "hello"
+
+
+def test_compact_stream_matches_input_stream():
+    for source in SOURCES:
+        assert lex_all(CompactInputStream(source)) == lex_all(InputStream(source))
+
+
+def test_compact_stream_with_fast_lexer():
+    for source in SOURCES:
+        expected = lex_all(InputStream(source))
+        assert lex_all(CompactInputStream(source), FastLexer) == expected
+
+
+def test_tokenizer_non_ascii_string():
+    source = 'string s = "café";'
+    assert Tokenizer(source).get_tokens_as_string() == "string,s,=,café,;,<EOF>"
+
+
+def test_mapped_stream_matches_input_stream(tmp_path):
+    source = SOURCES[0]
+    path = tmp_path / "prog.tyc"
+    path.write_bytes(source.encode("ascii"))
+    with MappedFileStream(str(path)) as stream:
+        assert stream.name == str(path)
+        assert lex_all(stream) == lex_all(InputStream(source))
+
+
+def test_mapped_stream_empty_file(tmp_path):
+    path = tmp_path / "empty.tyc"
+    path.write_bytes(b"")
+    with MappedFileStream(str(path)) as stream:
+        assert lex_all(stream) == lex_all(InputStream(""))
+
+
+def test_mapped_stream_rejects_non_ascii(tmp_path):
+    path = tmp_path / "utf8.tyc"
+    path.write_bytes(SOURCES[2].encode("utf-8"))
+    with pytest.raises(UnicodeDecodeError):
+        MappedFileStream(str(path))
+
+
+def test_open_char_stream_falls_back_for_utf8(tmp_path):
+    path = tmp_path / "utf8.tyc"
+    path.write_bytes(SOURCES[2].encode("utf-8"))
+    stream = open_char_stream(str(path))
+    assert isinstance(stream, CompactInputStream)
+    assert lex_all(stream) == lex_all(InputStream(SOURCES[2]))
+
+
+def test_open_char_stream_latin1(tmp_path):
+    path = tmp_path / "latin1.tyc"
+    path.write_bytes(SOURCES[1].encode("latin-1"))
+    with open_char_stream(str(path), "latin-1") as stream:
+        assert isinstance(stream, MappedFileStream)
+        assert lex_all(stream) == lex_all(InputStream(SOURCES[1]))
@@ -0,0 +1,59 @@
+"""
+Declaration-at-a-time streaming AST test cases for TyC compiler
+"""
+
+import io
+
+import pytest
+from tests.utils import ASTGenerator
+from src.parser.streaming import parse_declarations, parse_program_stream
+from src.utils.nodes import FuncDecl, StructDecl, VarDecl
+
+SOURCES = [
+    "void main() { int a = 1; a = a + 2 * 3; }",
+    "struct P { int x; P next; }; int g = 1; auto h = g; void main() { P p; p.next.x = 1; }",
+    "int f(int n) { for (int i = 0; i < n; ++i) { n = n - i; } return n; } void main() { f(3); }",
+    'void main() { switch (x) { case 1: printString("a"); break; default: y--; } }',
+    "int a; void main() { int a = ; }",
+    "int a; int b",
+    "int a; @",
+    "void main() { } }",
+    'void main() { string s = "abc\\q"; }',
+    "",
+]
+
+
+def streamed(source, chunk_size):
+    try:
+        return str(parse_program_stream(io.StringIO(source), chunk_size=chunk_size))
+    except Exception as e:
+        return f"AST Generation Error: {str(e)}"
+
+
+@pytest.mark.parametrize("chunk_size", [2, 1 << 20])
+def test_matches_ast_generator(chunk_size):
+    for source in SOURCES:
+        assert streamed(source, chunk_size) == str(ASTGenerator(source).generate())
+
+
+def test_yields_before_reading_on():
+    class Source(io.StringIO):
+        reads = 0
+
+        def read(self, size=-1):
+            self.reads += 1
+            return super().read(size)
+
+    source = Source("struct S { int x; };\n" + "int f() { return 1; }\n" * 200)
+    decls = parse_declarations(source, chunk_size=64)
+    assert isinstance(next(decls), StructDecl)
+    assert source.reads < 5
+    assert all(isinstance(d, FuncDecl) for d in decls)
+    assert source.reads > 50
+
+
+def test_declarations_before_error_are_yielded():
+    decls = parse_declarations(io.StringIO("int a = 1; float b; int c = ;"))
+    assert [type(next(decls)), type(next(decls))] == [VarDecl, VarDecl]
+    with pytest.raises(Exception, match="Error on line 1 col 28: ;"):
+        next(decls)
@@ -0,0 +1,116 @@
+"""
+DFA cache test cases for TyC compiler
+"""
+
+import os
+import json
+import subprocess
+import sys
+from tests.utils import Parser, project_root
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.parser import dfa_cache
+
+
+SOURCES = [
+    "struct P { int x; }; void main() { P p; p.x = 1; }",
+    "int f(int a) { for (int i = 0; i < a; ++i) { a = a + i; } return a; }",
+    'void main() { switch (x) { case 1: printString("a"); break; default: y--; } }',
+]
+
+
+def test_round_trip_keeps_states(tmp_path):
+    dfa_cache.warm_up(SOURCES)
+    path = str(tmp_path / "TyC.dfa")
+    dfa_cache.save_dfa_cache(path)
+    lexer_states = dfa_cache.count_dfa_states(TyCLexer)
+    parser_states = dfa_cache.count_dfa_states(TyCParser)
+
+    assert dfa_cache.load_dfa_cache(path)
+    assert dfa_cache.count_dfa_states(TyCLexer) == lexer_states
+    assert dfa_cache.count_dfa_states(TyCParser) == parser_states
+
+    dfa_cache.warm_up(SOURCES)
+    assert dfa_cache.count_dfa_states(TyCParser) == parser_states
+
+
+def test_parse_results_after_load(tmp_path):
+    path = str(tmp_path / "TyC.dfa")
+    dfa_cache.warm_up(SOURCES)
+    dfa_cache.save_dfa_cache(path)
+    assert dfa_cache.load_dfa_cache(path)
+    for source in SOURCES:
+        assert Parser(source).parse() == "success"
+    assert Parser("void main() { int x = ; }").parse() == "Error on line 1 col 22: ;"
+
+
+def test_missing_cache(tmp_path):
+    assert not dfa_cache.load_dfa_cache(str(tmp_path / "missing.dfa"))
+
+
+def test_stale_fingerprint_rejected(tmp_path):
+    path = str(tmp_path / "TyC.dfa")
+    dfa_cache.save_dfa_cache(path)
+    with open(path) as f:
+        payload = json.load(f)
+    payload["recognizers"]["TyCParser"]["fingerprint"] = "0" * 64
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    assert not dfa_cache.load_dfa_cache(path)
+
+
+def test_stale_format_rejected(tmp_path):
+    path = str(tmp_path / "TyC.dfa")
+    dfa_cache.save_dfa_cache(path)
+    with open(path) as f:
+        payload = json.load(f)
+    payload["format"] = -1
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    assert not dfa_cache.load_dfa_cache(path)
+
+
+def test_malformed_cache_rejected(tmp_path):
+    path = str(tmp_path / "TyC.dfa")
+    dfa_cache.warm_up(SOURCES)
+    dfa_cache.save_dfa_cache(path)
+    parser_states = dfa_cache.count_dfa_states(TyCParser)
+    with open(path) as f:
+        payload = json.load(f)
+    # An edge to a state that does not exist
+    dfas = payload["recognizers"]["TyCParser"]["dfas"]["dfas"]
+    record = next(r for dfa in dfas for r in dfa[4] if r[2])
+    record[2][0] = 10**6
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    assert not dfa_cache.load_dfa_cache(path)
+    assert dfa_cache.count_dfa_states(TyCParser) == parser_states
+
+    with open(path, "w") as f:
+        f.write("\x80\x04 not json")
+    assert not dfa_cache.load_dfa_cache(path)
+
+
+def test_warm_start_in_new_process(tmp_path):
+    """Loaded states must match recomputed ones despite str hash randomization."""
+    path = str(tmp_path / "TyC.dfa")
+    script = (
+        "import sys; from src.parser import dfa_cache as d;"
+        "from build.TyCLexer import TyCLexer as L; from build.TyCParser import TyCParser as P;"
+        f"ok = d.load_dfa_cache({path!r});"
+        "n = (d.count_dfa_states(L), d.count_dfa_states(P));"
+        f"d.warm_up({SOURCES!r});"
+        "print(ok, n == (d.count_dfa_states(L), d.count_dfa_states(P)))"
+    )
+    dfa_cache.warm_up(SOURCES)
+    dfa_cache.save_dfa_cache(path)
+    env = dict(os.environ, PYTHONHASHSEED="random")
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=project_root,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert out.split() == ["True", "True"]
@@ -0,0 +1,87 @@
+"""
+Direct-to-AST parser test cases for TyC compiler
+Every source is built with both parser backends, which must agree on the
+AST and on the error message.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, Parser
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import parse_ast
+
+
+def build(source, backend, lexer_backend="antlr"):
+    try:
+        return str(parse_ast(CompactInputStream(source), backend, lexer_backend))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+VALID = [
+    "void main() {}",
+    "struct P { int x; P next; }; int g = 1; auto h = 2.5; string s;",
+    "int f(int a, P p) { return (a + p.x) * 2 - a / 3 % 4; }",
+    "f() { a = b = c; a.b.c = d; f().x = 1; (a).b = 2; a++.x = 3; }",
+    "void main() { f(g)(1); x.y(2); -a++; !b--; ++--c; x = (a = 1) + 2; }",
+    "void main() { a || b && c == d != e < f <= g > h >= i + j - k * l / m % n; }",
+    "void main() { for (int i = 0; i < 10; i++) for (P p = q; ;) for (a.b = 1; ; ++i) {} }",
+    "void main() { for (;;) { break; continue; } for (;; i = i + 1) {} for (auto k = 1;;) x++; }",
+    "void main() { if (a) if (b) c; else d; while (x) { int y; } return; }",
+    'void main() { switch (x) { case 1: a; int z; case 2: default: "s"; case 3: } }',
+    "void main() { switch (x) {} P p; P q = p; { { } } }",
+]
+
+INVALID = [
+    "",
+    "int main() {}",
+    "void main() { (a) = 1; }",
+    "void main() { f() = 1; }",
+    "void main() { a + b = 1; }",
+    "void main() { for (;; i + 1) {} }",
+    "void main() { for (int a;;) {} }",
+    "void main() { switch (x) { default: default: } }",
+    "void main() { int a = ; }",
+    "void main() { a = 1 }",
+    "struct S { int a }",
+    "void main() { x = ; } @",
+    "void main() { } @",
+    'void main() { string s = "abc\\q"; }',
+]
+
+
+@pytest.mark.parametrize("source", VALID)
+@pytest.mark.parametrize("lexer_backend", ["antlr", "fast"])
+def test_valid_programs(source, lexer_backend):
+    ast = build(source, "direct", lexer_backend)
+    assert ast.startswith("Program(")
+    assert ast == build(source, "antlr", lexer_backend)
+
+
+@pytest.mark.parametrize("source", INVALID)
+def test_errors_match_antlr(source):
+    message = build(source, "direct")
+    assert not message.startswith("Program(")
+    assert message == build(source, "antlr")
+
+
+def test_ast_shape():
+    assert build("f() { a.b = c(1, 2.5, \"s\"); }", "direct") == (
+        "Program([FuncDecl(auto, f, [], BlockStmt([ExprStmt(AssignExpr("
+        "MemberAccess(Identifier(a).b) = FuncCall(c, [IntLiteral(1), FloatLiteral(2.5), "
+        "StringLiteral('s')])))]))])"
+    )
+
+
+def test_wrappers_select_backend():
+    source = "void main() { int a = 1 + 2 * 3; }"
+    assert str(ASTGenerator(source, parser_backend="direct").generate()) == str(
+        ASTGenerator(source, parser_backend="antlr").generate()
+    )
+    assert Parser("void main() { a = 1 }", parser_backend="direct").parse() == (
+        "Error on line 1 col 20: }"
+    )
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        parse_ast(CompactInputStream("void main() {}"), "yacc")
@@ -0,0 +1,140 @@
+"""
+FastLexer test cases for TyC compiler
+Each case checks that the hand-written lexer produces exactly the same
+tokens (type, text, position) and errors as the ANTLR-generated TyCLexer.
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from tests.utils import Tokenizer, Parser
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.lexer.fast_lexer import FastLexer, create_lexer
+
+
+def lex_all(lexer_class, source):
+    """Return every token as a tuple, ending with the error message if any."""
+    lexer = lexer_class(InputStream(source))
+    result = []
+    try:
+        while True:
+            t = lexer.nextToken()
+            result.append((t.type, t.text, t.line, t.column, t.start, t.stop))
+            if t.type == -1:
+                break
+    except Exception as e:
+        result.append((type(e).__name__, str(e)))
+    return result
+
+
+def assert_same_tokens(source):
+    assert lex_all(FastLexer, source) == lex_all(TyCLexer, source)
+
+
+def test_keywords_and_ids():
+    assert_same_tokens("int float string auto void main break case continue default")
+    assert_same_tokens("else for if return struct switch while integer _x x1 If")
+
+
+def test_operators():
+    assert_same_tokens("== != <= >= || && ++ -- = < > + - * / % ! . +++ ===")
+
+
+def test_separators():
+    assert_same_tokens("; , ( ) { } :")
+
+
+def test_int_and_float_literals():
+    assert_same_tokens("0 123 1.5 1. .5 1e5 1E-5 1.e+3 .5e2 1..2 1.5.3")
+
+
+def test_incomplete_exponent():
+    assert_same_tokens("1e 1e+ 1.5e- .5E")
+
+
+def test_string_literals():
+    assert_same_tokens('"hello" "" "a\\tb\\n\\"q\\"\\\\" "x" "y"')
+
+
+def test_string_non_ascii():
+    assert_same_tokens('"café ñ" x')
+
+
+def test_unclose_string_eof():
+    assert_same_tokens('int x = "hello')
+
+
+def test_unclose_string_newline():
+    assert_same_tokens('"hello\nworld"')
+
+
+def test_unclose_string_carriage_return():
+    assert_same_tokens('"hello\rworld"')
+
+
+def test_unclose_string_backslash_eof():
+    assert_same_tokens('"abc\\')
+
+
+def test_illegal_escape():
+    assert_same_tokens('"ok\\n\\t\\y rest"')
+
+
+def test_backslash_newline_in_string():
+    assert_same_tokens('"abc\\\nd"')
+
+
+def test_error_chars():
+    assert_same_tokens("a | b")
+    assert_same_tokens("a & b")
+    assert_same_tokens("x = é;")
+    assert_same_tokens("#include")
+
+
+def test_comments():
+    assert_same_tokens("a // line comment\nb /* block\ncomment */ c")
+    assert_same_tokens("a /* unterminated\n comment")
+    assert_same_tokens("a /**/ b /*/ c */ d // tail")
+
+
+def test_line_and_column_tracking():
+    assert_same_tokens("int x;\n\tfloat y;\r\n  string z;\f\n/* a\nb */ w")
+
+
+def test_empty_input():
+    assert_same_tokens("")
+    assert_same_tokens("   \n\t ")
+
+
+def test_tokenizer_backend():
+    source = 'int x = 5; string s = "hi";'
+    expected = Tokenizer(source, backend="antlr").get_tokens_as_string()
+    assert Tokenizer(source, backend="fast").get_tokens_as_string() == expected
+
+
+def test_tokenizer_backend_error():
+    assert Tokenizer("a $", backend="fast").get_tokens_as_string() == "a,Error Token $"
+
+
+def test_parser_backend_success():
+    source = "struct P { int x; }; void main() { P p; p.x = 1 + 2 * 3; }"
+    assert Parser(source, backend="fast").parse() == "success"
+
+
+def test_parser_backend_error_message():
+    source = "void main() {\n    int x = ;\n}"
+    expected = Parser(source, backend="antlr").parse()
+    assert Parser(source, backend="fast").parse() == expected
+
+
+def test_parser_consumes_fast_tokens():
+    source = "int add(int a, int b) { return a + b; } void main() { }"
+    parser = TyCParser(CommonTokenStream(FastLexer(InputStream(source))))
+    tree = parser.program()
+    assert parser.getNumberOfSyntaxErrors() == 0
+    assert tree.getText() == source.replace(" ", "") + "<EOF>"
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_lexer(InputStream("x"), "nope")
@@ -0,0 +1,131 @@
+"""
+Incremental relexing test cases for TyC compiler
+Every edit is checked against lexing the whole edited source from scratch.
+"""
+
+import random
+
+import pytest
+from antlr4 import InputStream
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.incremental import IncrementalLexer
+from src.lexer.token_buffer import TokenBuffer
+
+
+def columns(buffer):
+    return [
+        (buffer.types[i], buffer.text(i), buffer.starts[i], buffer.stops[i],
+         buffer.lines[i], buffer.columns[i])
+        for i in range(len(buffer))
+    ]
+
+
+def relex_from_scratch(text, backend="fast", recover=False):
+    lexer = create_lexer(InputStream(text), backend, recover=recover)
+    buffer = TokenBuffer.from_lexer(lexer)
+    return columns(buffer), [str(d) for d in lexer.diagnostics or ()]
+
+
+def check_edit(lexer, start, end, text):
+    new_text = lexer.text[:start] + text + lexer.text[end:]
+    changed = lexer.edit(start, end, text)
+    assert lexer.text == new_text
+    expected, diagnostics = relex_from_scratch(new_text, lexer.backend, lexer.recover)
+    assert columns(lexer.buffer) == expected
+    assert [str(d) for d in lexer.diagnostics or ()] == diagnostics
+    return changed
+
+
+SOURCE = """struct Point { int x; int y; };
+/* block
+   comment */
+int f(int a) {
+    string s = "hello\\n";
+    float g = 1.5e3;
+    return a + 1; // done
+}
+"""
+
+
+def test_edit_reuses_tokens():
+    lexer = IncrementalLexer(SOURCE)
+    total = len(lexer.buffer)
+    changed = check_edit(lexer, SOURCE.index("a + 1"), SOURCE.index("a + 1") + 1, "abc")
+    assert len(changed) < total / 2
+
+
+def test_newline_edits_shift_lines_and_columns():
+    lexer = IncrementalLexer(SOURCE)
+    check_edit(lexer, SOURCE.index("int x"), SOURCE.index("int x"), "\n  ")
+    check_edit(lexer, lexer.text.index("\n"), lexer.text.index("\n") + 1, "")
+    check_edit(lexer, lexer.text.index("float"), lexer.text.index("float"), "  ")
+
+
+def test_block_comment_open_and_close():
+    lexer = IncrementalLexer(SOURCE)
+    check_edit(lexer, SOURCE.index("comment */"), SOURCE.index("comment */") + 10, "comment")
+    # The comment now runs to EOF unterminated: "/" and "*" are tokens
+    assert TyCLexer.DIV in lexer.buffer.types
+    end = lexer.text.index("return")
+    check_edit(lexer, end, end, "*/")
+    check_edit(lexer, 0, 0, "/*")
+
+
+def test_string_edits():
+    lexer = IncrementalLexer(SOURCE, recover=True)
+    quote = SOURCE.index('"hello')
+    check_edit(lexer, quote + 6, quote + 6, "\\q")
+    check_edit(lexer, quote + 6, quote + 8, "")
+    check_edit(lexer, quote + 1, quote + 1, '"')
+    check_edit(lexer, quote + 8, quote + 9, "")
+    assert lexer.diagnostics
+
+
+def test_recovering_diagnostics_follow_edits():
+    lexer = IncrementalLexer("a @ b\nc $ d\n", recover=True)
+    assert [str(d) for d in lexer.diagnostics] == [
+        "Error on line 1 col 2: Error Token @",
+        "Error on line 2 col 2: Error Token $",
+    ]
+    check_edit(lexer, 0, 0, "xx\n ")
+    assert str(lexer.diagnostics[-1]) == "Error on line 3 col 2: Error Token $"
+    check_edit(lexer, lexer.text.index("@"), lexer.text.index("@") + 1, "+")
+    assert len(lexer.diagnostics) == 1
+
+
+def test_fail_fast_error_keeps_state():
+    lexer = IncrementalLexer("int a;")
+    tokens = columns(lexer.buffer)
+    with pytest.raises(Exception) as e:
+        lexer.edit(4, 4, "@")
+    assert str(e.value) == "Error Token @"
+    assert lexer.text == "int a;"
+    assert columns(lexer.buffer) == tokens
+
+
+def test_edit_range_checked():
+    lexer = IncrementalLexer("int a;")
+    with pytest.raises(ValueError):
+        lexer.edit(3, 20, "")
+
+
+@pytest.mark.parametrize("backend", ["antlr", "bulk", "fast"])
+def test_random_edits_match_full_relex(backend):
+    rng = random.Random(7)
+    pieces = ["a", "1", ".", "e", "+", '"', "\\", "\n", " ", "/", "*", "*/", "/*", "x;", "@"]
+    lexer = IncrementalLexer(SOURCE * 3, backend, recover=True)
+    for _ in range(300):
+        start = rng.randint(0, len(lexer.text))
+        end = min(len(lexer.text), start + rng.choice([0, 1, 1, 3]))
+        check_edit(lexer, start, end, rng.choice(pieces) if rng.random() < 0.8 else "")
+
+
+def test_buffer_usable_by_tokenizer_text():
+    lexer = IncrementalLexer("int a;")
+    lexer.edit(4, 5, "bcd")
+    assert [lexer.buffer.text(i) for i in range(len(lexer.buffer))] == [
+        "int", "bcd", ";", "<EOF>"
+    ]
+    assert Tokenizer(lexer.text).get_tokens_as_string() == "int,bcd,;,<EOF>"
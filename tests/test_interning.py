@@ -0,0 +1,68 @@
+"""
+Identifier and literal interning test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.interning import NO_SYMBOL, SymbolTable
+
+BACKENDS = ["antlr", "bulk", "fast"]
+
+
+def lex(source, backend, symbols):
+    lexer = create_lexer(InputStream(source), backend, symbols=symbols)
+    tokens = []
+    while True:
+        t = lexer.nextToken()
+        tokens.append(t)
+        if t.type == -1:
+            return tokens
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_ids_and_values(backend):
+    symbols = SymbolTable()
+    tokens = lex("int x = x + 007 * 1.5e1; float y = x;", backend, symbols)
+    interned = [(t.text, t.symbol) for t in tokens if t.symbol != NO_SYMBOL]
+    assert interned == [("x", 0), ("x", 0), ("007", 1), ("1.5e1", 2), ("y", 3), ("x", 0)]
+    assert symbols.values == ["x", 7, 15.0, "y"]
+    assert list(symbols.types) == [TyCLexer.ID, TyCLexer.INTLIT, TyCLexer.FLOATLIT, TyCLexer.ID]
+    assert symbols.lookup("y") == 3 and symbols.lookup("z") == NO_SYMBOL
+    assert all(t.symbol == NO_SYMBOL for t in tokens if t.type not in symbols.types)
+
+
+def test_occurrences_share_one_text():
+    symbols = SymbolTable()
+    first, second = [t for t in lex("counter counter", "fast", symbols) if t.type == TyCLexer.ID]
+    assert first.text is second.text is symbols.lexeme(0)
+
+
+def test_table_shared_across_lexers():
+    symbols = SymbolTable()
+    a = lex("a b", "antlr", symbols)
+    b = lex("b a 1", "fast", symbols)
+    assert [t.symbol for t in b[:3]] == [a[1].symbol, a[0].symbol, 2]
+    assert len(symbols) == 3
+
+
+def test_tokens_unchanged():
+    source = 'struct P { int x; }; string s = "a\\tb"; float f = .5 + 1.;'
+    lexer = create_lexer(InputStream(source), symbols=SymbolTable())
+    texts = []
+    while (t := lexer.nextToken()).type != -1:
+        texts.append(t.text)
+    assert ",".join(texts) + ",<EOF>" == Tokenizer(source).get_tokens_as_string()
+
+
+def test_parser_sees_interned_tokens():
+    symbols = SymbolTable()
+    lexer = create_lexer(InputStream("void main() { int n = 42; }"), symbols=symbols)
+    stream = CommonTokenStream(lexer)
+    TyCParser(stream).program()
+    ids = [t for t in stream.tokens if t.type == TyCLexer.ID]
+    assert [symbols.value(t.symbol) for t in ids] == ["n"]
+    assert [t.clone().symbol for t in ids] == [t.symbol for t in ids]
@@ -0,0 +1,85 @@
+"""
+Recovering lexer mode test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import InputStream
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from src.lexer.fast_lexer import create_lexer
+
+BACKENDS = ["antlr", "bulk", "fast"]
+
+
+def lex_recovering(source, backend):
+    lexer = create_lexer(InputStream(source), backend, recover=True)
+    tokens = []
+    while True:
+        t = lexer.nextToken()
+        tokens.append((t.type, t.text))
+        if t.type == -1:
+            return tokens, lexer.diagnostics
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_default_is_fail_fast(backend):
+    lexer = create_lexer(InputStream("a @ b"), backend)
+    assert lexer.diagnostics is None
+    lexer.nextToken()
+    with pytest.raises(Exception) as e:
+        lexer.nextToken()
+    assert str(e.value) == "Error Token @"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_records_every_error(backend):
+    source = 'int a = 1 @ 2;\nstring s = "bad\\q";\n$ x = "open\nfloat f;'
+    tokens, diagnostics = lex_recovering(source, backend)
+    assert [str(d) for d in diagnostics] == [
+        "Error on line 1 col 10: Error Token @",
+        "Error on line 2 col 11: Illegal Escape In String: bad\\q",
+        "Error on line 2 col 17: Unclosed String: ;\n",
+        "Error on line 3 col 0: Error Token $",
+        "Error on line 3 col 6: Unclosed String: open\n",
+    ]
+    assert tokens[-4:] == [
+        (TyCLexer.FLOAT, "float"),
+        (TyCLexer.ID, "f"),
+        (TyCLexer.SEMI, ";"),
+        (-1, "<EOF>"),
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_error_tokens_stay_in_stream(backend):
+    tokens, diagnostics = lex_recovering('x ? "abc', backend)
+    assert tokens == [
+        (TyCLexer.ID, "x"),
+        (TyCLexer.ERROR_CHAR, "?"),
+        (TyCLexer.UNCLOSE_STRING, "abc"),
+        (-1, "<EOF>"),
+    ]
+    assert [d.type for d in diagnostics] == [TyCLexer.ERROR_CHAR, TyCLexer.UNCLOSE_STRING]
+    assert diagnostics[1].message == "Unclosed String: abc"
+    assert (diagnostics[1].start, diagnostics[1].stop) == (4, 7)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_clean_source_has_no_diagnostics(backend):
+    tokens, diagnostics = lex_recovering('void main() { printString("ok"); }', backend)
+    assert diagnostics == []
+    assert len(tokens) == 12
+
+
+def test_backends_agree():
+    source = 'a\\b "x\\\ny" "z\\t" ~ /* open\n"\r q'
+    results = []
+    for backend in BACKENDS:
+        tokens, diagnostics = lex_recovering(source, backend)
+        results.append((tokens, [(d.type, d.start, d.stop, str(d)) for d in diagnostics]))
+    assert results[0] == results[1]
+    assert len(results[0][1]) == 6
+
+
+def test_tokenizer_output_unchanged():
+    assert Tokenizer("a @").get_tokens_as_string() == "a,Error Token @"
@@ -0,0 +1,96 @@
+"""
+AST node class test cases for TyC compiler
+"""
+
+import copy
+import gc
+import inspect
+import pickle
+import weakref
+
+import pytest
+from tests.utils import ASTGenerator
+from antlr4.Token import Token
+from src.astgen.ast_generation import ASTGeneration
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.direct_parser import DirectParser
+from src.utils import nodes
+from src.utils.nodes import FloatType, IntType, StructType, VoidType
+
+NODE_CLASSES = [
+    cls for cls in vars(nodes).values() if inspect.isclass(cls) and issubclass(cls, nodes.ASTNode)
+]
+
+
+@pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda cls: cls.__name__)
+def test_nodes_have_no_dict(cls):
+    assert "__slots__" in cls.__dict__
+    if not inspect.isabstract(cls):
+        node = object.__new__(cls)
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = 1
+
+
+def test_position_and_pickling():
+    source = "struct P { int x; };\nint f(P p) { return -p.x * (2 + 1.5); }\nvoid main() { auto s = \"a\"; }"
+    ast = ASTGenerator(source).generate()
+    assert ast.line is None and ast.column is None
+    ast.line, ast.column = 1, 0
+    copy = pickle.loads(pickle.dumps(ast))
+    assert str(copy) == str(ast)
+    assert (copy.line, copy.column) == (1, 0)
+
+
+def test_types_are_canonical():
+    assert IntType() is IntType() and VoidType() is VoidType()
+    assert StructType("P") is StructType("P") is not StructType("Q")
+    assert pickle.loads(pickle.dumps(StructType("P"))) is StructType("P")
+    assert pickle.loads(pickle.dumps(FloatType())) is FloatType()
+    ast = ASTGenerator("struct P { int x; };\nint f(P p, int y) { P q; return y; }").generate()
+    func = ast.decls[1]
+    assert func.return_type is func.params[1].param_type is ast.decls[0].members[0].member_type
+    assert func.params[0].param_type is func.body.statements[0].var_type is StructType("P")
+
+
+@pytest.mark.parametrize("parser_backend", ["antlr", "direct"])
+def test_leaf_table_shares_leaves(parser_backend):
+    source = 'void main() { x = x + 1; y = 1.0 + 1; f(x, "s", "s"); }'
+    leaves = nodes.LeafTable()
+    if parser_backend == "antlr":
+        builder = ASTGeneration(leaves)
+        ast = builder.visit(ASTGenerator(source).parser.program())
+    else:
+        lexer = create_lexer(CompactInputStream(source), "fast")
+        tokens = lexer.getAllTokens()
+        types = [t.type for t in tokens] + [Token.EOF]
+        texts = [t.text for t in tokens] + ["<EOF>"]
+        ast = DirectParser(types, texts, leaves).parse_program()
+    assert str(ast) == str(ASTGenerator(source).generate())
+    first, second, call = [s.expr for s in ast.decls[0].body.statements]
+    assert first.lhs is first.rhs.left and first.rhs.right is second.rhs.right
+    assert second.rhs.left is not first.rhs.right
+    assert call.args[1] is call.args[2]
+    assert len(leaves) == 6
+
+
+def test_canonical_types_are_immutable():
+    for node in (IntType(), StructType("P")):
+        with pytest.raises(AttributeError):
+            node.line = 5
+        with pytest.raises(AttributeError):
+            del node.column
+        assert node.line is None and node.column is None
+    with pytest.raises(AttributeError):
+        StructType("P").struct_name = "Q"
+    assert StructType("P").struct_name == "P"
+    assert copy.deepcopy(StructType("P")) is StructType("P")
+
+
+def test_canonical_types_not_kept_alive():
+    ref = weakref.ref(StructType("Gone"))
+    gc.collect()
+    assert ref() is None
+    assert (StructType, "Gone") not in nodes._canonical_types
+    assert StructType("Gone").struct_name == "Gone"
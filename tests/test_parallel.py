@@ -0,0 +1,77 @@
+"""
+Parallel declaration parsing test cases for TyC compiler
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from tests.utils import ASTGenerator
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer, seek_lexer
+from src.parser import parallel
+
+SOURCES = [
+    "struct P { int x; P next; };\nint g = 1;\n"
+    "int f(int n) {\n  for (int i = 0; i < n; ++i) { n = n - i; }\n  return n;\n}\n"
+    'void main() {\n  string s = "};{";\n  // } ;\n  /* { */ f(g);\n}\n',
+    "int a; int b = 2; float c; auto d = a; void main() { }",
+    "struct A { int x; }\nvoid main() { }",
+    "int a; void main() { int a = ; }",
+    "int a; int b",
+    "int a; }",
+    "void main() { { }",
+    'int a; string s = "abc\\q"; int b;',
+    'int a; string s = "a;b\nint b;',
+    "int a; /* int b; */ int c; /* never closed",
+    "",
+]
+
+
+def parse(source, executor, batch_chars):
+    try:
+        return str(parallel.parse_parallel(source, batch_chars=batch_chars, min_chars=0,
+                                           executor=executor))
+    except Exception as e:
+        return f"AST Generation Error: {str(e)}"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(2, initializer=parallel._init_worker) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("batch_chars", [1, 40, 1 << 20])
+def test_matches_sequential_parse(pool, batch_chars):
+    for source in SOURCES:
+        assert parse(source, pool, batch_chars) == str(ASTGenerator(source, "fast").generate())
+
+
+def test_split_points():
+    source = 'struct S { int x; };\nint f() { return 1; }\nstring s = "}";\n'
+    ends = parallel.split_declarations(source)
+    assert [source[:e].rsplit("\n", 1)[-1] for e in ends] == [
+        "struct S { int x; };",
+        "int f() { return 1; }",
+        'string s = "}";',
+    ]
+    assert parallel.split_declarations("void f() { }}") is None
+    assert parallel.split_declarations("void f() {") is None
+
+
+def test_batches_keep_positions():
+    source = SOURCES[0]
+    positions = []
+    for text, line, column in parallel.batch_declarations(
+        source, parallel.split_declarations(source), 1
+    ):
+        lexer = create_lexer(CompactInputStream(text), "fast")
+        seek_lexer(lexer, 0, line, column)
+        positions += [(t.line, t.column, t.text) for t in lexer.getAllTokens()]
+    lexer = create_lexer(CompactInputStream(source), "fast")
+    assert positions == [(t.line, t.column, t.text) for t in lexer.getAllTokens()]
+
+
+def test_small_sources_stay_in_process():
+    source = "int a; void main() { a = 1; }"
+    assert str(parallel.parse_parallel(source)) == str(ASTGenerator(source, "fast").generate())
@@ -0,0 +1,56 @@
+"""
+Parser pool test cases for TyC compiler
+Pooled parsers must give the results of a fresh parser per source.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, Parser
+from src.parser.pool import ParserPool, parse_many
+
+SOURCES = [
+    "void main() { int a = 1; a = a + 2 * 3; }",
+    "void main() { int a = ; }",
+    "struct P { int x; }; void main() { P p; p.x = p.x + 1; }",
+    'void main() { string s = "abc\\q"; }',
+    "void main() { if (a) if (b) x = 1; else x = 2; }",
+    "int f( { }",
+    "void main() { x = 1; } @",
+    "",
+    "int f(int n) { switch (n) { case 1: return 2; default: n--; } return n; }",
+]
+
+
+def as_parser_result(result):
+    return "success" if result is None else str(result)
+
+
+def as_ast_result(result):
+    return f"AST Generation Error: {result}" if isinstance(result, Exception) else str(result)
+
+
+@pytest.mark.parametrize("backend", ["antlr", "fast"])
+def test_matches_fresh_parsers(backend):
+    pool = ParserPool(backend)
+    # Twice through the same pool, so every source follows a failed parse
+    for _ in range(2):
+        checked = parse_many(SOURCES, ast=False, pool=pool)
+        asts = parse_many(SOURCES, pool=pool)
+        assert [as_parser_result(r) for r in checked] == [
+            Parser(s, backend).parse() for s in SOURCES
+        ]
+        assert [as_ast_result(r) for r in asts] == [
+            str(ASTGenerator(s, backend).generate()) for s in SOURCES
+        ]
+
+
+def test_workers_keep_order():
+    results = parse_many(SOURCES * 3, workers=2, chunk_size=2)
+    assert [as_ast_result(r) for r in results] == [
+        str(ASTGenerator(s).generate()) for s in SOURCES * 3
+    ]
+
+
+def test_parse_rule():
+    pool = ParserPool()
+    tree = pool.parse("a.b = 1", rule="expr")
+    assert tree.getText() == "a.b=1"
@@ -0,0 +1,66 @@
+"""
+Parser decision profiler test cases for TyC compiler
+"""
+
+import json
+from tests.utils import Parser
+from build.TyCParser import TyCParser
+from src.parser import profiler
+
+
+def stats(source, rule):
+    simulator, files = profiler.profile_sources([("input", source)])
+    return [d for d in simulator.decisions if d.rule == rule], files
+
+
+def test_counts_invocations_and_lookahead():
+    decisions, files = stats("void main() { a.b.c.d = 1; }", "lhs")
+    assert files == [{"file": "input", "tokens": 17, "error": None}]
+    assert sum(d.invocations for d in decisions) == 4
+    assert max(d.sll_max_lookahead for d in decisions) == 3
+    assert all(d.ll_fallbacks == 0 for d in decisions)
+
+
+def test_dangling_else_falls_back_to_ll():
+    source = "void main() { if (a) if (b) x = 1; else x = 2; }"
+    decisions, files = stats(source, "ifStmt")
+    assert files[0]["error"] is None
+    assert sum(d.ll_fallbacks for d in decisions) >= 1
+    assert sum(d.ambiguities + d.context_sensitivities for d in decisions) >= 1
+    assert max(d.ll_max_lookahead for d in decisions) >= 1
+
+
+def test_errors_match_parser():
+    sources = ["void main() { int a = ; }", 'void main() { string s = "a\\q"; }']
+    _, files = profiler.profile_sources([(s, s) for s in sources])
+    assert [f["error"] for f in files] == [Parser(s).parse() for s in sources]
+
+
+def test_does_not_touch_shared_dfa():
+    before = sum(len(dfa.states) for dfa in TyCParser.decisionsToDFA)
+    stats("int f(int x) { return x * 2; }", "returnStmt")
+    assert sum(len(dfa.states) for dfa in TyCParser.decisionsToDFA) == before
+
+
+def test_rule_totals_sum_decisions():
+    simulator, _ = profiler.profile_sources([("input", "void main() { a.b = c.d = 1; }")])
+    rules = {r.rule: r for r in profiler.rule_totals(simulator.decisions)}
+    lhs = [d for d in simulator.decisions if d.rule == "lhs"]
+    assert rules["lhs"].invocations == sum(d.invocations for d in lhs)
+    assert len(rules) == len({d.rule for d in simulator.decisions})
+
+
+def test_main_writes_table_and_json(tmp_path, capsys):
+    source = tmp_path / "a.tyc"
+    source.write_text("void main() { a.b = 1; switch (a) { case 1: break; } }")
+    report = tmp_path / "profile.json"
+    assert profiler.main([str(source), "--json", str(report), "--sort", "invocations"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[:3] == ["decision", "rule", "calls"]
+    calls = [int(line.split()[2]) for line in lines[2:-1]]
+    assert calls and calls == sorted(calls, reverse=True)
+
+    data = json.loads(report.read_text())
+    assert len(data["decisions"]) == len(TyCParser.atn.decisionToState)
+    assert {"switchStmt", "lhs"} <= {r["rule"] for r in data["rules"] if r["invocations"]}
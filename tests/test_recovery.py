@@ -0,0 +1,114 @@
+"""
+Syntax recovery test cases for TyC compiler
+"""
+
+from tests.utils import Parser
+from src.lexer.char_streams import CompactInputStream
+from src.parser import recovery
+
+
+def check(source, max_errors=recovery.MAX_ERRORS):
+    diagnostics, truncated = recovery.check_syntax(CompactInputStream(source), "antlr", max_errors)
+    return [str(d) for d in diagnostics], truncated
+
+
+def test_reports_every_statement_error():
+    source = (
+        "void main() {\n"
+        "    int a = ;\n"
+        "    a = a + 1;\n"
+        "    b = (2;\n"
+        "    if (a) { c = * 3; }\n"
+        "}\n"
+    )
+    assert check(source) == (
+        [
+            "Error on line 2 col 12: ;",
+            "Error on line 4 col 10: ;",
+            "Error on line 5 col 17: *",
+        ],
+        False,
+    )
+
+
+def test_resumes_at_declarations():
+    source = "int a = ;\nstruct S { int x = 1; };\nvoid f() { return 1 }\nint g() { return 2; }\n"
+    assert check(source) == (
+        [
+            "Error on line 1 col 8: ;",
+            "Error on line 2 col 17: =",
+            "Error on line 3 col 20: }",
+        ],
+        False,
+    )
+
+
+def test_boundary_tokens_not_repaired_away():
+    # Deleting the ';' would make z the right operand of '+'
+    assert check("void main() { y = 1 +; z = 3; }") == (["Error on line 1 col 21: ;"], False)
+    assert check("void main() { x = (1 + 2; y = 3; }") == (["Error on line 1 col 24: ;"], False)
+    assert check("void main() { if (a) { b = 1 - } c = 2; }") == (
+        ["Error on line 1 col 31: }"],
+        False,
+    )
+
+
+def test_first_error_matches_parser():
+    sources = [
+        "void main() { int a = ; }",
+        "int a; }",
+        "void main() { { }",
+        "struct A { int x; }\nvoid main() { }",
+        "void main() { a = 1 b = 2; c = ; }",
+        "void main() { for (int i = 0; i < ; ++i) { } x = ; }",
+    ]
+    for source in sources:
+        diagnostics, _ = check(source)
+        assert diagnostics[0] == Parser(source).parse()
+
+
+def test_valid_source_has_no_errors():
+    source = "struct P { int x; };\nint f(P p) { return p.x * 2; }\nvoid main() { P q; f(q); }"
+    assert Parser(source).parse() == "success"
+    assert check(source) == ([], False)
+
+
+def test_lexical_errors_reported_once():
+    source = 'void main() { int a = 1 @ 2; b = ; }\nint c = "x'
+    assert check(source) == (
+        [
+            "Error on line 1 col 24: Error Token @",
+            "Error on line 1 col 33: ;",
+            "Error on line 2 col 8: Unclosed String: x",
+        ],
+        False,
+    )
+
+
+def test_error_budget_truncates():
+    source = "void main() {\n" + "    x = ;\n" * 50 + "}\n"
+    diagnostics, truncated = check(source, max_errors=10)
+    assert len(diagnostics) == 10 and truncated
+    assert diagnostics[-1] == "Error on line 11 col 8: ;"
+    assert check(source) == ([f"Error on line {i} col 8: ;" for i in range(2, 52)], False)
+
+
+def test_garbage_is_bounded():
+    source = " ".join(["(", "}", "{", "=", ";", "int", "else", "+"] * 2000)
+    strategy = recovery.BoundaryErrorStrategy(100)
+    assert strategy.max_recoveries == recovery.RECOVERIES_PER_ERROR * 100
+    diagnostics, _ = check(source)
+    assert 0 < len(diagnostics) <= recovery.MAX_ERRORS
+
+
+def test_main_reports_files(tmp_path, capsys):
+    good = tmp_path / "good.tyc"
+    good.write_text("void main() { }")
+    bad = tmp_path / "bad.tyc"
+    bad.write_text("void main() { x = ; y = ; }")
+    assert recovery.main([str(good)]) == 0
+    assert recovery.main([str(good), str(bad), "--max-errors", "1"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        f"{bad}: Error on line 1 col 18: ;",
+        f"{bad}: too many errors, stopped after 1",
+    ]
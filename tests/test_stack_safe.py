@@ -0,0 +1,81 @@
+"""
+Nesting-safe parsing test cases for TyC compiler
+"""
+
+import sys
+
+import pytest
+from tests.utils import ASTGenerator
+from src.lexer.char_streams import CompactInputStream
+from src.parser.direct_parser import antlr_ast
+from src.parser.stack_safe import safe_ast
+from src.utils.nodes import BinaryOp, Program
+
+NESTED = {
+    "parens": lambda n: "void main() { x = " + "(" * n + "1" + ")" * n + "; }",
+    "calls": lambda n: "void main() { x = " + "f(" * n + "1" + ")" * n + "; }",
+    "blocks": lambda n: "void main() " + "{" * n + "x = 1;" + "}" * n,
+    "ifs": lambda n: "void main() {" + "if (a) " * n + "x = 1; }",
+    "else ifs": lambda n: "void main() {" + "if (a) x = 1; else " * n + "x = 1; }",
+    "prefix ops": lambda n: "void main() { x = " + "!" * n + "a; }",
+    "assignments": lambda n: "void main() { " + "a = " * n + "a; }",
+}
+
+
+def build(source, **kwargs):
+    try:
+        return str(safe_ast(CompactInputStream(source), "fast", **kwargs))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+@pytest.mark.parametrize("kind", NESTED)
+def test_deep_nesting_raises_depth_error(kind):
+    limit = sys.getrecursionlimit()
+    result = build(NESTED[kind](100_000))
+    assert result.startswith("NestingDepthError: Error on line 1 col ")
+    assert result.endswith(": nesting deeper than 2000 levels")
+    assert sys.getrecursionlimit() == limit
+
+
+@pytest.mark.parametrize("kind, depth", [("parens", 400), ("blocks", 600), ("prefix ops", 1500)])
+def test_nesting_within_limit_parses(kind, depth):
+    source = NESTED[kind](depth)
+    assert isinstance(safe_ast(CompactInputStream(source), "fast"), Program)
+    with pytest.raises(RecursionError):
+        antlr_ast(CompactInputStream(source), "fast")
+
+
+def test_errors_before_deep_nesting():
+    # Errors the parser reaches first are reported as by antlr_ast
+    sources = [
+        "void main() { x = 1 y = " + "(" * 5000 + "1; }",
+        "void main() { x = 1; } }" + "{" * 5000,
+        'void main() { string s = "\\q"; ' + "{" * 5000,
+    ]
+    for source in sources:
+        assert build(source).split(": ", 1)[1] == (
+            ASTGenerator(source, "fast").generate().split(": ", 1)[1]
+        )
+    assert build("void main() {" + "{" * 5000 + ' string s = "\\q"; }').startswith(
+        "NestingDepthError"
+    )
+
+
+def test_small_limit():
+    source = "void main() { x = ((1)); }"
+    assert build(source, max_depth=20) == str(ASTGenerator("void main() { x = 1; }").generate())
+    assert build(source, max_depth=10) == (
+        "NestingDepthError: Error on line 1 col 18: nesting deeper than 10 levels"
+    )
+
+
+def test_long_operator_chains_do_not_recurse():
+    # _binary folds left operands in a loop, at the default recursion limit
+    program = antlr_ast(CompactInputStream("void main() { x = a" + " + a" * 5000 + "; }"), "fast")
+    expr = program.decls[0].body.statements[0].expr.rhs
+    depth = 0
+    while isinstance(expr, BinaryOp):
+        expr = expr.left
+        depth += 1
+    assert depth == 5000
@@ -0,0 +1,94 @@
+"""
+Streaming tokenizer test cases for TyC compiler
+"""
+
+import io
+
+import pytest
+from tests.utils import Tokenizer
+from build.TyCLexer import TyCLexer
+from src.lexer.streaming import main, stream_tokens, write_tokens
+
+SOURCES = [
+    "int main() { return 0; }",
+    'string s = "a\\tb"; /* multi\nline\ncomment */ float f = 1.5e-3;',
+    "// only a comment",
+    "",
+    'x = "unclosed\nint y;',
+    'x = "bad \\q escape";',
+    "a = b @ c;",
+    'a = "abc\\\n";',
+    "int a; /* never closed",
+    "1.e5 .5 12e 3.",
+]
+
+
+def streamed(source, chunk_size, backend="fast"):
+    out = io.StringIO()
+    write_tokens(io.StringIO(source, newline=""), out, backend, chunk_size)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+def test_matches_tokenizer(chunk_size):
+    for source in SOURCES:
+        assert streamed(source, chunk_size) == Tokenizer(source).get_tokens_as_string()
+
+
+def test_antlr_backend():
+    for source in SOURCES:
+        assert streamed(source, 4, "antlr") == Tokenizer(source, "antlr").get_tokens_as_string()
+
+
+def test_absolute_positions():
+    source = "int a;\n/* c */ float b;\n"
+    tokens = list(stream_tokens(io.StringIO(source), chunk_size=3))
+    assert [(t.text, t.start, t.stop, t.line, t.column) for t in tokens] == [
+        ("int", 0, 2, 1, 0),
+        ("a", 4, 4, 1, 4),
+        (";", 5, 5, 1, 5),
+        ("float", 15, 19, 2, 8),
+        ("b", 21, 21, 2, 14),
+        (";", 22, 22, 2, 15),
+        ("<EOF>", 24, 23, 3, 0),
+    ]
+
+
+def test_error_raised_after_preceding_tokens():
+    tokens = []
+    with pytest.raises(Exception) as e:
+        for t in stream_tokens(io.StringIO("a b ?"), chunk_size=2):
+            tokens.append(t.text)
+    assert tokens == ["a", "b"]
+    assert str(e.value) == "Error Token ?"
+
+
+def test_recovering_diagnostics():
+    diagnostics = []
+    source = 'a ? "x\\q" $\n"open'
+    tokens = list(stream_tokens(io.StringIO(source), diagnostics=diagnostics, chunk_size=2))
+    assert tokens[-1].type == -1
+    assert TyCLexer.UNCLOSE_STRING in [t.type for t in tokens]
+    assert [str(d) for d in diagnostics] == [
+        "Error on line 1 col 2: Error Token ?",
+        "Error on line 1 col 4: Illegal Escape In String: x\\q",
+        "Error on line 1 col 8: Unclosed String:  $\n",
+        "Error on line 2 col 0: Unclosed String: open",
+    ]
+
+
+def test_long_comment_spanning_many_chunks():
+    source = "int a;/*" + "x" * 10000 + "*/int b;"
+    assert streamed(source, 16) == "int,a,;,int,b,;,<EOF>"
+
+
+def test_cli_writes_output_file(tmp_path):
+    source = tmp_path / "prog.tyc"
+    source.write_text("int a = 1;\n")
+    output = tmp_path / "tokens.txt"
+    assert main([str(source), "--output", str(output)]) == 0
+    assert output.read_text() == "int,a,=,1,;,<EOF>"
+
+    source.write_text("int a = @;\n")
+    assert main([str(source), "--output", str(output)]) == 1
+    assert output.read_text() == "int,a,=,Error Token @"
@@ -0,0 +1,108 @@
+"""
+Columnar token buffer test cases for TyC compiler
+"""
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from tests.utils import Parser
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import FastLexer
+from src.lexer.token_buffer import ColumnarTokenStream, TokenBuffer
+from src.utils.error_listener import NewErrorListener
+
+
+def parse_columnar(source, lexer_class=TyCLexer):
+    buffer = TokenBuffer.from_lexer(lexer_class(CompactInputStream(source)))
+    parser = TyCParser(ColumnarTokenStream(buffer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        parser.program()
+        return "success"
+    except Exception as e:
+        return str(e)
+
+
+def test_buffer_matches_common_tokens():
+    source = 'int x = 5;\nstring s = "hi\\n"; // c\nfloat f = .5;'
+    stream = CommonTokenStream(TyCLexer(InputStream(source)))
+    stream.fill()
+    expected = [
+        (t.type, t.text, t.start, t.stop, t.line, t.column) for t in stream.tokens
+    ]
+    buffer = TokenBuffer.from_lexer(TyCLexer(InputStream(source)))
+    actual = [
+        (buffer.types[i], buffer.text(i), buffer.starts[i], buffer.stops[i],
+         buffer.lines[i], buffer.columns[i])
+        for i in range(len(buffer))
+    ]
+    assert actual == expected
+
+
+def test_buffer_ends_with_eof():
+    buffer = TokenBuffer.from_lexer(FastLexer(InputStream("a b")))
+    assert len(buffer) == 3
+    assert buffer.types[-1] == -1
+    assert buffer.text(2) == "<EOF>"
+
+
+def test_buffer_stores_only_string_text():
+    buffer = TokenBuffer.from_lexer(FastLexer(InputStream('x = "abc";')))
+    assert buffer.texts == {2: "abc"}
+    assert buffer.text(0) == "x"
+
+
+def test_buffer_token_materialization():
+    buffer = TokenBuffer.from_lexer(TyCLexer(InputStream("int\n  y;")))
+    t = buffer.token(1)
+    assert (t.type, t.text, t.line, t.column, t.tokenIndex) == (TyCLexer.ID, "y", 2, 2, 1)
+
+
+def test_buffer_propagates_lexer_errors():
+    with pytest.raises(Exception) as e:
+        TokenBuffer.from_lexer(FastLexer(InputStream('x = "abc')))
+    assert str(e.value) == "Unclosed String: abc"
+
+
+def test_buffer_append():
+    buffer = TokenBuffer(InputStream("ab"))
+    buffer.append(TyCLexer.ID, 0, 1, 1, 0)
+    assert buffer.text(0) == "ab"
+    assert buffer.nbytes() > 0
+
+
+def test_columnar_stream_lookahead():
+    buffer = TokenBuffer.from_lexer(FastLexer(InputStream("a = b;")))
+    stream = ColumnarTokenStream(buffer)
+    assert stream.LA(1) == TyCLexer.ID
+    assert stream.LA(2) == TyCLexer.ASSIGN
+    assert stream.LT(-1) is None
+    stream.consume()
+    assert stream.LT(-1).text == "a"
+    assert stream.LA(10) == -1
+    assert stream.getText() == "a=b;"
+
+
+def test_columnar_stream_cannot_consume_eof():
+    stream = ColumnarTokenStream(TokenBuffer.from_lexer(FastLexer(InputStream(""))))
+    with pytest.raises(Exception):
+        stream.consume()
+
+
+def test_columnar_parse_success():
+    source = "struct P { int x; }; int f(P p) { return p.x; } void main() { f(p); }"
+    assert parse_columnar(source) == "success"
+    assert parse_columnar(source, FastLexer) == "success"
+
+
+def test_columnar_parse_errors_match():
+    sources = [
+        "void main() {\n    int x = ;\n}",
+        "void main() { x = ; }",
+        "int f( { }",
+        "void main() { a.b.c = 1 }",
+    ]
+    for source in sources:
+        assert parse_columnar(source) == Parser(source).parse()
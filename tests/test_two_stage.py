@@ -0,0 +1,66 @@
+"""
+Two-stage SLL-then-LL parsing test cases for TyC compiler
+Results and error messages must be those of a plain LL parse.
+"""
+
+import pytest
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from tests.utils import Parser
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.parser.two_stage import parse_two_stage
+from src.utils.error_listener import NewErrorListener
+
+
+def make_parser(source, backend="antlr"):
+    lexer = create_lexer(CompactInputStream(source), backend)
+    parser = TyCParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    return parser
+
+
+def parse(source, two_stage, backend="antlr"):
+    parser = make_parser(source, backend)
+    try:
+        tree = parse_two_stage(parser) if two_stage else parser.program()
+        return tree.toStringTree(recog=parser)
+    except Exception as e:
+        return str(e)
+
+
+SOURCES = [
+    "void main() { int a = 1; a = a + 2 * 3; }",
+    "struct P { int x; }; void main() { P p; p.x = p.x + 1; }",
+    "void main() { a.b.c = d.e = 3; f(g)(1); }",
+    "void main() { int a = ; }",
+    "void main() { a = 1 }",
+    "int f( { }",
+    "void main() { x = 1; } @",
+    "void main() { x = ; } @",
+    'void main() { string s = "abc\\q"; }',
+    "",
+]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("backend", ["antlr", "fast"])
+def test_matches_ll_parse(source, backend):
+    assert parse(source, True, backend) == parse(source, False, backend)
+
+
+def test_parser_restored_after_fallback():
+    parser = make_parser("void main() { a = 1 }")
+    with pytest.raises(Exception) as e:
+        parse_two_stage(parser)
+    assert str(e.value) == "Error on line 1 col 20: }"
+    assert parser._interp.predictionMode == PredictionMode.LL
+    assert parser.getErrorListenerDispatch().delegates == [NewErrorListener.INSTANCE]
+
+
+def test_syntax_error_before_lexer_error():
+    # SLL bails at the lexer error; the LL pass reports the earlier syntax error
+    assert Parser("void main() { x = ; } @").parse() == "Error on line 1 col 18: ;"
+    assert Parser("void main() { } @").parse() == "Error Token @"
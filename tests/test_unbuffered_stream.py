@@ -0,0 +1,124 @@
+"""
+Unbuffered token stream and streaming parse test cases for TyC compiler
+"""
+
+import io
+
+import pytest
+from antlr4 import CommonTokenStream
+from antlr4.Token import Token
+from antlr4.error.Errors import IllegalStateException
+from tests.utils import Parser
+from build.TyCParser import TyCParser
+from src.lexer.char_streams import CompactInputStream
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.unbuffered_stream import UnbufferedTokenStream
+from src.parser.streaming import parse_stream, streaming_parser
+from src.utils.error_listener import NewErrorListener
+
+SOURCES = [
+    "void main() { int a = 1; a = a + 2 * 3; }",
+    "struct P { int x; }; void main() { P p; p.x = p.x + 1; }",
+    "void main() { a.b.c = d.e = 3; f(g)(1); }",
+    "void main() { if (a) if (b) x = 1; else x = 2; }",
+    'int f(int n) { switch (n) { case 1: return 2; default: printString("s"); } }',
+    "void main() { int a = ; }",
+    "void main() { a = 1 }",
+    "int f( { }",
+    "void main() { x = 1; } @",
+    'void main() { string s = "abc\\q"; }',
+    "",
+]
+
+
+def stream(source):
+    return UnbufferedTokenStream(create_lexer(CompactInputStream(source), "fast"))
+
+
+def ll_tree(source):
+    parser = TyCParser(CommonTokenStream(create_lexer(CompactInputStream(source), "fast")))
+    parser.removeErrorListeners()
+    parser.addErrorListener(NewErrorListener.INSTANCE)
+    try:
+        return parser.program().toStringTree(recog=parser)
+    except Exception as e:
+        return str(e)
+
+
+def streamed_tree(source, chunk_size):
+    parser = streaming_parser(io.StringIO(source), chunk_size=chunk_size)
+    try:
+        return parser.program().toStringTree(recog=parser)
+    except Exception as e:
+        return str(e)
+
+
+def test_lookahead_and_consume():
+    s = stream("int a = 1;")
+    assert [s.LA(i) for i in (1, 2, 3)] == [TyCParser.INT, TyCParser.ID, TyCParser.ASSIGN]
+    assert s.LT(-1) is None
+    s.consume()
+    assert s.index == 1 and s.LT(-1).text == "int" and s.LT(1).text == "a"
+    assert s.LT(1).tokenIndex == 1
+    while s.LA(1) != Token.EOF:
+        s.consume()
+    assert s.LT(5).type == Token.EOF
+    with pytest.raises(IllegalStateException):
+        s.consume()
+
+
+def test_consumed_tokens_are_released():
+    s = stream("a b c d e f")
+    for _ in range(4):
+        s.consume()
+    assert len(s.tokens) == 1
+    with pytest.raises(IndexError):
+        s.seek(1)
+
+
+def test_marker_keeps_window():
+    s = stream("a b c d e f")
+    s.consume()
+    marker = s.mark()
+    start = s.index
+    s.consume()
+    s.consume()
+    assert s.getText(start, s.index) == "bcd"
+    s.seek(start)
+    assert s.LT(1).text == "b" and s.LT(-1).text == "a"
+    s.release(marker)
+    s.seek(3)
+    assert s.LT(1).text == "d"
+    s.consume()
+    assert s.tokens[0].text == "e"
+
+
+def test_invalid_release():
+    s = stream("a b")
+    s.mark()
+    with pytest.raises(IllegalStateException):
+        s.release(-2)
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1 << 20])
+def test_parse_matches_ll_parse(chunk_size):
+    for source in SOURCES:
+        assert streamed_tree(source, chunk_size) == ll_tree(source)
+
+
+def test_syntax_check_and_errors():
+    for source in SOURCES:
+        try:
+            result = parse_stream(io.StringIO(source), build_trees=False)
+        except Exception as e:
+            result = str(e)
+        assert (result is None and Parser(source).parse() == "success") or (
+            result == Parser(source).parse()
+        )
+
+
+def test_window_stays_small():
+    source = "void main() {\n" + "    a.b.c = f(x, y) * 2;\n" * 2000 + "}\n"
+    parser = streaming_parser(io.StringIO(source), chunk_size=256, build_trees=False)
+    parser.program()
+    assert parser.getTokenStream().peak < 16
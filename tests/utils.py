@@ -15,15 +15,30 @@ from build.TyCLexer import TyCLexer
 from build.TyCParser import TyCParser
 from antlr4 import InputStream, CommonTokenStream
 from src.utils.error_listener import NewErrorListener
+from src.lexer.fast_lexer import create_lexer
+from src.lexer.char_streams import CompactInputStream
+from src.parser.dfa_cache import load_dfa_cache
+from src.parser.two_stage import parse_two_stage
+
+# Lexer backend used by the wrappers below ("antlr", "bulk" or "fast")
+LEXER_BACKEND = os.environ.get("TYC_LEXER_BACKEND", "antlr")
+
+# Parser backend used by ASTGenerator and Parser ("antlr" or "direct")
+PARSER_BACKEND = os.environ.get("TYC_PARSER_BACKEND", "antlr")
+
+# Start from warmed DFA tables if a cache has been built (no-op otherwise)
+load_dfa_cache()
 
 
 class ASTGenerator:
     """Class to generate AST from TyC source code."""
 
-    def __init__(self, input_string: str):
+    def __init__(self, input_string: str, backend: str = None, parser_backend: str = None):
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = TyCLexer(self.input_stream)
+        self.backend = backend or LEXER_BACKEND
+        self.parser_backend = parser_backend or PARSER_BACKEND
+        self.input_stream = CompactInputStream(input_string)
+        self.lexer = create_lexer(self.input_stream, self.backend)
         self.token_stream = CommonTokenStream(self.lexer)
         self.parser = TyCParser(self.token_stream)
         self.parser.removeErrorListeners()
@@ -40,9 +55,18 @@ class ASTGenerator:
         """Generate AST from the input string."""
         if self.ast_generator is None:
             return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+        if self.parser_backend != "antlr":
+            from src.parser.direct_parser import parse_ast
+
+            try:
+                return parse_ast(
+                    CompactInputStream(self.input_string), self.parser_backend, self.backend
+                )
+            except Exception as e:
+                return f"AST Generation Error: {str(e)}"
         try:
-            # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            # Parse the program starting from the entry point (SLL, then LL on failure)
+            parse_tree = parse_two_stage(self.parser)
 
             # Generate AST using the visitor
             ast = self.ast_generator.visit(parse_tree)
@@ -54,13 +78,14 @@ class ASTGenerator:
 class Tokenizer:
     """Lexer wrapper for testing"""
 
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, backend: str = None):
         self.source_code = source_code
+        self.backend = backend or LEXER_BACKEND
 
     def get_tokens_as_string(self) -> str:
         """Get tokens as comma-separated string (only token text)"""
-        input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        input_stream = CompactInputStream(self.source_code)
+        lexer = create_lexer(input_stream, self.backend)
 
         tokens = []
         try:
@@ -84,20 +109,31 @@ class Tokenizer:
 class Parser:
     """Parser wrapper for testing"""
 
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, backend: str = None, parser_backend: str = None):
         self.source_code = source_code
+        self.backend = backend or LEXER_BACKEND
+        self.parser_backend = parser_backend or PARSER_BACKEND
 
     def parse(self) -> str:
         """Parse source code and return result"""
-        input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        input_stream = CompactInputStream(self.source_code)
+        if self.parser_backend != "antlr":
+            from src.parser.direct_parser import parse_ast
+
+            try:
+                parse_ast(input_stream, self.parser_backend, self.backend)
+                return "success"
+            except Exception as e:
+                return str(e)
+
+        lexer = create_lexer(input_stream, self.backend)
         token_stream = CommonTokenStream(lexer)
         parser = TyCParser(token_stream)
         parser.removeErrorListeners()
         parser.addErrorListener(NewErrorListener.INSTANCE)
 
         try:
-            tree = parser.program()
+            tree = parse_two_stage(parser)
             return "success"
         except Exception as e:
             return str(e)